@@ -0,0 +1,60 @@
+"""Compares the Bentley-Ottmann sweep with brute-force segment intersection.
+
+Run from the repository root with `python -m benchmarks.intersections [count ...]`.
+"""
+
+import random
+import sys
+import time
+
+from geometry.basics import Point
+from geometry.segment import Segment
+from geometry.sweep import find_intersections
+
+
+def random_segments(count: int, seed: int = 0) -> list[Segment]:
+    """Builds short random segments in a square whose size grows with the count.
+
+    Args:
+        count (int): How many segments to build.
+        seed (int): The seed of the random generator. Defaults to 0.
+
+    Returns:
+        list[Segment]: The segments, each around 1 unit long.
+    """
+    generator = random.Random(seed)
+    size = count ** 0.5
+    segments = []
+    for _ in range(count):
+        x, y = generator.uniform(0, size), generator.uniform(0, size)
+        segments.append(Segment(Point('A', x, y),
+                                Point('B', x + generator.uniform(-1, 1), y + generator.uniform(-1, 1))))
+    return segments
+
+
+def timed(method: str, segments: list[Segment]) -> tuple[float, int]:
+    """Runs one intersection method and times it.
+
+    Args:
+        method (str): Either 'sweep' or 'brute'.
+        segments (list[Segment]): The segments to intersect.
+
+    Returns:
+        tuple[float, int]: The elapsed time in seconds and the number of intersecting pairs.
+    """
+    start = time.perf_counter()
+    found = find_intersections(segments, method)
+    return time.perf_counter() - start, len(found)
+
+
+if __name__ == '__main__':
+    counts = [int(arg) for arg in sys.argv[1:]] or [500, 1000, 2000, 4000]
+
+    print("--- Segment intersections ---")
+    for count in counts:
+        segments = random_segments(count)
+        sweep_time, sweep_found = timed('sweep', segments)
+        brute_time, brute_found = timed('brute', segments)
+        status = "ok" if sweep_found == brute_found else "MISMATCH"
+        print(f"{count:>7} segments, {sweep_found:>6} pairs: sweep {sweep_time:7.3f}s, "
+              f"brute {brute_time:7.3f}s ({status})")
@@ -0,0 +1,61 @@
+"""Compares the memory use and attribute access speed of the Point representations.
+
+Run from the repository root with `python -m benchmarks.point_memory [count]`.
+"""
+
+import sys
+import timeit
+import tracemalloc
+
+from geometry.basics import Point, CompactPoint, FrozenPoint
+from geometry.square import Square
+
+
+def measure_memory(point_type: type, count: int) -> float:
+    """Measures the average number of bytes allocated per point.
+
+    Args:
+        point_type (type): The point class to instantiate.
+        count (int): How many points to create.
+
+    Returns:
+        float: The allocated bytes divided by the number of points.
+    """
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    points = [point_type('A', float(i), float(i)) for i in range(count)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del points
+    # The list holding the points is included, it costs the same for every class
+    return (after - before) / count
+
+
+def measure_access(point_type: type, repeat: int = 5, number: int = 1_000_000) -> float:
+    """Measures the best time of reading `x` and `y` from a point.
+
+    Args:
+        point_type (type): The point class to instantiate.
+        repeat (int): How many timing runs to take the best of.
+        number (int): How many reads to do per run.
+
+    Returns:
+        float: The time of one `P.x + P.y` expression, in nanoseconds.
+    """
+    P = point_type('A', 1.0, 2.0)
+    best = min(timeit.repeat("P.x + P.y", globals={'P': P}, repeat=repeat, number=number))
+    return best / number * 1e9
+
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    print(f"--- Point representations, {count} points ---")
+    for point_type in (Point, CompactPoint, FrozenPoint):
+        memory = measure_memory(point_type, count)
+        access = measure_access(point_type)
+        print(f"{point_type.__name__:>12}: {memory:7.1f} bytes/point, {access:6.1f} ns per x+y read")
+
+    # The compact points are drop-in replacements for the shapes
+    corners = [FrozenPoint('A', 0, 0), FrozenPoint('B', 0, 4), FrozenPoint('C', 4, 4), FrozenPoint('D', 4, 0)]
+    print(f"\n{Square(*corners)}")
@@ -0,0 +1,314 @@
+"""Benchmarks the hot paths of the geometry package on synthetic datasets.
+
+Every benchmark reports its throughput (elements per second, best of several passes),
+call latency percentiles and the peak memory allocated during one pass. Results can be
+saved as JSON and compared against a saved baseline, flagging regressions.
+
+Run from the repository root with `python -m benchmarks.suite [size ...]`, for example:
+
+    python -m benchmarks.suite 1000 100000 --output baseline.json
+    python -m benchmarks.suite 1000 100000 --baseline baseline.json
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from math import cos, pi, sin
+from typing import Callable, NamedTuple
+
+from geometry.arrays import PointArray
+from geometry.basics import Point, GetDistance, Areas
+from geometry.circle import Circle
+from geometry.line import Line
+from geometry.square import Square
+from geometry.triangle import Triangle
+from geometry.triangle_batch import TriangleBatch
+
+# The number of elements handed to one call of a batch operation
+BATCH = 1024
+
+
+class Benchmark(NamedTuple):
+    """One benchmarked operation.
+
+    Attributes:
+        name (str): The name of the operation, e.g. "circle.contains".
+        setup (Callable): Builds the dataset from a size and a random generator, and
+            returns the items and the function to call on each item.
+        batch (bool): True if each item holds BATCH elements instead of one.
+    """
+    name: str
+    setup: Callable[[int, random.Random], tuple[list, Callable]]
+    batch: bool = False
+
+
+def random_points(size: int, generator: random.Random) -> list[Point]:
+    """Builds points spread uniformly over a 100 x 100 square.
+
+    Args:
+        size (int): How many points to build.
+        generator (random.Random): The random generator.
+
+    Returns:
+        list[Point]: The points.
+    """
+    return [Point('P', generator.uniform(0, 100), generator.uniform(0, 100)) for _ in range(size)]
+
+
+def random_corners(size: int, generator: random.Random, count: int) -> list[tuple[Point, ...]]:
+    """Builds the corners of randomly placed and rotated regular polygons.
+
+    Args:
+        size (int): How many polygons to build.
+        generator (random.Random): The random generator.
+        count (int): The number of corners, 3 for triangles and 4 for squares.
+
+    Returns:
+        list[tuple[Point, ...]]: The corners of every polygon, in order.
+    """
+    polygons = []
+    for _ in range(size):
+        x, y = generator.uniform(0, 100), generator.uniform(0, 100)
+        radius, angle = generator.uniform(0.5, 5), generator.uniform(0, 2 * pi)
+        polygons.append(tuple(Point('ABCD'[k], x + radius * cos(angle + 2 * pi * k / count),
+                                    y + radius * sin(angle + 2 * pi * k / count)) for k in range(count)))
+    return polygons
+
+
+def chunked(items: list, size: int = BATCH) -> list[list]:
+    """Splits a list into consecutive chunks.
+
+    Args:
+        items (list): The items to split.
+        size (int): The length of every chunk but the last. Defaults to BATCH.
+
+    Returns:
+        list[list]: The chunks.
+    """
+    return [items[start:start + size] for start in range(0, len(items), size)]
+
+
+def _triangle_lengths(size: int, generator: random.Random) -> list[list[float]]:
+    """Builds the side lengths of random triangles."""
+    return [Triangle(*corners).lengths for corners in random_corners(size, generator, 3)]
+
+
+def _triangle_properties(corners: tuple[Point, ...]) -> tuple:
+    """Builds a triangle and reads all its derived values."""
+    triangle = Triangle(*corners)
+    return triangle.points, triangle.lengths, triangle.perimeter, triangle.area
+
+
+def _read_triangles(size: int, generator: random.Random) -> list[Triangle]:
+    """Builds random triangles whose area was read once already."""
+    triangles = [Triangle(*corners) for corners in random_corners(size, generator, 3)]
+    for triangle in triangles:
+        triangle.area
+    return triangles
+
+
+BENCHMARKS = [
+    Benchmark('distance.between_points', lambda size, generator: (
+        list(zip(random_points(size, generator), random_points(size, generator))),
+        lambda pair: GetDistance.between_points(*pair))),
+    Benchmark('areas.heron', lambda size, generator: (
+        _triangle_lengths(size, generator), Areas.Triangle.Heron)),
+    Benchmark('areas.stable_heron', lambda size, generator: (
+        _triangle_lengths(size, generator), Areas.Triangle.StableHeron)),
+    Benchmark('circle.contains', lambda size, generator: (
+        random_points(size, generator), Circle(Point('O', 50, 50), 30).contains)),
+    Benchmark('circle.contains_many', lambda size, generator: (
+        [PointArray.from_points(chunk) for chunk in chunked(random_points(size, generator))],
+        Circle(Point('O', 50, 50), 30).contains_many), batch=True),
+    Benchmark('line.distance_to_point', lambda size, generator: (
+        random_points(size, generator), Line(3, -4, 12).distance_to_point)),
+    Benchmark('line.distances', lambda size, generator: (
+        [PointArray.from_points(chunk) for chunk in chunked(random_points(size, generator))],
+        Line(3, -4, 12).distances), batch=True),
+    Benchmark('square.construct', lambda size, generator: (
+        random_corners(size, generator, 4), lambda corners: Square(*corners))),
+    Benchmark('triangle.construct', lambda size, generator: (
+        random_corners(size, generator, 3), lambda corners: Triangle(*corners))),
+    Benchmark('triangle.area', lambda size, generator: (
+        random_corners(size, generator, 3), lambda corners: Triangle(*corners).area)),
+    Benchmark('triangle.properties', lambda size, generator: (
+        random_corners(size, generator, 3), _triangle_properties)),
+    Benchmark('triangle.cached_area', lambda size, generator: (
+        _read_triangles(size, generator), lambda triangle: triangle.area)),
+    Benchmark('triangle_batch.areas', lambda size, generator: (
+        [TriangleBatch.from_triangles(Triangle(*corners) for corners in chunk)
+         for chunk in chunked(random_corners(size, generator, 3))],
+        TriangleBatch.areas), batch=True),
+]
+
+
+def percentile(ordered: list[int], fraction: float) -> int:
+    """Picks a percentile of sorted values with the nearest-rank method.
+
+    Args:
+        ordered (list[int]): The sorted values.
+        fraction (float): The percentile, between 0 and 1.
+
+    Returns:
+        int: The value below which the given fraction of values lie.
+    """
+    rank = max(int(fraction * len(ordered) + 0.5), 1)
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def run_benchmark(benchmark: Benchmark, size: int, repeat: int = 3, samples: int = 10_000,
+                  seed: int = 0) -> dict:
+    """Measures one operation on a dataset of a given size.
+
+    Args:
+        benchmark (Benchmark): The operation.
+        size (int): The number of elements in the dataset.
+        repeat (int): The number of timed passes, the fastest one counts. Defaults to 3.
+        samples (int): The largest number of calls timed one by one for the latency
+            percentiles. Defaults to 10000.
+        seed (int): The seed of the dataset generator. Defaults to 0.
+
+    Returns:
+        dict: The name, size, throughput (elements per second), latency percentiles of
+            one call in nanoseconds and the peak memory of one pass in bytes.
+    """
+    items, function = benchmark.setup(size, random.Random(seed))
+
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for item in items:
+            function(item)
+        best = min(best, time.perf_counter() - start)
+
+    latencies = []
+    clock = time.perf_counter_ns
+    for item in items[:samples]:
+        start = clock()
+        function(item)
+        latencies.append(clock() - start)
+    latencies.sort()
+
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    for item in items:
+        function(item)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'name': benchmark.name,
+        'size': size,
+        'elements_per_call': BATCH if benchmark.batch else 1,
+        'throughput': size / best if best > 0 else float('inf'),
+        'p50_ns': percentile(latencies, 0.50),
+        'p90_ns': percentile(latencies, 0.90),
+        'p99_ns': percentile(latencies, 0.99),
+        'peak_bytes': peak - before,
+    }
+
+
+def compare(results: list[dict], baseline: list[dict], threshold: float = 0.1) -> list[dict]:
+    """Compares results with a baseline and finds the regressions.
+
+    An operation regresses if its throughput dropped, or its median latency or peak
+    memory grew, by more than the threshold. Peaks below 1 KiB aren't compared.
+
+    Args:
+        results (list[dict]): The current results.
+        baseline (list[dict]): The saved results to compare with.
+        threshold (float): The tolerated relative change. Defaults to 0.1 (10%).
+
+    Returns:
+        list[dict]: For every operation and size in both, the relative changes and a
+            'regressions' list naming the metrics that got worse.
+    """
+    saved = {(result['name'], result['size']): result for result in baseline}
+    comparisons = []
+    for result in results:
+        old = saved.get((result['name'], result['size']))
+        if old is None:
+            continue
+        changes = {
+            'throughput': result['throughput'] / old['throughput'] - 1 if old['throughput'] else 0.0,
+            'p50_ns': result['p50_ns'] / old['p50_ns'] - 1 if old['p50_ns'] else 0.0,
+            # Peaks of a few hundred bytes are noise from the interpreter, not the operation
+            'peak_bytes': result['peak_bytes'] / old['peak_bytes'] - 1 if old['peak_bytes'] >= 1024 else 0.0,
+        }
+        regressions = [metric for metric, change in changes.items()
+                       if (change < -threshold if metric == 'throughput' else change > threshold)]
+        comparisons.append({'name': result['name'], 'size': result['size'], 'changes': changes,
+                            'regressions': regressions})
+    return comparisons
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Runs the suite from the command line.
+
+    Args:
+        argv (list[str] | None): The arguments. Defaults to sys.argv[1:].
+
+    Returns:
+        int: 1 if a regression against the baseline was found, 0 otherwise.
+    """
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.suite', description=__doc__.splitlines()[0])
+    parser.add_argument('sizes', nargs='*', type=int, default=[1_000, 10_000, 100_000],
+                        help="dataset sizes, from 10^3 to 10^7 (default: 1000 10000 100000)")
+    parser.add_argument('-k', '--only', action='append', default=[],
+                        help="only run benchmarks whose name contains this text, repeatable")
+    parser.add_argument('--repeat', type=int, default=3, help="timed passes per benchmark (default: 3)")
+    parser.add_argument('--samples', type=int, default=10_000, help="calls timed for latencies (default: 10000)")
+    parser.add_argument('--seed', type=int, default=0, help="dataset seed (default: 0)")
+    parser.add_argument('-o', '--output', help="write the results to this JSON file")
+    parser.add_argument('-b', '--baseline', help="compare with the results saved in this JSON file")
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help="relative change counted as a regression (default: 0.1)")
+    args = parser.parse_args(argv)
+
+    selected = [benchmark for benchmark in BENCHMARKS
+                if not args.only or any(text in benchmark.name for text in args.only)]
+    results = []
+    print(f"{'operation':<26}{'size':>10}{'elements/s':>14}{'p50 ns':>10}{'p90 ns':>10}{'p99 ns':>10}{'peak KiB':>11}")
+    for size in args.sizes:
+        for benchmark in selected:
+            result = run_benchmark(benchmark, size, args.repeat, args.samples, args.seed)
+            results.append(result)
+            print(f"{result['name']:<26}{size:>10}{result['throughput']:>14.0f}{result['p50_ns']:>10}"
+                  f"{result['p90_ns']:>10}{result['p99_ns']:>10}{result['peak_bytes'] / 1024:>11.1f}")
+
+    if args.output:
+        report = {
+            'meta': {
+                'python': platform.python_version(),
+                'implementation': platform.python_implementation(),
+                'machine': platform.machine(),
+                'date': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+                'seed': args.seed,
+                'repeat': args.repeat,
+            },
+            'results': results,
+        }
+        with open(args.output, 'w') as stream:
+            json.dump(report, stream, indent=2)
+
+    if not args.baseline:
+        return 0
+    with open(args.baseline) as stream:
+        baseline = json.load(stream)['results']
+    comparisons = compare(results, baseline, args.threshold)
+    print(f"\n--- Compared with {args.baseline}, threshold {args.threshold:.0%} ---")
+    for comparison in comparisons:
+        changes = comparison['changes']
+        flag = 'REGRESSION ' + ', '.join(comparison['regressions']) if comparison['regressions'] else 'ok'
+        print(f"{comparison['name']:<26}{comparison['size']:>10}  throughput {changes['throughput']:+7.1%}"
+              f"  p50 {changes['p50_ns']:+7.1%}  peak {changes['peak_bytes']:+7.1%}  {flag}")
+    return 1 if any(comparison['regressions'] for comparison in comparisons) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,213 @@
+# geometry/arrays.py
+from __future__ import annotations
+from array import array
+from math import hypot
+from typing import Iterable, Iterator
+
+from .basics import Point
+
+
+class PointArray:
+    """Stores many points as contiguous coordinate columns.
+
+    Coordinates live in two `array('d')` columns instead of one `Point` object per
+    coordinate pair, so batch operations can run over plain floats.
+
+    Attributes:
+        x (array): The x-coordinates of the points.
+        y (array): The y-coordinates of the points.
+        labels (list | None): The optional letter designation of every point.
+    """
+
+    def __init__(self, x_coordinates: Iterable[float], y_coordinates: Iterable[float],
+                 labels: Iterable[chr] | None = None):
+        """Initializes a PointArray from coordinate columns.
+
+        Args:
+            x_coordinates (Iterable[float]): The x-coordinates of the points.
+            y_coordinates (Iterable[float]): The y-coordinates of the points.
+            labels (Iterable[chr] | None): The letters of the points, if any.
+
+        Raises:
+            ValueError: If the columns don't have the same length.
+        """
+        self.x = array('d', x_coordinates)
+        self.y = array('d', y_coordinates)
+        self.labels = list(labels) if labels is not None else None
+
+        if len(self.x) != len(self.y):
+            raise ValueError("x and y columns must have the same length")
+        if self.labels is not None and len(self.labels) != len(self.x):
+            raise ValueError("labels column must have the same length as the coordinates")
+
+    @classmethod
+    def from_points(cls, points: Iterable[Point]) -> PointArray:
+        """Initializes a PointArray from a sequence of Point objects.
+
+        Args:
+            points (Iterable[Point]): The points to copy.
+
+        Returns:
+            PointArray: A new PointArray holding the coordinates and letters of the points.
+        """
+        points = list(points)
+        return cls((P.x for P in points), (P.y for P in points), [P.letter for P in points])
+
+    @classmethod
+    def coerce(cls, points: PointArray | Iterable[Point]) -> PointArray:
+        """Returns the argument as a PointArray, converting a sequence of Points if needed.
+
+        Args:
+            points (PointArray | Iterable[Point]): Either a PointArray or Point objects.
+
+        Returns:
+            PointArray: The same object if it already is a PointArray, otherwise a new one.
+        """
+        if isinstance(points, cls):
+            return points
+        return cls.from_points(points)
+
+    def to_points(self, point_type: type = Point) -> list[Point]:
+        """Converts the array back into Point objects.
+
+        Points without a label get an empty letter.
+
+        Args:
+            point_type (type): The class to build, e.g. Point or CompactPoint. Defaults to Point.
+
+        Returns:
+            list[Point]: One point per row, in order.
+        """
+        labels = self.labels if self.labels is not None else [''] * len(self)
+        return [point_type(letter, x, y) for letter, x, y in zip(labels, self.x, self.y)]
+
+    def point(self, index: int) -> Point:
+        """Builds the Point stored at a given row.
+
+        Args:
+            index (int): The row of the point.
+
+        Returns:
+            Point: A new Point with the coordinates and letter of that row.
+        """
+        letter = self.labels[index] if self.labels is not None else ''
+        return Point(letter, self.x[index], self.y[index])
+
+    def take(self, indices: Iterable[int]) -> PointArray:
+        """Builds a new PointArray from a selection of rows.
+
+        Args:
+            indices (Iterable[int]): The rows to copy, in the order they should appear.
+
+        Returns:
+            PointArray: A new PointArray holding only the selected rows.
+        """
+        indices = list(indices)
+        x, y = self.x, self.y
+        labels = [self.labels[i] for i in indices] if self.labels is not None else None
+        return PointArray((x[i] for i in indices), (y[i] for i in indices), labels)
+
+    def __len__(self) -> int:
+        """Returns the number of points in the array.
+
+        Returns:
+            int: The number of rows.
+        """
+        return len(self.x)
+
+    def __iter__(self) -> Iterator[Point]:
+        """Iterates over the rows as Point objects.
+
+        Returns:
+            Iterator[Point]: A new Point for every row.
+        """
+        return (self.point(i) for i in range(len(self)))
+
+    def __str__(self) -> str:
+        """Returns a string representation of the PointArray.
+
+        Returns:
+            str: A short description with the number of points.
+        """
+        return f"POINT ARRAY holding {len(self)} points."
+
+
+class GetDistances:
+    """A collection of static methods for calculating many distances at once."""
+
+    @staticmethod
+    def between_points(A: Point | PointArray, B: Point | PointArray) -> array:
+        """Calculates Euclidean distances between points in batch.
+
+        If one argument is a single Point, the distance from it to every point of the other
+        argument is returned (one-to-many). If both are PointArrays, they must have the same
+        length and the distances between matching rows are returned (pairwise).
+
+        Args:
+            A (Point | PointArray): The first point or points.
+            B (Point | PointArray): The second point or points.
+
+        Returns:
+            array: The distances, as an `array('d')`.
+
+        Raises:
+            ValueError: If two PointArrays of different lengths are given.
+        """
+        if not isinstance(A, PointArray):
+            A, B = B, A
+        if not isinstance(B, PointArray):
+            px, py = B.x, B.y
+            return array('d', map(hypot, [x - px for x in A.x], [y - py for y in A.y]))
+        if len(A) != len(B):
+            raise ValueError("Pairwise distances need two arrays of the same length")
+        return array('d', map(hypot,
+                              [ax - bx for ax, bx in zip(A.x, B.x)],
+                              [ay - by for ay, by in zip(A.y, B.y)]))
+
+    @staticmethod
+    def matrix_chunks(A: PointArray, B: PointArray | None = None,
+                      chunk_size: int = 1024) -> Iterator[tuple[int, list[array]]]:
+        """Calculates the full distance matrix between two arrays, a block of rows at a time.
+
+        Only `chunk_size` rows of the matrix are held in memory at once, so arbitrarily
+        large matrices can be streamed.
+
+        Args:
+            A (PointArray): The points indexing the rows of the matrix.
+            B (PointArray | None): The points indexing the columns. Defaults to A.
+            chunk_size (int): The number of rows computed per block. Defaults to 1024.
+
+        Returns:
+            Iterator[tuple[int, list[array]]]: Pairs of the first row index of the block and
+                the rows of the block, each row being an `array('d')` of len(B) distances.
+
+        Raises:
+            ValueError: If chunk_size isn't positive.
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        if B is None:
+            B = A
+        bx, by = B.x, B.y
+        for start in range(0, len(A), chunk_size):
+            rows = []
+            for px, py in zip(A.x[start:start + chunk_size], A.y[start:start + chunk_size]):
+                rows.append(array('d', map(hypot, [x - px for x in bx], [y - py for y in by])))
+            yield start, rows
+
+    @staticmethod
+    def matrix(A: PointArray, B: PointArray | None = None, chunk_size: int = 1024) -> list[array]:
+        """Calculates the full distance matrix between two arrays.
+
+        Args:
+            A (PointArray): The points indexing the rows of the matrix.
+            B (PointArray | None): The points indexing the columns. Defaults to A.
+            chunk_size (int): The number of rows computed per block. Defaults to 1024.
+
+        Returns:
+            list[array]: One `array('d')` of len(B) distances for every point of A.
+        """
+        rows = []
+        for _, block in GetDistances.matrix_chunks(A, B, chunk_size):
+            rows.extend(block)
+        return rows
@@ -1,6 +1,8 @@
 # geometry/basics.py
 from __future__ import annotations
 from math import sqrt, fsum, pi
+from operator import attrgetter
+from weakref import ref
 
 
 class Point:
@@ -12,6 +14,13 @@ class Point:
         y (float): The y-coordinate of the point.
     """
 
+    # Weak references to the shapes holding values derived from this point, by shape id,
+    # told to drop them when the point changes. None until a shape caches something.
+    _owners = None
+    # The registry size at which shapes that no longer exist are dropped, twice the size
+    # left by the last pass so the passes take amortized constant time
+    _prune_at = 8
+
     def __init__(self, letter: chr, x_coordinate: float, y_coordinate: float):
         """Initializes a Point object.
 
@@ -20,9 +29,10 @@ class Point:
             x_coordinate (float): The x-coordinate of the point.
             y_coordinate (float): The y-coordinate of the point.
         """
-        self.letter = letter
-        self.x = x_coordinate
-        self.y = y_coordinate
+        # A new point has no owners to notify yet, so the setters can be skipped
+        self._letter = letter
+        self._x = x_coordinate
+        self._y = y_coordinate
 
     @classmethod
     def MiddlePoint(cls, letter: chr, A: Point, B: Point) -> Point:
@@ -62,6 +72,8 @@ class Point:
             value (chr): The new letter for the point.
         """
         self._letter = value
+        if self._owners is not None:
+            self._notify()
 
     @property
     def x(self) -> float:
@@ -80,6 +92,8 @@ class Point:
             value (float): The new x-coordinate.
         """
         self._x = value
+        if self._owners is not None:
+            self._notify()
 
     @property
     def y(self) -> float:
@@ -98,6 +112,8 @@ class Point:
             value (float): The new y-coordinate.
         """
         self._y = value
+        if self._owners is not None:
+            self._notify()
 
     @property
     def format(self) -> str:
@@ -108,6 +124,322 @@ class Point:
         """
         return f"{self.letter}({self.x}; {self.y})"
 
+    def _prune(self) -> None:
+        """Drops the registered shapes that no longer exist."""
+        self._owners = owners = {key: owner for key, owner in self._owners.items() if owner() is not None}
+        self._prune_at = max(8, 2 * len(owners))
+
+    def _notify(self) -> None:
+        """Tells the registered shapes that this point changed."""
+        owners, self._owners = self._owners, None
+        for owner in owners.values():
+            shape = owner()
+            if shape is not None:
+                shape._forget()
+
+    def __getstate__(self) -> dict:
+        """Gets the state to pickle or copy, without the registered shapes.
+
+        Returns:
+            dict: The letter and coordinates of the point.
+        """
+        state = self.__dict__.copy()
+        state.pop('_owners', None)
+        return state
+
+
+class CompactPoint:
+    """A low-overhead point for large in-memory point sets.
+
+    Stores its letter and coordinates in `__slots__` instead of a per-instance `__dict__`
+    and exposes them as plain attributes instead of properties. It has the same interface
+    as Point, so it can be used anywhere a Point is expected.
+
+    Attributes:
+        letter (chr): The letter designation for the point (e.g., 'A', 'B').
+        x (float): The x-coordinate of the point.
+        y (float): The y-coordinate of the point.
+    """
+
+    __slots__ = ('letter', 'x', 'y')
+
+    def __init__(self, letter: chr, x_coordinate: float, y_coordinate: float):
+        """Initializes a CompactPoint object.
+
+        Args:
+            letter (chr): The letter designation for the point (e.g., 'A', 'B').
+            x_coordinate (float): The x-coordinate of the point.
+            y_coordinate (float): The y-coordinate of the point.
+        """
+        self.letter = letter
+        self.x = x_coordinate
+        self.y = y_coordinate
+
+    @classmethod
+    def MiddlePoint(cls, letter: chr, A: Point, B: Point) -> CompactPoint:
+        """Initializes a point with coordinates in the middle of points A and B.
+
+        Args:
+            letter (chr): The letter designation for the middle point.
+            A (Point): The first point.
+            B (Point): The second point.
+        """
+        return cls(letter, (A.x + B.x) / 2, (A.y + B.y) / 2)
+
+    def __str__(self) -> str:
+        """Returns a string representation of the point.
+
+        Returns:
+            str: A formatted string representing the point, e.g., "A(0; 0)".
+        """
+        return self.format
+
+    @property
+    def format(self) -> str:
+        """Gets the formatted string representation of the point.
+
+        Returns:
+            str: A string like "A(0; 0)".
+        """
+        return f"{self.letter}({self.x}; {self.y})"
+
+
+class FrozenPoint(CompactPoint):
+    """An immutable, hashable CompactPoint.
+
+    Since the point can't change, its formatted string is computed once and cached.
+    Two frozen points are equal when their letters and coordinates are equal.
+    """
+
+    __slots__ = ('_format',)
+
+    def __init__(self, letter: chr, x_coordinate: float, y_coordinate: float):
+        """Initializes a FrozenPoint object.
+
+        Args:
+            letter (chr): The letter designation for the point (e.g., 'A', 'B').
+            x_coordinate (float): The x-coordinate of the point.
+            y_coordinate (float): The y-coordinate of the point.
+        """
+        object.__setattr__(self, 'letter', letter)
+        object.__setattr__(self, 'x', x_coordinate)
+        object.__setattr__(self, 'y', y_coordinate)
+        object.__setattr__(self, '_format', None)
+
+    def __setattr__(self, name: str, value) -> None:
+        """Prevents changing the point after initialization.
+
+        Raises:
+            AttributeError: Always, since frozen points are immutable.
+        """
+        raise AttributeError(f"FrozenPoint is immutable, can't set '{name}'")
+
+    def __delattr__(self, name: str) -> None:
+        """Prevents deleting attributes of the point.
+
+        Raises:
+            AttributeError: Always, since frozen points are immutable.
+        """
+        raise AttributeError(f"FrozenPoint is immutable, can't delete '{name}'")
+
+    def __eq__(self, other: object) -> bool:
+        """Checks if two frozen points have the same letter and coordinates.
+
+        Args:
+            other (object): The object to compare against.
+
+        Returns:
+            bool: True if the points are equal, False otherwise.
+        """
+        if not isinstance(other, FrozenPoint):
+            return NotImplemented
+        return (self.letter, self.x, self.y) == (other.letter, other.x, other.y)
+
+    def __hash__(self) -> int:
+        """Returns a hash of the letter and coordinates of the point.
+
+        Returns:
+            int: The hash value.
+        """
+        return hash((self.letter, self.x, self.y))
+
+    @property
+    def format(self) -> str:
+        """Gets the formatted string representation of the point, computed once.
+
+        Returns:
+            str: A string like "A(0; 0)".
+        """
+        if self._format is None:
+            object.__setattr__(self, '_format', f"{self.letter}({self.x}; {self.y})")
+        return self._format
+
+
+class _derived:
+    """Turns a method of a shape into a value computed on first read.
+
+    The value is stored in the instance dictionary under the method's name, where it
+    shadows this descriptor, so later reads are plain attribute reads. The corner points
+    of the shape delete it again when they change.
+    """
+
+    def __init__(self, compute):
+        """Wraps the method computing the value."""
+        self._compute = compute
+        self._name = compute.__name__
+        self.__doc__ = compute.__doc__
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        """Remembers the attribute name the value is stored under."""
+        self._name = name
+
+    def __get__(self, shape, owner: type | None = None):
+        """Computes the value, and keeps it if the shape can tell when it goes stale."""
+        if shape is None:
+            return self
+        value = self._compute(shape)
+        watched = shape._watched
+        if watched is None:
+            watched = shape._watch_corners()
+        if watched:
+            setattr(shape, self._name, value)
+        return value
+
+
+class _CachedCorners:
+    """Caches values derived from the corner points of a shape.
+
+    Derived values, declared with `_derived`, are computed on first access and kept as
+    instance attributes until a corner point is moved, renamed or replaced: corner Point
+    objects hold weak references to the shapes caching their values and tell them to
+    drop those values when they change. Subclasses list their corner attribute names in
+    `_corner_names`, which become properties stored under a leading underscore.
+
+    FrozenPoint corners never change. Changes to CompactPoint corners can't be seen, so
+    a shape with such a corner recomputes its derived values on every read.
+    """
+
+    _corner_names: tuple[str, ...] = ()
+    _derived_names: tuple[str, ...] = ()
+    # Whether the corners report their changes, None until the shape registers with them
+    _watched: bool | None = None
+
+    def __init_subclass__(cls, **kwargs):
+        """Builds the corner properties and lists the derived values of a subclass."""
+        super().__init_subclass__(**kwargs)
+        if cls._corner_names:
+            cls._corner_getter = attrgetter(*('_' + name for name in cls._corner_names))
+        for name in cls._corner_names:
+            if name not in vars(cls):
+                setattr(cls, name, _corner_property(name))
+        cls._derived_names = tuple(dict.fromkeys(name for klass in cls.__mro__ for name, value in vars(klass).items()
+                                                 if isinstance(value, _derived)))
+
+    def _corners(self) -> tuple:
+        """Gets the corner points of the shape."""
+        return self._corner_getter(self)
+
+    def _watch_corners(self) -> bool:
+        """Registers the shape with its corners, once until they next change.
+
+        Returns:
+            bool: True if every change to the corners will be reported, so derived
+                values can be kept.
+        """
+        watched = self._watched
+        if watched is None:
+            watched, key, owner = True, id(self), ref(self)
+            for corner in self._corners():
+                if isinstance(corner, Point):
+                    owners = corner._owners
+                    if owners is None:
+                        corner._owners = {key: owner}
+                    else:
+                        owners[key] = owner
+                        if len(owners) >= corner._prune_at:
+                            corner._prune()
+                elif not isinstance(corner, FrozenPoint):
+                    watched = False
+            self._watched = watched
+        return watched
+
+    def _forget(self) -> None:
+        """Drops the derived values, after a corner changed."""
+        if self._watched is not None:
+            values = self.__dict__
+            for name in self._derived_names:
+                values.pop(name, None)
+            self._watched = None
+
+    def _valid_cache(self) -> dict:
+        """Gets the cached derived values.
+
+        Returns:
+            dict: The derived values computed so far, by name.
+        """
+        values = self.__dict__
+        return {name: values[name] for name in self._derived_names if name in values}
+
+    def _reset_cache(self, values: dict) -> None:
+        """Replaces the cached derived values with values known to match the current corners.
+
+        Args:
+            values (dict): The derived values, by name.
+        """
+        self._forget()
+        if self._watch_corners():
+            self.__dict__.update(values)
+
+    def __getstate__(self) -> dict:
+        """Gets the state to pickle or copy, without the derived values.
+
+        Returns:
+            dict: The attributes of the shape.
+        """
+        state = self.__dict__.copy()
+        for name in self._derived_names:
+            state.pop(name, None)
+        state.pop('_watched', None)
+        return state
+
+
+def _corner_property(name: str) -> property:
+    """Builds the property of a corner, dropping the derived values when it is replaced."""
+    private = '_' + name
+
+    def set_corner(shape: _CachedCorners, value) -> None:
+        setattr(shape, private, value)
+        shape._forget()
+    return property(attrgetter(private), set_corner, doc=f"The corner point {name}.")
+
+
+def _side_functions(corners: list[tuple[float, float]]) -> tuple | None:
+    """Builds the side functions of a convex polygon, positive towards its inside.
+
+    A side from (x1, y1) to (x2, y2) is stored as (x1, y1, u, v) and evaluated at (x, y) as
+    u * (y - y1) - v * (x - x1), an orientation relative to a corner. The endpoints are
+    taken in lexicographic order, so two polygons sharing a side compute exactly negated
+    values and a point on the side is never rejected by both.
+
+    Args:
+        corners (list[tuple[float, float]]): The corners, in order around the polygon.
+
+    Returns:
+        tuple | None: One (x1, y1, u, v) quadruple per side, or None if the corner
+            following a side lies on it (a flat polygon).
+    """
+    count = len(corners)
+    sides = []
+    for i in range(count):
+        (x1, y1), (x2, y2) = sorted((corners[i], corners[(i + 1) % count]))
+        u, v = x2 - x1, y2 - y1
+        x, y = corners[(i + 2) % count]
+        inside = u * (y - y1) - v * (x - x1)
+        if inside == 0:
+            return None
+        sides.append((x1, y1, u, v) if inside > 0 else (x1, y1, -u, -v))
+    return tuple(sides)
+
 
 class GetDistance:
     """A collection of static methods for calculating distances between geometrical entities."""
@@ -137,12 +469,14 @@ class GetDistance:
             float: The perpendicular distance from the point to the line.
 
         Raises:
-            TypeError: If L is not an instance of the Line class.
+            TypeError: If L is not a Line, i.e. has no norm.
         """
-        from .line import Line
-        if not isinstance(L, Line):
-            raise TypeError("L must be an instance of Line")
-        return abs(L.a * P.x + L.b * P.y + L.c) / sqrt(L.a ** 2 + L.b ** 2)
+        # Duck-typed, since line.py imports this module and can't be imported at the top
+        try:
+            norm = L.norm
+        except AttributeError:
+            raise TypeError("L must be an instance of Line") from None
+        return abs(L.a * P.x + L.b * P.y + L.c) / norm
 
 
 class General:
@@ -197,6 +531,24 @@ class Areas:
             p = semi_perimeter
             return sqrt(p * (p - a) * (p - b) * (p - c))
 
+        @staticmethod
+        def StableHeron(lengths: list) -> float:
+            """Calculates the area of a triangle using Kahan's numerically stable Heron formula.
+
+            Unlike `Heron`, this keeps full precision for needle-shaped triangles, where one
+            side is almost as long as the other two together.
+
+            Args:
+                lengths (list): A list containing the three side lengths of the triangle.
+
+            Returns:
+                float: The area of the triangle.
+            """
+            [a, b, c] = sorted(lengths, reverse=True)
+            product = (a + (b + c)) * (c - (a - b)) * (c + (a - b)) * (a + (b - c))
+            # Rounding can push a degenerate triangle slightly below zero
+            return sqrt(max(product, 0.0)) / 4
+
         @staticmethod
         def RightTriangle(leg1: float, leg2: float) -> float:
             """Calculates the area of a right-angled triangle.
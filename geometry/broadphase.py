@@ -0,0 +1,83 @@
+# geometry/broadphase.py
+from __future__ import annotations
+from typing import Iterable
+
+from .circle import Circle
+from .index import CircleIndex
+
+
+class BroadPhase:
+    """Reports all pairs of overlapping circles in a large, moving collection.
+
+    The circles are hashed into a uniform grid (a CircleIndex), so only circles sharing a
+    grid cell are tested against each other and the work grows with the number of nearby
+    pairs instead of with N^2. Between frames, `update` only re-hashes the circles whose
+    grid cells changed, so small movements cost almost nothing.
+
+    Attributes:
+        circles (list[Circle]): The tracked circles. Pairs refer to positions in this list.
+        index (CircleIndex): The grid holding the circles.
+    """
+
+    def __init__(self, circles: Iterable[Circle], cell_size: float | None = None):
+        """Initializes a BroadPhase over a collection of circles.
+
+        Args:
+            circles (Iterable[Circle]): The circles to track.
+            cell_size (float | None): The side length of one grid cell. If None, the
+                average circle diameter is used.
+        """
+        self.circles = list(circles)
+        self.index = CircleIndex.build(self.circles, cell_size)
+        self._positions = {id(circle): position for position, circle in enumerate(self.circles)}
+
+    def update(self, moved: Iterable[Circle] | None = None) -> int:
+        """Re-hashes circles after they moved or changed size.
+
+        Args:
+            moved (Iterable[Circle] | None): The circles that changed. If None, every
+                tracked circle is checked.
+
+        Returns:
+            int: The number of circles that had to change grid cells.
+        """
+        update = self.index.update
+        return sum(update(circle) for circle in (self.circles if moved is None else moved))
+
+    def pairs(self, include_touching: bool = True) -> list[tuple[int, int]]:
+        """Finds every pair of overlapping circles.
+
+        Args:
+            include_touching (bool): If True, circles touching at a single point count as
+                overlapping. Defaults to True.
+
+        Returns:
+            list[tuple[int, int]]: The positions (i, j) of overlapping circles, with i < j,
+                sorted.
+        """
+        positions = self._positions
+        query_rect = self.index.query_rect
+        found = []
+        for i, circle in enumerate(self.circles):
+            x, y, r = circle.center.x, circle.center.y, circle.radius
+            for other in query_rect(x - r, y - r, x + r, y + r):
+                j = positions[id(other)]
+                if j > i and circle.overlaps(other, include_touching):
+                    found.append((i, j))
+        found.sort()
+        return found
+
+    def pairs_brute(self, include_touching: bool = True) -> list[tuple[int, int]]:
+        """Finds every pair of overlapping circles by testing all pairs, as a reference.
+
+        Args:
+            include_touching (bool): If True, circles touching at a single point count as
+                overlapping. Defaults to True.
+
+        Returns:
+            list[tuple[int, int]]: The positions (i, j) of overlapping circles, with i < j,
+                sorted.
+        """
+        circles = self.circles
+        return [(i, j) for i in range(len(circles)) for j in range(i + 1, len(circles))
+                if circles[i].overlaps(circles[j], include_touching)]
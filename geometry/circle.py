@@ -1,5 +1,9 @@
+from __future__ import annotations
 from .basics import Point, Areas, GetDistance
-from math import pi, sqrt
+from .arrays import PointArray
+from math import pi, sqrt, hypot
+from random import Random
+from typing import Iterable
 
 
 class Circle:
@@ -20,6 +24,101 @@ class Circle:
         self._center = center_point
         self._radius = radius
 
+    @classmethod
+    def enclosing(cls, points: PointArray | Iterable[Point], tol: float = 1e-12,
+                  seed: int | None = None, letter: chr = 'O') -> Circle:
+        """Initializes the smallest Circle containing all the given points.
+
+        Uses Welzl's algorithm in its iterative form: the points are visited in random
+        order and the circle is only rebuilt, from the point that fell outside and at
+        most two earlier ones, when a point isn't covered. The expected running time is
+        linear and no recursion is needed.
+
+        Args:
+            points (PointArray | Iterable[Point]): The points to cover.
+            tol (float): The relative tolerance by which a point may lie outside the
+                circle and still count as covered. Defaults to 1e-12.
+            seed (int | None): The seed of the random order, for reproducible results.
+                Defaults to None.
+            letter (chr): The letter designation for the center point. Defaults to 'O'.
+
+        Returns:
+            Circle: The minimum enclosing circle. Its radius is the largest distance from
+                the center to a point, so `contains` accepts every given point.
+
+        Raises:
+            ValueError: If no points are given.
+        """
+        points = PointArray.coerce(points)
+        if len(points) == 0:
+            raise ValueError("At least one point is needed to enclose")
+        xs, ys = points.x, points.y
+        order = list(range(len(points)))
+        Random(seed).shuffle(order)
+        scale = 1 + tol
+
+        def covers(circle: tuple[float, float, float], k: int) -> bool:
+            """Checks if a circle given as (x, y, radius) covers the point at position k."""
+            return hypot(xs[k] - circle[0], ys[k] - circle[1]) <= circle[2] * scale
+
+        def diameter(i: int, j: int) -> tuple[float, float, float]:
+            """Builds the circle whose diameter joins two points."""
+            x, y = (xs[i] + xs[j]) / 2, (ys[i] + ys[j]) / 2
+            return x, y, max(hypot(xs[i] - x, ys[i] - y), hypot(xs[j] - x, ys[j] - y))
+
+        def circumcircle(i: int, j: int, k: int) -> tuple[float, float, float]:
+            """Builds the circle through three points, or around the farthest two if collinear."""
+            ax, ay = xs[i], ys[i]
+            bx, by = xs[j] - ax, ys[j] - ay
+            cx, cy = xs[k] - ax, ys[k] - ay
+            d = 2 * (bx * cy - by * cx)
+            if d == 0:
+                return max(diameter(i, j), diameter(i, k), diameter(j, k), key=lambda c: c[2])
+            b2, c2 = bx * bx + by * by, cx * cx + cy * cy
+            ux, uy = (cy * b2 - by * c2) / d, (bx * c2 - cx * b2) / d
+            x, y = ax + ux, ay + uy
+            return x, y, max(hypot(xs[m] - x, ys[m] - y) for m in (i, j, k))
+
+        circle = (xs[order[0]], ys[order[0]], 0.0)
+        for a in range(1, len(order)):
+            i = order[a]
+            if covers(circle, i):
+                continue
+            circle = (xs[i], ys[i], 0.0)
+            for b in range(a):
+                j = order[b]
+                if covers(circle, j):
+                    continue
+                circle = diameter(i, j)
+                for c in range(b):
+                    k = order[c]
+                    if not covers(circle, k):
+                        circle = circumcircle(i, j, k)
+
+        # Points within the tolerance may still lie just outside, so the final radius is
+        # measured exactly like `contains` (GetDistance.between_points) to every point
+        x, y = circle[0], circle[1]
+        radius = max(sqrt(((x - px) ** 2) + (y - py) ** 2) for px, py in zip(xs, ys))
+        return cls(Point(letter, x, y), radius)
+
+    @classmethod
+    def enclosing_many(cls, groups: Iterable[PointArray | Iterable[Point]], tol: float = 1e-12,
+                       seed: int | None = None, letter: chr = 'O') -> list[Circle]:
+        """Initializes the smallest enclosing Circle of each of many groups of points.
+
+        Args:
+            groups (Iterable[PointArray | Iterable[Point]]): The groups of points to cover.
+            tol (float): The relative tolerance by which a point may lie outside its
+                circle and still count as covered. Defaults to 1e-12.
+            seed (int | None): The seed of the random order, for reproducible results.
+                Defaults to None.
+            letter (chr): The letter designation for the center points. Defaults to 'O'.
+
+        Returns:
+            list[Circle]: One minimum enclosing circle per group, in order.
+        """
+        return [cls.enclosing(group, tol, seed, letter) for group in groups]
+
     def contains(self, check: Point, include_points_on_boundary: bool = True) -> bool:
         """Checks if a given point is inside or on the boundary of the circle.
 
@@ -35,6 +134,83 @@ class Circle:
         return distance_between_center_and_check <= self.radius if include_points_on_boundary \
             else distance_between_center_and_check < self.radius
 
+    def contains_many(self, points: PointArray | Iterable[Point],
+                      include_points_on_boundary: bool = True) -> list[bool]:
+        """Checks which of many points are inside or on the boundary of the circle.
+
+        Squared distances are compared against the squared radius, so no square root is
+        taken, except for the few points so close to the boundary that rounding could make
+        the comparison disagree with `contains`. Those are checked exactly like `contains`.
+
+        Args:
+            points (PointArray | Iterable[Point]): The points to check for containment.
+            include_points_on_boundary (bool): If True, points exactly on the
+                circle's circumference are considered inside. Defaults to True.
+
+        Returns:
+            list[bool]: For every point, True if it is contained within (or on) the circle.
+        """
+        points = PointArray.coerce(points)
+        cx, cy, radius = self.center.x, self.center.y, self.radius
+        radius_squared = radius * radius
+        # Outside this band around the squared radius both comparisons always agree
+        band = radius_squared * 1e-12
+        low, high = radius_squared - band, radius_squared + band
+
+        mask = []
+        append = mask.append
+        for squared in [((cx - x) ** 2) + (cy - y) ** 2 for x, y in zip(points.x, points.y)]:
+            if squared < low:
+                append(True)
+            elif squared > high:
+                append(False)
+            elif include_points_on_boundary:
+                append(sqrt(squared) <= radius)
+            else:
+                append(sqrt(squared) < radius)
+        return mask
+
+    def overlaps(self, other: Circle, include_touching: bool = True) -> bool:
+        """Checks if this circle shares any area (or boundary point) with another circle.
+
+        Args:
+            other (Circle): The other Circle object.
+            include_touching (bool): If True, circles touching at a single point count as
+                overlapping. Defaults to True.
+
+        Returns:
+            bool: True if the circles overlap, False otherwise.
+        """
+        distance_between_centers = GetDistance.between_points(self.center, other.center)
+        reach = self.radius + other.radius
+        return distance_between_centers <= reach if include_touching else distance_between_centers < reach
+
+    def intersection_points(self, other: Circle, letters: tuple[chr, chr] = ('I', 'J')) -> list[Point]:
+        """Calculates the points where the circumferences of two circles cross.
+
+        Args:
+            other (Circle): The other Circle object.
+            letters (tuple[chr, chr]): The letter designations for the intersection points.
+                Defaults to ('I', 'J').
+
+        Returns:
+            list[Point]: Two points if the circumferences cross, one if they touch and none
+                if they don't meet or the circles coincide.
+        """
+        (x1, y1, r1), (x2, y2, r2) = (self.center.x, self.center.y, self.radius), \
+            (other.center.x, other.center.y, other.radius)
+        d = GetDistance.between_points(self.center, other.center)
+        if d == 0 or d > r1 + r2 or d < abs(r1 - r2):
+            return []
+        # Distance from the first center to the chord joining the intersection points
+        a = (r1 ** 2 - r2 ** 2 + d ** 2) / (2 * d)
+        h = sqrt(max(r1 ** 2 - a ** 2, 0.0))
+        mx, my = x1 + a * (x2 - x1) / d, y1 + a * (y2 - y1) / d
+        if h == 0:
+            return [Point(letters[0], mx, my)]
+        ox, oy = h * (y2 - y1) / d, h * (x2 - x1) / d
+        return [Point(letters[0], mx + ox, my - oy), Point(letters[1], mx - ox, my + oy)]
+
     def __str__(self) -> str:
         """Returns a string representation of the Circle object.
 
@@ -0,0 +1,79 @@
+# geometry/cli.py
+from __future__ import annotations
+import argparse
+import sys
+from contextlib import ExitStack
+from typing import Sequence
+
+from .basics import Point
+from .pipeline import FORMATS, METRICS, guess_format, run
+
+
+def _point(text: str) -> Point:
+    """Parses a query point written as "x,y"."""
+    try:
+        x, y = (float(value) for value in text.split(','))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected a point as x,y, got {text!r}")
+    return Point('Q', x, y)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Builds the command line parser.
+
+    Returns:
+        argparse.ArgumentParser: The parser of the `python -m geometry` command.
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m geometry',
+        description="Measure the shapes of a record file chunk by chunk, with constant memory use.")
+    parser.add_argument('input', help="the record file, or - for standard input (csv and ndjson only)")
+    parser.add_argument('-o', '--output', default='-', help="the result file, or - for standard output (default)")
+    parser.add_argument('-f', '--format', choices=FORMATS,
+                        help="the input record format (default: guessed from the file name)")
+    parser.add_argument('--output-format', choices=('csv', 'ndjson'),
+                        help="the result format (default: ndjson for .ndjson/.jsonl outputs, csv otherwise)")
+    parser.add_argument('-m', '--metric', action='append', choices=METRICS, dest='metrics',
+                        help="a metric to compute, repeatable (default: area and perimeter)")
+    parser.add_argument('-p', '--point', action='append', type=_point, default=[], dest='points',
+                        help="a query point x,y for the contains metric, repeatable")
+    parser.add_argument('-c', '--chunk-size', type=int, default=65536, help="records per chunk (default: 65536)")
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Runs the pipeline from the command line.
+
+    Args:
+        argv (Sequence[str] | None): The arguments. Defaults to sys.argv[1:].
+
+    Returns:
+        int: The exit status.
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    input_format = args.format or guess_format(args.input)
+    output_format = args.output_format or ('ndjson' if guess_format(args.output) == 'ndjson' else 'csv')
+    metrics = args.metrics or ['area', 'perimeter']
+    if 'contains' in metrics and not args.points:
+        parser.error("the contains metric needs at least one --point")
+    if args.input == '-' and input_format == 'binary':
+        parser.error("binary input must be read from a file")
+
+    with ExitStack() as stack:
+        try:
+            if args.input == '-':
+                source = sys.stdin
+            else:
+                source = stack.enter_context(open(args.input, 'rb' if input_format == 'binary' else 'r',
+                                                  newline='' if input_format == 'csv' else None))
+            if args.output == '-':
+                destination = sys.stdout
+            else:
+                destination = stack.enter_context(open(args.output, 'w', newline=''))
+            count = run(source, destination, input_format, output_format, metrics, args.points, args.chunk_size)
+        except (OSError, ValueError) as error:
+            print(f"error: {error}", file=sys.stderr)
+            return 1
+    print(f"{count} records processed", file=sys.stderr)
+    return 0
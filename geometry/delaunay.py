@@ -0,0 +1,315 @@
+# geometry/delaunay.py
+from __future__ import annotations
+from array import array
+from math import fsum, hypot
+from typing import Iterable, Iterator
+
+from .basics import Point, General
+from .arrays import PointArray
+from .triangle import Triangle
+from .triangle_batch import TriangleBatch
+
+
+def _hilbert_index(x: int, y: int, order: int) -> int:
+    """Gets the position of a grid cell along a Hilbert curve.
+
+    Args:
+        x (int): The column of the cell, between 0 and 2^order - 1.
+        y (int): The row of the cell, between 0 and 2^order - 1.
+        order (int): The number of bits per coordinate.
+
+    Returns:
+        int: The distance of the cell along the curve.
+    """
+    index = 0
+    side = 1 << (order - 1)
+    while side > 0:
+        rx = 1 if x & side else 0
+        ry = 1 if y & side else 0
+        index += side * side * ((3 * rx) ^ ry)
+        if ry == 0:
+            if rx == 1:
+                x = side - 1 - x
+                y = side - 1 - y
+            x, y = y, x
+        side >>= 1
+    return index
+
+
+def _spatial_order(xs: list[float], ys: list[float]) -> list[int]:
+    """Sorts point positions along a Hilbert curve so consecutive points are close together."""
+    if not xs:
+        return []
+    xmin, ymin = min(xs), min(ys)
+    span = max(max(xs) - xmin, max(ys) - ymin) or 1.0
+    order = 16
+    scale = ((1 << order) - 1) / span
+    keys = [_hilbert_index(int((x - xmin) * scale), int((y - ymin) * scale), order) for x, y in zip(xs, ys)]
+    return sorted(range(len(xs)), key=keys.__getitem__)
+
+
+class TriangleMesh:
+    """A compact, index-based triangle mesh.
+
+    Vertices are stored once in a PointArray and every triangle is a triple of vertex
+    positions, in counter-clockwise order. Triangle objects are only built on demand.
+
+    Attributes:
+        vertices (PointArray): The vertex coordinates.
+        indices (array): The vertex positions of all triangles, three per triangle.
+    """
+
+    def __init__(self, vertices: PointArray, indices: Iterable[int], points: list[Point] | None = None):
+        """Initializes a TriangleMesh.
+
+        Args:
+            vertices (PointArray): The vertex coordinates.
+            indices (Iterable[int]): The vertex positions of all triangles, three per triangle.
+            points (list[Point] | None): Point objects matching the vertices, reused when
+                building Triangle objects. Defaults to None.
+        """
+        self.vertices = vertices
+        self.indices = array('q', indices)
+        self._points = points
+
+    def __len__(self) -> int:
+        """Returns the number of triangles in the mesh.
+
+        Returns:
+            int: The number of triangles.
+        """
+        return len(self.indices) // 3
+
+    def triangle_indices(self, index: int) -> tuple[int, int, int]:
+        """Gets the vertex positions of a triangle.
+
+        Args:
+            index (int): The number of the triangle.
+
+        Returns:
+            tuple[int, int, int]: The three vertex positions.
+        """
+        return self.indices[3 * index], self.indices[3 * index + 1], self.indices[3 * index + 2]
+
+    def _vertex(self, index: int) -> Point:
+        """Returns the Point of a vertex."""
+        if self._points is not None:
+            return self._points[index]
+        return self.vertices.point(index)
+
+    def triangle(self, index: int) -> Triangle:
+        """Builds the Triangle object of one triangle.
+
+        Args:
+            index (int): The number of the triangle.
+
+        Returns:
+            Triangle: A new Triangle with the corners of the triangle.
+        """
+        a, b, c = self.triangle_indices(index)
+        return Triangle(self._vertex(a), self._vertex(b), self._vertex(c))
+
+    def triangles(self) -> Iterator[Triangle]:
+        """Builds the Triangle objects of all triangles, one at a time.
+
+        Returns:
+            Iterator[Triangle]: A new Triangle for every triangle of the mesh.
+        """
+        return (self.triangle(i) for i in range(len(self)))
+
+    def batch(self) -> TriangleBatch:
+        """Gathers the corner coordinates of all triangles into a TriangleBatch.
+
+        Returns:
+            TriangleBatch: The triangles of the mesh as coordinate columns.
+        """
+        xs, ys, indices = self.vertices.x, self.vertices.y, self.indices
+        return TriangleBatch((xs[i] for i in indices[0::3]), (ys[i] for i in indices[0::3]),
+                             (xs[i] for i in indices[1::3]), (ys[i] for i in indices[1::3]),
+                             (xs[i] for i in indices[2::3]), (ys[i] for i in indices[2::3]))
+
+    def boundary_edges(self) -> list[tuple[int, int]]:
+        """Finds the edges belonging to only one triangle.
+
+        Returns:
+            list[tuple[int, int]]: The boundary edges as pairs of vertex positions.
+        """
+        counts: dict[tuple[int, int], int] = {}
+        for t in range(len(self)):
+            a, b, c = self.triangle_indices(t)
+            for edge in ((a, b), (b, c), (c, a)):
+                key = (edge[0], edge[1]) if edge[0] < edge[1] else (edge[1], edge[0])
+                counts[key] = counts.get(key, 0) + 1
+        return [edge for edge, count in counts.items() if count == 1]
+
+    @property
+    def area(self) -> float:
+        """Gets the total area of the mesh.
+
+        Returns:
+            float: The sum of the areas of all triangles.
+        """
+        return fsum(self.batch().areas())
+
+    @property
+    def perimeter(self) -> float:
+        """Gets the length of the outer boundary of the mesh.
+
+        Returns:
+            float: The sum of the lengths of all boundary edges.
+        """
+        xs, ys = self.vertices.x, self.vertices.y
+        return General.get_perimeter([hypot(xs[a] - xs[b], ys[a] - ys[b]) for a, b in self.boundary_edges()])
+
+    def __str__(self) -> str:
+        """Returns a string representation of the TriangleMesh.
+
+        Returns:
+            str: A short description with the number of vertices and triangles.
+        """
+        return f"TRIANGLE MESH with {len(self.vertices)} vertices and {len(self)} triangles."
+
+
+def triangulate(points: PointArray | Iterable[Point]) -> TriangleMesh:
+    """Builds the Delaunay triangulation of a set of points.
+
+    Uses the Bowyer-Watson algorithm: points are inserted one by one in Hilbert curve
+    order, each located by walking from the previously created triangle, and the
+    triangles whose circumcircle contains the new point are replaced by a fan around
+    it. Thanks to the spatial order, the expected running time is O(n log n).
+
+    Instead of a large helper triangle, every convex hull edge is closed by a "ghost"
+    triangle with a vertex at infinity. A point lies in the circumcircle of a ghost
+    triangle if it is strictly outside its hull edge, or on the edge itself, so the hull
+    grows exactly and the mesh always covers the whole convex hull. Duplicate points are
+    only used once, and collinear input has no triangles.
+
+    Args:
+        points (PointArray | Iterable[Point]): The points to triangulate.
+
+    Returns:
+        TriangleMesh: The triangulation, with vertex positions matching the input order.
+    """
+    objects = None if isinstance(points, PointArray) else list(points)
+    vertices = PointArray.coerce(points if objects is None else objects)
+    count = len(vertices)
+    xs, ys = vertices.x, vertices.y
+    order = _spatial_order(list(xs), list(ys))
+
+    def orientation(a: int, b: int, c: int) -> float:
+        """Positive if a, b, c turn counter-clockwise."""
+        return (xs[b] - xs[a]) * (ys[c] - ys[a]) - (ys[b] - ys[a]) * (xs[c] - xs[a])
+
+    # The first triangle needs three points that aren't collinear
+    first = order[0] if order else 0
+    second = next((p for p in order if xs[p] != xs[first] or ys[p] != ys[first]), None)
+    third = None if second is None else next((p for p in order if orientation(first, second, p) != 0), None)
+    if third is None:
+        return TriangleMesh(vertices, [], objects)
+    if orientation(first, second, third) < 0:
+        second, third = third, second
+
+    # The vertex at infinity, shared by all ghost triangles
+    infinite = count
+    # Triangle columns: three vertices, and the neighbour across the edge opposite each.
+    # Triangle 0 is real, and triangles 1 to 3 are the ghosts behind its edges
+    corners = [first, second, third,
+               third, second, infinite,
+               first, third, infinite,
+               second, first, infinite]
+    neighbours = [1, 2, 3,
+                  3, 2, 0,
+                  1, 3, 0,
+                  2, 1, 0]
+    free: list[int] = []
+
+    def in_circumcircle(t: int, p: int) -> bool:
+        """Checks if a point is strictly inside the circumcircle of a triangle."""
+        a, b, c = corners[3 * t], corners[3 * t + 1], corners[3 * t + 2]
+        if infinite in (a, b, c):
+            # The circumcircle of a ghost is the open half-plane beyond its hull edge
+            a, b = (a, b) if c == infinite else (b, c) if a == infinite else (c, a)
+            turn = orientation(a, b, p)
+            if turn != 0:
+                return turn > 0
+            return min(xs[a], xs[b]) <= xs[p] <= max(xs[a], xs[b]) and min(ys[a], ys[b]) <= ys[p] <= max(ys[a], ys[b])
+        px, py = xs[p], ys[p]
+        adx, ady = xs[a] - px, ys[a] - py
+        bdx, bdy = xs[b] - px, ys[b] - py
+        cdx, cdy = xs[c] - px, ys[c] - py
+        ad, bd, cd = adx * adx + ady * ady, bdx * bdx + bdy * bdy, cdx * cdx + cdy * cdy
+        return (adx * (bdy * cd - bd * cdy) - ady * (bdx * cd - bd * cdx) + ad * (bdx * cdy - bdy * cdx)) > 0
+
+    last = 0
+    for p in order:
+        if p in (first, second, third):
+            continue
+        # Walk towards the point until no edge has it on its outer side, or a ghost is reached
+        t = last
+        if infinite in corners[3 * t:3 * t + 3] and not in_circumcircle(t, p):
+            t = neighbours[3 * t + corners[3 * t:3 * t + 3].index(infinite)]
+        steps = 0
+        while infinite not in corners[3 * t:3 * t + 3]:
+            for k in range(3):
+                a, b = corners[3 * t + (k + 1) % 3], corners[3 * t + (k + 2) % 3]
+                if orientation(a, b, p) < 0:
+                    t = neighbours[3 * t + k]
+                    break
+            else:
+                break
+            steps += 1
+            if steps > len(corners):
+                raise RuntimeError("Point location failed, the input is likely degenerate")
+
+        if any(v != infinite and xs[v] == xs[p] and ys[v] == ys[p] for v in corners[3 * t:3 * t + 3]):
+            continue
+
+        # Grow the cavity of triangles whose circumcircle holds the point
+        cavity = {t}
+        stack = [t]
+        boundary = []
+        while stack:
+            bad = stack.pop()
+            for k in range(3):
+                other = neighbours[3 * bad + k]
+                if other in cavity:
+                    continue
+                if in_circumcircle(other, p):
+                    cavity.add(other)
+                    stack.append(other)
+                else:
+                    boundary.append((corners[3 * bad + (k + 1) % 3], corners[3 * bad + (k + 2) % 3], other))
+
+        # Replace the cavity by a fan of triangles around the point, reusing free slots
+        free.extend(cavity)
+        by_start, by_end = {}, {}
+        for a, b, other in boundary:
+            if free:
+                new = free.pop()
+            else:
+                new = len(corners) // 3
+                corners.extend((0, 0, 0))
+                neighbours.extend((-1, -1, -1))
+            corners[3 * new:3 * new + 3] = (a, b, p)
+            neighbours[3 * new + 2] = other
+            # Slots are reused, so the shared edge is found by its corners, not by `bad`
+            for k in range(3):
+                if corners[3 * other + (k + 1) % 3] == b and corners[3 * other + (k + 2) % 3] == a:
+                    neighbours[3 * other + k] = new
+                    break
+            by_start[a] = new
+            by_end[b] = new
+        for a, b, other in boundary:
+            new = by_start[a]
+            neighbours[3 * new] = by_start[b]
+            neighbours[3 * new + 1] = by_end[a]
+            last = new
+        for dead in free:
+            corners[3 * dead:3 * dead + 3] = (-1, -1, -1)
+
+    indices = []
+    for t in range(len(corners) // 3):
+        triple = corners[3 * t:3 * t + 3]
+        if triple[0] != -1 and infinite not in triple:
+            indices.extend(triple)
+    return TriangleMesh(vertices, indices, objects)
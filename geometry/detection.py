@@ -0,0 +1,185 @@
+# geometry/detection.py
+from __future__ import annotations
+from math import atan2, floor, hypot, pi
+from typing import Iterable
+
+from .basics import Point
+from .arrays import PointArray
+from .line import Line
+from .square import Square
+
+# The rounding error of atan2 and of reducing its result modulo pi, in radians
+_ANGLE_SLACK = 1e-15
+
+
+class _CoordinateLookup:
+    """Finds the points lying at, or within a tolerance of, given coordinates.
+
+    With a zero tolerance the exact coordinates are hashed. Otherwise the points are
+    hashed into grid cells of the tolerance's size, and the 3x3 block of cells around a
+    location is searched.
+    """
+
+    def __init__(self, points: PointArray, tol: float):
+        """Hashes the coordinates of the points.
+
+        Args:
+            points (PointArray): The points to look up.
+            tol (float): The largest distance at which a point still matches.
+        """
+        self._points = points
+        self._tol = tol
+        self._buckets: dict[tuple, list[int]] = {}
+        for i, (x, y) in enumerate(zip(points.x, points.y)):
+            self._buckets.setdefault(self._cell(x, y), []).append(i)
+
+    def _cell(self, x: float, y: float) -> tuple:
+        """Gets the hash key of a location."""
+        if self._tol == 0:
+            return x, y
+        return floor(x / self._tol), floor(y / self._tol)
+
+    def find(self, x: float, y: float) -> list[int]:
+        """Finds the points matching a location.
+
+        Args:
+            x (float): The x-coordinate of the location.
+            y (float): The y-coordinate of the location.
+
+        Returns:
+            list[int]: The positions of the matching points.
+        """
+        if self._tol == 0:
+            return self._buckets.get((x, y), [])
+        i, j = self._cell(x, y)
+        xs, ys, tol = self._points.x, self._points.y, self._tol
+        found = []
+        for di in (-1, 0, 1):
+            for dj in (-1, 0, 1):
+                for k in self._buckets.get((i + di, j + dj), ()):
+                    if hypot(xs[k] - x, ys[k] - y) <= tol:
+                        found.append(k)
+        return found
+
+
+def find_squares(points: PointArray | Iterable[Point], tol: float = 0.0) -> list[Square]:
+    """Finds every square, axis-aligned or rotated, whose corners are among the points.
+
+    Every pair of points is tried as a diagonal, and the two remaining corners are looked
+    up in a hash of the coordinates, so the search takes O(n^2) time instead of the
+    O(n^4) of trying every quadruple.
+
+    Args:
+        points (PointArray | Iterable[Point]): The points to search.
+        tol (float): The largest distance between a point and the exact corner position
+            for it to still count as that corner. Defaults to 0 (exact coordinates).
+
+    Returns:
+        list[Square]: The validated squares, each listed once, with corners in order
+            around the square. When Point objects are given, the squares use them.
+    """
+    objects = None if isinstance(points, PointArray) else list(points)
+    array = PointArray.coerce(points if objects is None else objects)
+    corner = array.point if objects is None else objects.__getitem__
+    lookup = _CoordinateLookup(array, tol)
+    xs, ys = array.x, array.y
+
+    squares = []
+    seen = set()
+    for i in range(len(array)):
+        for j in range(i + 1, len(array)):
+            # The diagonal from i to j, turned a quarter around its middle, gives the other one
+            mx, my = (xs[i] + xs[j]) / 2, (ys[i] + ys[j]) / 2
+            hx, hy = (xs[j] - xs[i]) / 2, (ys[j] - ys[i]) / 2
+            if hx == 0 and hy == 0:
+                continue
+            for k in lookup.find(mx - hy, my + hx):
+                for l in lookup.find(mx + hy, my - hx):
+                    members = frozenset((i, j, k, l))
+                    if len(members) < 4 or members in seen:
+                        continue
+                    seen.add(members)
+                    try:
+                        squares.append(Square(corner(i), corner(k), corner(j), corner(l), abs_tol=2 * tol))
+                    except Exception:
+                        continue
+    return squares
+
+
+def find_collinear(points: PointArray | Iterable[Point], k: int = 3,
+                   tol: float = 1e-9) -> list[tuple[Line, list[Point]]]:
+    """Finds every line passing through at least k of the points.
+
+    For every point, the points after it are sorted by direction, and runs of directions
+    within the tolerance of each other are grouped, so points sharing a line with it end
+    up in the same group and only the points of that group are checked against the line.
+    This takes O(n^2 log n) time instead of the O(n^3) of checking every point against
+    the line of every pair.
+
+    Args:
+        points (PointArray | Iterable[Point]): The points to search.
+        k (int): The smallest number of points a reported line must pass through.
+            Defaults to 3.
+        tol (float): The largest distance between a point and a line for the point to
+            count as on it. Defaults to 1e-9.
+
+    Returns:
+        list[tuple[Line, list[Point]]]: Every normalised line with the points on it, in
+            input order. When Point objects are given, the same objects are returned.
+
+    Raises:
+        ValueError: If k is smaller than 2 or tol isn't positive.
+    """
+    if k < 2:
+        raise ValueError("A line needs at least two points")
+    if not tol > 0:
+        raise ValueError("tol must be positive")
+    objects = None if isinstance(points, PointArray) else list(points)
+    array = PointArray.coerce(points if objects is None else objects)
+    corner = array.point if objects is None else objects.__getitem__
+    xs, ys, count = array.x, array.y, len(array)
+    if count < k:
+        return []
+
+    lines = []
+    # The lines found so far through each point, two shared lines would be the same line
+    through: list[set[int]] = [set() for _ in range(count)]
+    for i in range(count):
+        x, y = xs[i], ys[i]
+        directions = sorted((atan2(ys[j] - y, xs[j] - x) % pi, tol / hypot(xs[j] - x, ys[j] - y), j)
+                            for j in range(i + 1, count) if xs[j] != x or ys[j] != y)
+        # A point within tol of a line through i lies within tol / distance radians of its
+        # direction, so neighbours in direction order that close are grouped together,
+        # including across the wrap-around after a half turn
+        groups: list[list[int]] = []
+        previous = None
+        for angle, spread, j in directions:
+            if previous is None or angle - previous[0] > previous[1] + spread + _ANGLE_SLACK:
+                groups.append([])
+            groups[-1].append(j)
+            previous = angle, spread
+        if len(groups) > 1:
+            first, last = directions[0], directions[-1]
+            if first[0] + pi - last[0] <= first[1] + last[1] + _ANGLE_SLACK:
+                groups[0].extend(groups.pop())
+
+        for group in groups:
+            if len(group) + 1 < k:
+                continue
+            remaining = [m for m in group if not through[i] & through[m]]
+            # A group can hold lines of nearly equal direction, each anchor splits off one
+            while len(remaining) + 1 >= k:
+                # The farthest point pins the direction down most precisely
+                anchor = max(remaining, key=lambda m: (xs[m] - x) ** 2 + (ys[m] - y) ** 2)
+                line = Line.from_points(corner(i), corner(anchor)).normalized()
+                # Recomputing C from the point itself avoids the cancellation in from_points
+                line = Line(line.a, line.b, -(line.a * x + line.b * y))
+                on = line.contains_many(array.take(remaining), tol)
+                on_line = sorted([i, anchor] + [m for m, inside in zip(remaining, on) if inside and m != anchor])
+                remaining = [m for m, inside in zip(remaining, on) if not inside and m != anchor]
+                if len(on_line) < k:
+                    continue
+                for m in on_line:
+                    through[m].add(len(lines))
+                lines.append((line, [corner(m) for m in on_line]))
+    return lines
@@ -0,0 +1,448 @@
+# geometry/index.py
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from math import floor
+from typing import Iterable
+
+from .basics import Point, CompactPoint
+from .arrays import PointArray
+from .circle import Circle
+from .triangle import Triangle
+
+
+class _GridIndex(ABC):
+    """A uniform grid over the bounding boxes of shapes.
+
+    Every shape is registered in each grid cell its bounding box touches, so a query only
+    looks at the shapes sharing a cell with it. A shape whose box touches more than
+    `_max_cells` cells is kept in an oversize set instead, which every query scans, so a
+    few huge shapes among many small ones don't fill millions of cells. Subclasses define
+    the bounding box of the shapes they hold and the exact test run on the candidates.
+
+    Attributes:
+        cell_size (float): The side length of one grid cell.
+    """
+
+    # The most cells a shape is registered in before it counts as oversize
+    _max_cells = 64
+
+    def __init__(self, cell_size: float):
+        """Initializes an empty grid index.
+
+        Args:
+            cell_size (float): The side length of one grid cell.
+
+        Raises:
+            ValueError: If cell_size isn't positive.
+        """
+        if not cell_size > 0:
+            raise ValueError("Cell size must be positive")
+        self.cell_size = cell_size
+        self._items: dict[int, object] = {}
+        self._ranges: dict[int, tuple[int, int, int, int]] = {}
+        self._slots: dict[int, int] = {}
+        self._cells: dict[tuple[int, int], set[int]] = {}
+        self._oversize: set[int] = set()
+        self._next_slot = 0
+
+    @staticmethod
+    @abstractmethod
+    def _bbox(item) -> tuple[float, float, float, float]:
+        """Calculates the bounding box of a shape.
+
+        Args:
+            item: The shape.
+
+        Returns:
+            tuple[float, float, float, float]: The box as (xmin, ymin, xmax, ymax).
+        """
+
+    @classmethod
+    def _suggest_cell_size(cls, items: list) -> float:
+        """Picks a cell size close to the median bounding box side of the shapes.
+
+        The median isn't pulled up by a few huge shapes, which end up oversize instead.
+
+        Args:
+            items (list): The shapes to be indexed.
+
+        Returns:
+            float: A positive cell size.
+        """
+        sides = []
+        for item in items:
+            xmin, ymin, xmax, ymax = cls._bbox(item)
+            sides.append(max(xmax - xmin, ymax - ymin))
+        sides.sort()
+        median = sides[len(sides) // 2] if sides else 0.0
+        return median if median > 0 else 1.0
+
+    @classmethod
+    def build(cls, items: Iterable, cell_size: float | None = None):
+        """Builds an index over many shapes at once.
+
+        Args:
+            items (Iterable): The shapes to index.
+            cell_size (float | None): The side length of one grid cell. If None, the
+                median bounding box side of the shapes is used.
+
+        Returns:
+            The new index holding all the shapes.
+        """
+        items = list(items)
+        index = cls(cell_size if cell_size is not None else cls._suggest_cell_size(items))
+        for item in items:
+            index.insert(item)
+        return index
+
+    def _cell_range(self, xmin: float, ymin: float, xmax: float, ymax: float) -> tuple[int, int, int, int]:
+        """Converts a box into the range of grid cells it touches.
+
+        Returns:
+            tuple[int, int, int, int]: The first and last cell columns and rows, inclusive.
+        """
+        size = self.cell_size
+        return floor(xmin / size), floor(ymin / size), floor(xmax / size), floor(ymax / size)
+
+    def _is_oversize(self, cell_range: tuple[int, int, int, int]) -> bool:
+        """Checks if a cell range covers too many cells to register a shape in each."""
+        i0, j0, i1, j1 = cell_range
+        return (i1 - i0 + 1) * (j1 - j0 + 1) > self._max_cells
+
+    def _register(self, slot: int, cell_range: tuple[int, int, int, int]) -> None:
+        """Adds a slot to every cell of a cell range, or to the oversize set."""
+        if self._is_oversize(cell_range):
+            self._oversize.add(slot)
+            return
+        cells = self._cells
+        i0, j0, i1, j1 = cell_range
+        for i in range(i0, i1 + 1):
+            for j in range(j0, j1 + 1):
+                cell = cells.get((i, j))
+                if cell is None:
+                    cells[(i, j)] = {slot}
+                else:
+                    cell.add(slot)
+
+    def _unregister(self, slot: int, cell_range: tuple[int, int, int, int]) -> None:
+        """Removes a slot from every cell of a cell range, or from the oversize set."""
+        if self._is_oversize(cell_range):
+            self._oversize.discard(slot)
+            return
+        cells = self._cells
+        i0, j0, i1, j1 = cell_range
+        for i in range(i0, i1 + 1):
+            for j in range(j0, j1 + 1):
+                cell = cells[(i, j)]
+                cell.discard(slot)
+                if not cell:
+                    del cells[(i, j)]
+
+    def insert(self, item) -> None:
+        """Adds a shape to the index.
+
+        Args:
+            item: The shape to add.
+
+        Raises:
+            ValueError: If the shape is already in the index.
+        """
+        if id(item) in self._slots:
+            raise ValueError("The shape is already in the index")
+        slot = self._next_slot
+        self._next_slot += 1
+        cell_range = self._cell_range(*self._bbox(item))
+        self._items[slot] = item
+        self._slots[id(item)] = slot
+        self._ranges[slot] = cell_range
+        self._register(slot, cell_range)
+
+    def remove(self, item) -> None:
+        """Removes a shape from the index.
+
+        Args:
+            item: The shape to remove.
+
+        Raises:
+            KeyError: If the shape isn't in the index.
+        """
+        slot = self._slots.pop(id(item))
+        self._unregister(slot, self._ranges.pop(slot))
+        del self._items[slot]
+
+    def update(self, item) -> bool:
+        """Moves a shape to the cells matching its current bounding box.
+
+        Call this after a shape in the index has been moved or resized. Shapes that
+        stayed within the same cells, or stayed oversize, cost nothing to update.
+
+        Args:
+            item: The shape that changed.
+
+        Returns:
+            bool: True if the shape had to change cells, False otherwise.
+
+        Raises:
+            KeyError: If the shape isn't in the index.
+        """
+        slot = self._slots[id(item)]
+        old_range = self._ranges[slot]
+        new_range = self._cell_range(*self._bbox(item))
+        if new_range == old_range:
+            return False
+        if self._is_oversize(old_range) and self._is_oversize(new_range):
+            # Oversize shapes aren't in any cell, so there is nothing to move
+            self._ranges[slot] = new_range
+            return False
+        self._unregister(slot, old_range)
+        self._register(slot, new_range)
+        self._ranges[slot] = new_range
+        return True
+
+    def _rect_candidates(self, xmin: float, ymin: float, xmax: float, ymax: float) -> list[int]:
+        """Finds the slots of all shapes sharing a cell with a box, and of all oversize shapes, in insertion order."""
+        cells = self._cells
+        i0, j0, i1, j1 = self._cell_range(xmin, ymin, xmax, ymax)
+        found = set(self._oversize)
+        if (i1 - i0 + 1) * (j1 - j0 + 1) > len(cells):
+            # The box covers more cells than are occupied, walk the occupied ones instead
+            for (i, j), cell in cells.items():
+                if i0 <= i <= i1 and j0 <= j <= j1:
+                    found |= cell
+            return sorted(found)
+        for i in range(i0, i1 + 1):
+            for j in range(j0, j1 + 1):
+                cell = cells.get((i, j))
+                if cell:
+                    found |= cell
+        return sorted(found)
+
+    def query_rect(self, xmin: float, ymin: float, xmax: float, ymax: float) -> list:
+        """Finds every shape whose bounding box overlaps a rectangle.
+
+        Args:
+            xmin (float): The left edge of the rectangle.
+            ymin (float): The bottom edge of the rectangle.
+            xmax (float): The right edge of the rectangle.
+            ymax (float): The top edge of the rectangle.
+
+        Returns:
+            list: The overlapping shapes, in insertion order.
+        """
+        result = []
+        for slot in self._rect_candidates(xmin, ymin, xmax, ymax):
+            item = self._items[slot]
+            bxmin, bymin, bxmax, bymax = self._bbox(item)
+            if bxmin <= xmax and xmin <= bxmax and bymin <= ymax and ymin <= bymax:
+                result.append(item)
+        return result
+
+    def _point_slots(self, x: float, y: float) -> list[int]:
+        """Finds the slots of all shapes registered in the cell containing a point, and of all
+        oversize shapes, in insertion order."""
+        size = self.cell_size
+        cell = self._cells.get((floor(x / size), floor(y / size)))
+        if self._oversize:
+            return sorted(cell | self._oversize if cell else self._oversize)
+        return sorted(cell) if cell else []
+
+    def _point_candidates(self, x: float, y: float) -> list:
+        """Finds all shapes registered in the cell containing a point, in insertion order."""
+        items = self._items
+        return [items[slot] for slot in self._point_slots(x, y)]
+
+    def __len__(self) -> int:
+        """Returns the number of shapes in the index.
+
+        Returns:
+            int: The number of shapes.
+        """
+        return len(self._items)
+
+    def __iter__(self):
+        """Iterates over the shapes in insertion order."""
+        items = self._items
+        return (items[slot] for slot in sorted(items))
+
+
+class CircleIndex(_GridIndex):
+    """A spatial index answering "which circles contain this point" queries.
+
+    Query cost grows with the number of circles sharing the grid cell of the point,
+    not with the total number of circles.
+    """
+
+    @staticmethod
+    def _bbox(circle: Circle) -> tuple[float, float, float, float]:
+        """Calculates the bounding box of a circle.
+
+        Args:
+            circle (Circle): The circle.
+
+        Returns:
+            tuple[float, float, float, float]: The box as (xmin, ymin, xmax, ymax).
+        """
+        x, y, r = circle.center.x, circle.center.y, circle.radius
+        return x - r, y - r, x + r, y + r
+
+    def query_point(self, P: Point, include_points_on_boundary: bool = True) -> list[Circle]:
+        """Finds every circle containing a point.
+
+        Args:
+            P (Point): The query point.
+            include_points_on_boundary (bool): If True, circles passing exactly through the
+                point count as containing it. Defaults to True.
+
+        Returns:
+            list[Circle]: The circles containing the point, in insertion order.
+        """
+        return [circle for circle in self._point_candidates(P.x, P.y)
+                if circle.contains(P, include_points_on_boundary)]
+
+    def query_points(self, points: PointArray | Iterable[Point],
+                     include_points_on_boundary: bool = True) -> list[list[Circle]]:
+        """Finds the circles containing each of many points.
+
+        Args:
+            points (PointArray | Iterable[Point]): The query points.
+            include_points_on_boundary (bool): If True, circles passing exactly through a
+                point count as containing it. Defaults to True.
+
+        Returns:
+            list[list[Circle]]: For every point, the circles containing it.
+        """
+        points = PointArray.coerce(points)
+        result = []
+        for x, y in zip(points.x, points.y):
+            candidates = self._point_candidates(x, y)
+            if candidates:
+                P = CompactPoint('', x, y)
+                result.append([circle for circle in candidates
+                               if circle.contains(P, include_points_on_boundary)])
+            else:
+                result.append([])
+        return result
+
+
+class TriangleIndex(_GridIndex):
+    """A point-location index over a collection of triangles, such as a mesh or zones.
+
+    Each query only tests the triangles sharing the grid cell of the point, so lookups
+    cost roughly constant time per query instead of a scan over all triangles.
+    Triangles are identified by their insertion number, which for an index made with
+    `build` is their position in the given collection. The side functions of every
+    triangle are kept with the index, so `update` must be called after a triangle moves.
+    """
+
+    def __init__(self, cell_size: float):
+        """Initializes an empty triangle index.
+
+        Args:
+            cell_size (float): The side length of one grid cell.
+
+        Raises:
+            ValueError: If cell_size isn't positive.
+        """
+        super().__init__(cell_size)
+        self._sides: dict[int, tuple | None] = {}
+
+    def insert(self, item: Triangle) -> None:
+        """Adds a triangle to the index.
+
+        Args:
+            item (Triangle): The triangle to add.
+
+        Raises:
+            ValueError: If the triangle is already in the index.
+        """
+        super().insert(item)
+        self._sides[self._slots[id(item)]] = item._side_functions()
+
+    def remove(self, item: Triangle) -> None:
+        """Removes a triangle from the index.
+
+        Args:
+            item (Triangle): The triangle to remove.
+
+        Raises:
+            KeyError: If the triangle isn't in the index.
+        """
+        del self._sides[self._slots[id(item)]]
+        super().remove(item)
+
+    def update(self, item: Triangle) -> bool:
+        """Refreshes a triangle after it has been moved or reshaped.
+
+        Args:
+            item (Triangle): The triangle that changed.
+
+        Returns:
+            bool: True if the triangle had to change cells, False otherwise.
+
+        Raises:
+            KeyError: If the triangle isn't in the index.
+        """
+        self._sides[self._slots[id(item)]] = item._side_functions()
+        return super().update(item)
+
+    def _locate(self, x: float, y: float, include_points_on_boundary: bool) -> int:
+        """Finds the first triangle containing the point at the given coordinates, or -1."""
+        for slot in self._point_slots(x, y):
+            sides = self._sides[slot]
+            if sides is None:
+                if self._items[slot]._contains_coordinates(x, y, include_points_on_boundary):
+                    return slot
+                continue
+            (x1, y1, u1, v1), (x2, y2, u2, v2), (x3, y3, u3, v3) = sides
+            if include_points_on_boundary:
+                if (u1 * (y - y1) - v1 * (x - x1) >= 0 and u2 * (y - y2) - v2 * (x - x2) >= 0
+                        and u3 * (y - y3) - v3 * (x - x3) >= 0):
+                    return slot
+            elif (u1 * (y - y1) - v1 * (x - x1) > 0 and u2 * (y - y2) - v2 * (x - x2) > 0
+                  and u3 * (y - y3) - v3 * (x - x3) > 0):
+                return slot
+        return -1
+
+    @staticmethod
+    def _bbox(triangle: Triangle) -> tuple[float, float, float, float]:
+        """Calculates the bounding box of a triangle.
+
+        Args:
+            triangle (Triangle): The triangle.
+
+        Returns:
+            tuple[float, float, float, float]: The box as (xmin, ymin, xmax, ymax).
+        """
+        xs = (triangle.A.x, triangle.B.x, triangle.C.x)
+        ys = (triangle.A.y, triangle.B.y, triangle.C.y)
+        return min(xs), min(ys), max(xs), max(ys)
+
+    def query_point(self, P: Point, include_points_on_boundary: bool = True) -> int:
+        """Finds the triangle containing a point.
+
+        Args:
+            P (Point): The query point.
+            include_points_on_boundary (bool): If True, points on a triangle's sides count
+                as contained. Defaults to True.
+
+        Returns:
+            int: The number of the first triangle containing the point, or -1 if none does.
+        """
+        return self._locate(P.x, P.y, include_points_on_boundary)
+
+    def query_points(self, points: PointArray | Iterable[Point],
+                     include_points_on_boundary: bool = True) -> list[int]:
+        """Finds the triangle containing each of many points.
+
+        Args:
+            points (PointArray | Iterable[Point]): The query points.
+            include_points_on_boundary (bool): If True, points on a triangle's sides count
+                as contained. Defaults to True.
+
+        Returns:
+            list[int]: For every point, the number of the first triangle containing it,
+                or -1 if none does.
+        """
+        points = PointArray.coerce(points)
+        locate = self._locate
+        return [locate(x, y, include_points_on_boundary) for x, y in zip(points.x, points.y)]
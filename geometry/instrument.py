@@ -0,0 +1,255 @@
+# geometry/instrument.py
+from __future__ import annotations
+import marshal
+import sys
+from contextlib import contextmanager
+from functools import wraps
+from time import perf_counter_ns
+from typing import Iterable, Iterator
+
+from .basics import Point, GetDistance, Areas
+from .circle import Circle
+from .line import Line
+from .square import Square
+from .triangle import Triangle
+
+# The hot paths instrumented when no targets are given, as (owner, attribute name) pairs
+DEFAULT_TARGETS = (
+    (GetDistance, 'between_points'),
+    (GetDistance, 'point_to_line'),
+    (Line, 'distance_to_point'),
+    (Point, 'format'),
+    (Circle, 'contains'),
+    (Areas.Triangle, 'Heron'),
+    (Square, '__init__'),
+    (Square, 'check_validity'),
+    (Triangle, '__init__'),
+)
+
+# The (owner, name) pairs currently replaced by a wrapper, so two instrumentations can't stack
+_patched: set[tuple[int, str]] = set()
+
+
+class _Counters:
+    """The measurements of one instrumented function."""
+    __slots__ = ('calls', 'total_ns', 'own_ns', 'blocks', 'callers')
+
+    def __init__(self):
+        self.calls = 0
+        self.total_ns = 0
+        self.own_ns = 0
+        self.blocks = 0
+        # For every instrumented caller: [calls, total_ns, own_ns]
+        self.callers: dict[str, list[int]] = {}
+
+
+class Instrumentation:
+    """Counts calls, time and memory blocks spent in chosen functions.
+
+    While enabled, every target attribute is replaced by a wrapper recording the number
+    of calls, the cumulative time (perf_counter_ns), the time spent outside other
+    instrumented functions, the net number of memory blocks allocated
+    (sys.getallocatedblocks) and which instrumented function called it. Disabling puts
+    the original attributes back, so instrumentation costs nothing when it's off.
+
+    Static methods, class methods, properties (timing the getter) and plain methods can
+    be instrumented. Time and blocks of recursive calls are counted at every level.
+
+    Attributes:
+        targets (list[tuple[object, str]]): The instrumented (owner, attribute name) pairs.
+        enabled (bool): Whether the wrappers are currently installed.
+        stats (dict): The measurements in the layout of pstats, see `create_stats`.
+    """
+
+    def __init__(self, targets: Iterable[tuple[object, str]] | None = None):
+        """Initializes a disabled Instrumentation.
+
+        Args:
+            targets (Iterable[tuple[object, str]] | None): The (owner, attribute name)
+                pairs to instrument, e.g. (GetDistance, 'between_points'). Defaults to
+                DEFAULT_TARGETS.
+
+        Raises:
+            AttributeError: If an owner doesn't define the attribute itself.
+        """
+        self.targets = list(DEFAULT_TARGETS if targets is None else targets)
+        self.enabled = False
+        self.stats: dict = {}
+        self._originals: dict[tuple[int, str], object] = {}
+        self._keys: dict[str, tuple[str, int, str]] = {}
+        self._counters: dict[str, _Counters] = {}
+        self._stack: list[list] = []
+        for owner, name in self.targets:
+            if name not in vars(owner):
+                raise AttributeError(f"{owner.__qualname__} doesn't define {name}")
+            label = self._label(owner, name)
+            code = self._function(vars(owner)[name]).__code__
+            self._keys[label] = (code.co_filename, code.co_firstlineno, code.co_name)
+            self._counters[label] = _Counters()
+
+    @staticmethod
+    def _label(owner: object, name: str) -> str:
+        """Builds the report name of a target, e.g. "GetDistance.between_points"."""
+        return f"{owner.__qualname__}.{name}"
+
+    @staticmethod
+    def _function(raw: object):
+        """Gets the plain function behind a class attribute."""
+        if isinstance(raw, (staticmethod, classmethod)):
+            return raw.__func__
+        if isinstance(raw, property):
+            return raw.fget
+        return raw
+
+    def _wrap(self, label: str, function):
+        """Builds the wrapper measuring calls to a function."""
+        counters = self._counters[label]
+        stack = self._stack
+        blocks = sys.getallocatedblocks
+
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            frame = [label, 0]
+            stack.append(frame)
+            allocated = blocks()
+            start = perf_counter_ns()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                elapsed = perf_counter_ns() - start
+                counters.blocks += blocks() - allocated
+                stack.pop()
+                own = elapsed - frame[1]
+                counters.calls += 1
+                counters.total_ns += elapsed
+                counters.own_ns += own
+                if stack:
+                    parent = stack[-1]
+                    parent[1] += elapsed
+                    caller = counters.callers.get(parent[0])
+                    if caller is None:
+                        counters.callers[parent[0]] = [1, elapsed, own]
+                    else:
+                        caller[0] += 1
+                        caller[1] += elapsed
+                        caller[2] += own
+        return wrapper
+
+    def enable(self) -> None:
+        """Installs the wrappers on every target.
+
+        Raises:
+            RuntimeError: If a target is already instrumented by another Instrumentation.
+        """
+        if self.enabled:
+            return
+        for owner, name in self.targets:
+            if (id(owner), name) in _patched:
+                raise RuntimeError(f"{self._label(owner, name)} is already instrumented")
+        for owner, name in self.targets:
+            raw = vars(owner)[name]
+            wrapper = self._wrap(self._label(owner, name), self._function(raw))
+            if isinstance(raw, staticmethod):
+                patched = staticmethod(wrapper)
+            elif isinstance(raw, classmethod):
+                patched = classmethod(wrapper)
+            elif isinstance(raw, property):
+                patched = property(wrapper, raw.fset, raw.fdel, raw.__doc__)
+            else:
+                patched = wrapper
+            self._originals[(id(owner), name)] = raw
+            _patched.add((id(owner), name))
+            setattr(owner, name, patched)
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Puts the original attributes back. The measurements are kept."""
+        if not self.enabled:
+            return
+        for owner, name in self.targets:
+            setattr(owner, name, self._originals.pop((id(owner), name)))
+            _patched.discard((id(owner), name))
+        self.enabled = False
+
+    def reset(self) -> None:
+        """Clears the measurements."""
+        for label in self._counters:
+            self._counters[label] = _Counters()
+        if self.enabled:
+            # The installed wrappers hold the old counters, install fresh ones
+            self.disable()
+            self.enable()
+
+    def as_dict(self) -> dict[str, dict]:
+        """Gets the measurements as plain data.
+
+        Returns:
+            dict[str, dict]: For every target, keyed by "Owner.name": the number of
+                calls, the cumulative and own time in nanoseconds, the net number of
+                allocated memory blocks and the calls per instrumented caller.
+        """
+        return {label: {'calls': counters.calls, 'total_ns': counters.total_ns, 'own_ns': counters.own_ns,
+                        'allocated_blocks': counters.blocks,
+                        'callers': {caller: values[0] for caller, values in counters.callers.items()}}
+                for label, counters in self._counters.items()}
+
+    def create_stats(self) -> None:
+        """Builds the `stats` attribute in the layout of cProfile.Profile.
+
+        The layout is {(file, line, function): (primitive calls, calls, own seconds,
+        cumulative seconds, callers)}, which lets `pstats.Stats(instrumentation)` read
+        the measurements directly.
+        """
+        keys = self._keys
+        self.stats = {}
+        for label, counters in self._counters.items():
+            if not counters.calls:
+                continue
+            callers = {keys[caller]: (values[0], values[0], values[2] / 1e9, values[1] / 1e9)
+                       for caller, values in counters.callers.items()}
+            self.stats[keys[label]] = (counters.calls, counters.calls, counters.own_ns / 1e9,
+                                             counters.total_ns / 1e9, callers)
+
+    def dump_stats(self, path: str) -> None:
+        """Writes the measurements to a file readable by pstats.Stats.
+
+        Args:
+            path (str): The file to write.
+        """
+        self.create_stats()
+        with open(path, 'wb') as stream:
+            marshal.dump(self.stats, stream)
+
+    def __enter__(self) -> Instrumentation:
+        """Enables the instrumentation for the body of a with statement."""
+        self.enable()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        """Disables the instrumentation at the end of a with statement."""
+        self.disable()
+
+
+@contextmanager
+def profile(targets: Iterable[tuple[object, str]] | None = None) -> Iterator[Instrumentation]:
+    """Instruments hot paths for the duration of a with block.
+
+    Example:
+        with profile() as report:
+            run_job()
+        print(report.as_dict()['GetDistance.between_points']['calls'])
+        pstats.Stats(report).sort_stats('cumulative').print_stats()
+
+    Args:
+        targets (Iterable[tuple[object, str]] | None): The (owner, attribute name) pairs
+            to instrument. Defaults to DEFAULT_TARGETS.
+
+    Yields:
+        Instrumentation: The enabled instrumentation, holding the report afterwards.
+    """
+    instrumentation = Instrumentation(targets)
+    instrumentation.enable()
+    try:
+        yield instrumentation
+    finally:
+        instrumentation.disable()
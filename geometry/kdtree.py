@@ -0,0 +1,269 @@
+# geometry/kdtree.py
+from __future__ import annotations
+from heapq import heappush, heappop, heapreplace
+from math import sqrt
+from typing import Iterable
+
+from .basics import Point
+from .arrays import PointArray
+from .circle import Circle
+
+
+class KDTree:
+    """A static KD-tree over a collection of points for neighbourhood queries.
+
+    The tree is bulk-loaded once, splitting every node at the median of its widest
+    coordinate, and stores small buckets of points in its leaves. Radius and k-nearest
+    neighbour queries then only visit the nodes that can hold an answer.
+
+    Attributes:
+        leaf_size (int): The largest number of points stored in one leaf.
+    """
+
+    def __init__(self, points: PointArray | Iterable[Point], leaf_size: int = 16):
+        """Builds a KDTree over the given points.
+
+        Args:
+            points (PointArray | Iterable[Point]): The points to index. Queries return the
+                same Point objects when a sequence of Points is given.
+            leaf_size (int): The largest number of points stored in one leaf. Defaults to 16.
+
+        Raises:
+            ValueError: If leaf_size isn't positive.
+        """
+        if leaf_size <= 0:
+            raise ValueError("leaf_size must be positive")
+        self.leaf_size = leaf_size
+
+        if isinstance(points, PointArray):
+            self._objects = None
+            self._array = points
+        else:
+            self._objects = list(points)
+            self._array = PointArray.from_points(self._objects)
+
+        # Node columns: the slice of self._order covered by the node, its children
+        # (-1 in leaves) and its bounding box
+        self._start: list[int] = []
+        self._end: list[int] = []
+        self._left: list[int] = []
+        self._right: list[int] = []
+        self._box: list[tuple[float, float, float, float]] = []
+        self._order = list(range(len(self._array)))
+        if self._order:
+            self._build()
+
+    def _build(self) -> None:
+        """Splits the points into nodes until every leaf is small enough."""
+        xs, ys, order = self._array.x, self._array.y, self._order
+        stack = [(0, len(order), self._new_node(0, len(order)))]
+        while stack:
+            start, end, node = stack.pop()
+            if end - start <= self.leaf_size:
+                continue
+            xmin, ymin, xmax, ymax = self._box[node]
+            column = xs if xmax - xmin >= ymax - ymin else ys
+            order[start:end] = sorted(order[start:end], key=column.__getitem__)
+            middle = (start + end) // 2
+            left = self._new_node(start, middle)
+            right = self._new_node(middle, end)
+            self._left[node], self._right[node] = left, right
+            stack.append((start, middle, left))
+            stack.append((middle, end, right))
+
+    def _new_node(self, start: int, end: int) -> int:
+        """Appends a leaf node covering a slice of the point order.
+
+        Returns:
+            int: The number of the new node.
+        """
+        xs, ys = self._array.x, self._array.y
+        members = self._order[start:end]
+        node_xs = [xs[i] for i in members]
+        node_ys = [ys[i] for i in members]
+        self._start.append(start)
+        self._end.append(end)
+        self._left.append(-1)
+        self._right.append(-1)
+        self._box.append((min(node_xs), min(node_ys), max(node_xs), max(node_ys)))
+        return len(self._start) - 1
+
+    def _point(self, index: int) -> Point:
+        """Returns the indexed point at a given position of the input."""
+        if self._objects is not None:
+            return self._objects[index]
+        return self._array.point(index)
+
+    def __len__(self) -> int:
+        """Returns the number of points in the tree.
+
+        Returns:
+            int: The number of points.
+        """
+        return len(self._order)
+
+    def radius_indices(self, x: float, y: float, radius: float, inclusive: bool = True) -> list[int]:
+        """Finds the input positions of all points within a distance of a location.
+
+        A point at exactly `radius` is decided the same way Circle.contains decides it.
+
+        Args:
+            x (float): The x-coordinate of the query location.
+            y (float): The y-coordinate of the query location.
+            radius (float): The search radius.
+            inclusive (bool): If True, points at exactly `radius` are included. Defaults to True.
+
+        Returns:
+            list[int]: The positions of the matching points in the input, in ascending order.
+        """
+        if not self._order:
+            return []
+        xs, ys, order = self._array.x, self._array.y, self._order
+        radius_squared = radius * radius
+        band = radius_squared * 1e-12
+        low, high = radius_squared - band, radius_squared + band
+
+        found = []
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            xmin, ymin, xmax, ymax = self._box[node]
+            dx = xmin - x if x < xmin else (x - xmax if x > xmax else 0.0)
+            dy = ymin - y if y < ymin else (y - ymax if y > ymax else 0.0)
+            if dx * dx + dy * dy > high:
+                continue
+            if self._left[node] != -1:
+                stack.append(self._left[node])
+                stack.append(self._right[node])
+                continue
+            for i in order[self._start[node]:self._end[node]]:
+                squared = ((x - xs[i]) ** 2) + (y - ys[i]) ** 2
+                if squared < low:
+                    found.append(i)
+                elif squared <= high:
+                    distance = sqrt(squared)
+                    if distance <= radius if inclusive else distance < radius:
+                        found.append(i)
+        found.sort()
+        return found
+
+    def knn_indices(self, x: float, y: float, k: int) -> list[tuple[int, float]]:
+        """Finds the input positions of the k points closest to a location.
+
+        Args:
+            x (float): The x-coordinate of the query location.
+            y (float): The y-coordinate of the query location.
+            k (int): The number of neighbours to find.
+
+        Returns:
+            list[tuple[int, float]]: Pairs of input position and distance, nearest first.
+                Ties are broken by input position.
+        """
+        if k <= 0 or not self._order:
+            return []
+        xs, ys, order = self._array.x, self._array.y, self._order
+        # Max-heap of the best candidates so far, stored as (-squared distance, -position)
+        best: list[tuple[float, int]] = []
+        nodes = [(0.0, 0)]
+        while nodes:
+            bound, node = heappop(nodes)
+            if len(best) == k and bound > -best[0][0]:
+                break
+            if self._left[node] != -1:
+                for child in (self._left[node], self._right[node]):
+                    xmin, ymin, xmax, ymax = self._box[child]
+                    dx = xmin - x if x < xmin else (x - xmax if x > xmax else 0.0)
+                    dy = ymin - y if y < ymin else (y - ymax if y > ymax else 0.0)
+                    heappush(nodes, (dx * dx + dy * dy, child))
+                continue
+            for i in order[self._start[node]:self._end[node]]:
+                candidate = (-(((x - xs[i]) ** 2) + (y - ys[i]) ** 2), -i)
+                if len(best) < k:
+                    heappush(best, candidate)
+                elif candidate > best[0]:
+                    heapreplace(best, candidate)
+        return [(-i, sqrt(-squared)) for squared, i in sorted(best, reverse=True)]
+
+    def query_radius(self, P: Point, radius: float, inclusive: bool = True) -> list[Point]:
+        """Finds all points within a distance of a point.
+
+        Args:
+            P (Point): The query point.
+            radius (float): The search radius.
+            inclusive (bool): If True, points at exactly `radius` are included. Defaults to True.
+
+        Returns:
+            list[Point]: The matching points, in input order.
+        """
+        return [self._point(i) for i in self.radius_indices(P.x, P.y, radius, inclusive)]
+
+    def query_knn(self, P: Point, k: int) -> list[Point]:
+        """Finds the k points closest to a point.
+
+        Args:
+            P (Point): The query point.
+            k (int): The number of neighbours to find.
+
+        Returns:
+            list[Point]: Up to k points, nearest first.
+        """
+        return [self._point(i) for i, _ in self.knn_indices(P.x, P.y, k)]
+
+    def query_circle(self, circle: Circle, include_points_on_boundary: bool = True) -> list[Point]:
+        """Finds all points contained in a circle.
+
+        Gives the same answer as calling `circle.contains` on every indexed point.
+
+        Args:
+            circle (Circle): The circle to search.
+            include_points_on_boundary (bool): If True, points exactly on the
+                circle's circumference are included. Defaults to True.
+
+        Returns:
+            list[Point]: The contained points, in input order.
+        """
+        return self.query_radius(circle.center, circle.radius, include_points_on_boundary)
+
+    def query_radius_many(self, points: PointArray | Iterable[Point], radius: float,
+                          inclusive: bool = True) -> list[list[Point]]:
+        """Finds the points within a distance of each of many query points.
+
+        Args:
+            points (PointArray | Iterable[Point]): The query points.
+            radius (float): The search radius.
+            inclusive (bool): If True, points at exactly `radius` are included. Defaults to True.
+
+        Returns:
+            list[list[Point]]: For every query point, the matching points in input order.
+        """
+        points = PointArray.coerce(points)
+        return [[self._point(i) for i in self.radius_indices(x, y, radius, inclusive)]
+                for x, y in zip(points.x, points.y)]
+
+    def query_knn_many(self, points: PointArray | Iterable[Point], k: int) -> list[list[Point]]:
+        """Finds the k closest points to each of many query points.
+
+        Args:
+            points (PointArray | Iterable[Point]): The query points.
+            k (int): The number of neighbours to find.
+
+        Returns:
+            list[list[Point]]: For every query point, up to k points nearest first.
+        """
+        points = PointArray.coerce(points)
+        return [[self._point(i) for i, _ in self.knn_indices(x, y, k)]
+                for x, y in zip(points.x, points.y)]
+
+    def query_circles(self, circles: Iterable[Circle],
+                      include_points_on_boundary: bool = True) -> list[list[Point]]:
+        """Finds the points contained in each of many circles.
+
+        Args:
+            circles (Iterable[Circle]): The circles to search.
+            include_points_on_boundary (bool): If True, points exactly on a
+                circle's circumference are included. Defaults to True.
+
+        Returns:
+            list[list[Point]]: For every circle, the contained points in input order.
+        """
+        return [self.query_circle(circle, include_points_on_boundary) for circle in circles]
@@ -1,5 +1,12 @@
 # geometry/line.py
 from __future__ import annotations
+from array import array
+from math import sqrt
+from typing import Iterable
+
+from .basics import Point, GetDistance
+from .arrays import PointArray
+
 
 class Line:
     """Represents a line in a 2D coordinate system.
@@ -11,6 +18,9 @@ class Line:
         b (float): The coefficient 'B' in the line equation.
         c (float): The coefficient 'C' in the line equation.
     """
+    TOLERANCE: float = 1e-9
+    """The tolerance used when comparing and hashing lines."""
+
     def __init__(self, a: float, b: float, c: float):
         """Initializes a Line object.
 
@@ -39,6 +49,7 @@ class Line:
             value (float): The new 'A' coefficient.
         """
         self._a = value
+        self._norm = None
 
     @property
     def b(self) -> float:
@@ -56,6 +67,7 @@ class Line:
             value (float): The new 'B' coefficient.
         """
         self._b = value
+        self._norm = None
 
     @property
     def c(self) -> float:
@@ -73,6 +85,18 @@ class Line:
             value (float): The new 'C' coefficient.
         """
         self._c = value
+        self._norm = None
+
+    @property
+    def norm(self) -> float:
+        """Gets the length of the normal vector (A, B), computed once per set of coefficients.
+
+        Returns:
+            float: The value of sqrt(A^2 + B^2).
+        """
+        if self._norm is None:
+            self._norm = sqrt(self.a ** 2 + self.b ** 2)
+        return self._norm
 
     @property
     def slope(self) -> float:
@@ -85,6 +109,69 @@ class Line:
             return -self.a / self.b
         return float('inf')  # Vertical line
 
+    def normalized(self) -> Line:
+        """Creates the canonical form of this line.
+
+        The coefficients are scaled so that A^2 + B^2 = 1 and the sign is chosen so that
+        A > 0, or B > 0 for horizontal lines. Any two equations of the same line have
+        the same canonical form, up to rounding.
+
+        Returns:
+            Line: A new, normalised Line object.
+
+        Raises:
+            ValueError: If A and B are both zero, as such an equation isn't a line.
+        """
+        norm = self.norm
+        if norm == 0:
+            raise ValueError("A and B can't both be zero")
+        a, b, c = self.a / norm, self.b / norm, self.c / norm
+        if a < 0 or (a == 0 and b < 0):
+            a, b, c = -a, -b, -c
+        return Line(a, b, c)
+
+    def key(self, tol: float | None = None) -> tuple[int, int, int]:
+        """Gets a hashable key identifying the line up to a tolerance.
+
+        The canonical coefficients are rounded to multiples of the tolerance, so equations
+        of the same line give the same key.
+
+        Args:
+            tol (float | None): The rounding step. Defaults to `Line.TOLERANCE`.
+
+        Returns:
+            tuple[int, int, int]: The rounded canonical coefficients.
+        """
+        tol = self.TOLERANCE if tol is None else tol
+        if self.norm == 0:
+            return 0, 0, round(self.c / tol)
+        a, b, c = (self.a / self.norm, self.b / self.norm, self.c / self.norm)
+        # Decide the sign on the rounded A, so nearly horizontal lines can't flip
+        if round(a / tol) < 0 or (round(a / tol) == 0 and b < 0):
+            a, b, c = -a, -b, -c
+        return round(a / tol), round(b / tol), round(c / tol)
+
+    def __eq__(self, other: object) -> bool:
+        """Checks if two Line objects describe the same line, up to `Line.TOLERANCE`.
+
+        Args:
+            other (object): The object to compare against.
+
+        Returns:
+            bool: True if both equations describe the same line, False otherwise.
+        """
+        if not isinstance(other, Line):
+            return NotImplemented
+        return self.key() == other.key()
+
+    def __hash__(self) -> int:
+        """Returns a hash consistent with `__eq__`.
+
+        Returns:
+            int: The hash of the line's key.
+        """
+        return hash(self.key())
+
     def __str__(self) -> str:
         """Returns a string representation of the line equation.
 
@@ -163,7 +250,6 @@ class Line:
         Returns:
             float: The perpendicular distance from the line to the point.
         """
-        from .basics import GetDistance
         return GetDistance.point_to_line(P, self)
 
     def contains_point(self, P: 'Point') -> bool:
@@ -177,6 +263,88 @@ class Line:
         """
         return (self.a * P.x + self.b * P.y + self.c) == 0
 
+    def _residuals(self, points: PointArray) -> list[float]:
+        """Evaluates Ax + By + C for every point of an array.
+
+        Args:
+            points (PointArray): The points to evaluate.
+
+        Returns:
+            list[float]: The value of the line equation at every point.
+        """
+        a, b, c = self.a, self.b, self.c
+        return [a * x + b * y + c for x, y in zip(points.x, points.y)]
+
+    def distances(self, points: PointArray | Iterable[Point]) -> array:
+        """Calculates the shortest distance from this line to each of many points.
+
+        Args:
+            points (PointArray | Iterable[Point]): The points to measure.
+
+        Returns:
+            array: The perpendicular distances, as an `array('d')`.
+        """
+        norm = self.norm
+        return array('d', [abs(value) / norm for value in self._residuals(PointArray.coerce(points))])
+
+    def sides(self, points: PointArray | Iterable[Point]) -> list[int]:
+        """Tells on which side of this line each of many points lies.
+
+        Args:
+            points (PointArray | Iterable[Point]): The points to classify.
+
+        Returns:
+            list[int]: For every point, 1 if Ax + By + C > 0, -1 if it is negative and
+                0 if the point lies exactly on the line.
+        """
+        return [(value > 0) - (value < 0) for value in self._residuals(PointArray.coerce(points))]
+
+    def contains_many(self, points: PointArray | Iterable[Point], tol: float = 0.0) -> list[bool]:
+        """Checks which of many points lie on this line.
+
+        Args:
+            points (PointArray | Iterable[Point]): The points to check.
+            tol (float): The largest perpendicular distance still considered on the line.
+                Defaults to 0, which matches `contains_point`.
+
+        Returns:
+            list[bool]: For every point, True if it is on the line, False otherwise.
+        """
+        limit = tol * self.norm
+        return [abs(value) <= limit for value in self._residuals(PointArray.coerce(points))]
+
+    @staticmethod
+    def distance_matrix(lines: Iterable[Line], points: PointArray | Iterable[Point]) -> list[array]:
+        """Calculates the distance from each of many lines to each of many points.
+
+        Args:
+            lines (Iterable[Line]): The lines, indexing the rows of the matrix.
+            points (PointArray | Iterable[Point]): The points, indexing the columns.
+
+        Returns:
+            list[array]: One `array('d')` of distances to every point for every line.
+        """
+        points = PointArray.coerce(points)
+        return [line.distances(points) for line in lines]
+
+    def intersection(self, other: 'Line', letter: chr = 'I') -> Point | None:
+        """Calculates the point where this line crosses another line.
+
+        Args:
+            other (Line): The other Line object.
+            letter (chr): The letter designation for the intersection point. Defaults to 'I'.
+
+        Returns:
+            Point | None: The intersection point, or None if the lines are parallel
+                (including when they coincide).
+        """
+        determinant = self.a * other.b - other.a * self.b
+        if determinant == 0:
+            return None
+        x = (self.b * other.c - other.b * self.c) / determinant
+        y = (other.a * self.c - self.a * other.c) / determinant
+        return Point(letter, x, y)
+
     def is_perpendicular(self, other: 'Line') -> bool:
         """Checks if this line is perpendicular to another line.
 
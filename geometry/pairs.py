@@ -0,0 +1,180 @@
+# geometry/pairs.py
+from __future__ import annotations
+from typing import Callable, Iterable
+
+from .basics import Point, GetDistance
+from .arrays import PointArray
+from .polygon import convex_hull_indices
+
+PointPair = tuple[Point, Point, float]
+
+
+def _prepare(points: PointArray | Iterable[Point]) -> tuple[PointArray, Callable[[int], Point]]:
+    """Converts the input to a PointArray and a function returning the Point at a position.
+
+    Raises:
+        ValueError: If fewer than two points are given.
+    """
+    if isinstance(points, PointArray):
+        array, point = points, points.point
+    else:
+        objects = list(points)
+        array, point = PointArray.from_points(objects), objects.__getitem__
+    if len(array) < 2:
+        raise ValueError("At least two points are needed to form a pair")
+    return array, point
+
+
+def _result(point: Callable[[int], Point], i: int, j: int) -> PointPair:
+    """Builds the returned tuple for the pair of points at positions i and j."""
+    A, B = point(i), point(j)
+    return A, B, GetDistance.between_points(A, B)
+
+
+def closest_pair(points: PointArray | Iterable[Point]) -> PointPair:
+    """Finds the two points closest to each other with divide and conquer.
+
+    The points are split in halves by x-coordinate, each half is solved recursively and
+    only the points in a narrow strip around the split can form a closer pair across it.
+    Runs in O(n log n) time.
+
+    Args:
+        points (PointArray | Iterable[Point]): The points to search.
+
+    Returns:
+        PointPair: The two closest points and the distance between them.
+
+    Raises:
+        ValueError: If fewer than two points are given.
+    """
+    array, point = _prepare(points)
+    xs, ys = array.x, array.y
+
+    def solve(by_x: list[int]) -> tuple[float, int, int, list[int]]:
+        """Returns the best squared distance, its pair and the positions sorted by y."""
+        if len(by_x) <= 3:
+            best = (float('inf'), -1, -1)
+            for a in range(len(by_x)):
+                for b in range(a + 1, len(by_x)):
+                    i, j = by_x[a], by_x[b]
+                    squared = (xs[i] - xs[j]) ** 2 + (ys[i] - ys[j]) ** 2
+                    if squared < best[0]:
+                        best = (squared, i, j)
+            return best[0], best[1], best[2], sorted(by_x, key=ys.__getitem__)
+
+        middle = len(by_x) // 2
+        split = xs[by_x[middle]]
+        left = solve(by_x[:middle])
+        right = solve(by_x[middle:])
+        best, i_best, j_best = min(left[:3], right[:3])
+
+        # Merge the halves by y-coordinate
+        by_y, a, b = [], 0, 0
+        left_y, right_y = left[3], right[3]
+        while a < len(left_y) and b < len(right_y):
+            if ys[left_y[a]] <= ys[right_y[b]]:
+                by_y.append(left_y[a])
+                a += 1
+            else:
+                by_y.append(right_y[b])
+                b += 1
+        by_y.extend(left_y[a:])
+        by_y.extend(right_y[b:])
+
+        strip = [i for i in by_y if (xs[i] - split) ** 2 < best]
+        for a in range(len(strip)):
+            i = strip[a]
+            for b in range(a + 1, len(strip)):
+                j = strip[b]
+                dy = ys[j] - ys[i]
+                if dy * dy >= best:
+                    break
+                squared = (xs[i] - xs[j]) ** 2 + dy * dy
+                if squared < best:
+                    best, i_best, j_best = squared, i, j
+        return best, i_best, j_best, by_y
+
+    _, i, j, _ = solve(sorted(range(len(array)), key=lambda k: (xs[k], ys[k])))
+    return _result(point, i, j)
+
+
+def farthest_pair(points: PointArray | Iterable[Point]) -> PointPair:
+    """Finds the two points farthest from each other (the diameter of the set).
+
+    The farthest pair always lies on the convex hull, whose antipodal vertex pairs are
+    walked with rotating calipers. Runs in O(n log n) time, dominated by the hull.
+
+    Args:
+        points (PointArray | Iterable[Point]): The points to search.
+
+    Returns:
+        PointPair: The two farthest points and the distance between them.
+
+    Raises:
+        ValueError: If fewer than two points are given.
+    """
+    array, point = _prepare(points)
+    xs, ys = array.x, array.y
+    hull = convex_hull_indices(array)
+    if len(hull) == 1:
+        # All points coincide
+        return _result(point, 0, 1)
+
+    def squared(i: int, j: int) -> float:
+        """Returns the squared distance between two positions."""
+        return (xs[i] - xs[j]) ** 2 + (ys[i] - ys[j]) ** 2
+
+    def twice_area(i: int, j: int, k: int) -> float:
+        """Returns twice the area of the triangle at three positions."""
+        return abs((xs[j] - xs[i]) * (ys[k] - ys[i]) - (ys[j] - ys[i]) * (xs[k] - xs[i]))
+
+    count = len(hull)
+    best = (squared(hull[0], hull[1]), hull[0], hull[1])
+    k = 1
+    for a in range(count):
+        i, i_next = hull[a], hull[(a + 1) % count]
+        # Advance the caliper to the vertex farthest from the edge i -> i_next
+        while twice_area(i, i_next, hull[(k + 1) % count]) > twice_area(i, i_next, hull[k]):
+            k = (k + 1) % count
+        for candidate in ((squared(i, hull[k]), i, hull[k]), (squared(i_next, hull[k]), i_next, hull[k])):
+            if candidate[0] > best[0]:
+                best = candidate
+    return _result(point, best[1], best[2])
+
+
+def closest_pair_brute(points: PointArray | Iterable[Point]) -> PointPair:
+    """Finds the two closest points by comparing every pair, as a reference for testing.
+
+    Args:
+        points (PointArray | Iterable[Point]): The points to search.
+
+    Returns:
+        PointPair: The two closest points and the distance between them.
+
+    Raises:
+        ValueError: If fewer than two points are given.
+    """
+    array, point = _prepare(points)
+    xs, ys = array.x, array.y
+    _, i, j = min(((xs[i] - xs[j]) ** 2 + (ys[i] - ys[j]) ** 2, i, j)
+                  for i in range(len(array)) for j in range(i + 1, len(array)))
+    return _result(point, i, j)
+
+
+def farthest_pair_brute(points: PointArray | Iterable[Point]) -> PointPair:
+    """Finds the two farthest points by comparing every pair, as a reference for testing.
+
+    Args:
+        points (PointArray | Iterable[Point]): The points to search.
+
+    Returns:
+        PointPair: The two farthest points and the distance between them.
+
+    Raises:
+        ValueError: If fewer than two points are given.
+    """
+    array, point = _prepare(points)
+    xs, ys = array.x, array.y
+    _, i, j = max(((xs[i] - xs[j]) ** 2 + (ys[i] - ys[j]) ** 2, i, j)
+                  for i in range(len(array)) for j in range(i + 1, len(array)))
+    return _result(point, i, j)
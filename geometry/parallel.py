@@ -0,0 +1,181 @@
+# geometry/parallel.py
+from __future__ import annotations
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Callable, Iterable, Sequence
+
+from .arrays import PointArray
+from .basics import Point
+from .circle import Circle
+from .triangle import Triangle
+from .triangle_batch import TriangleBatch
+
+
+def _run_chunk(task: tuple) -> None:
+    """Runs a kernel over one chunk of the shared input columns and stores its results.
+
+    Every chunk writes to its own positions of the shared output, so the merged result
+    doesn't depend on the order in which the chunks finish.
+    """
+    source_name, target_name, count, n_columns, start, stop, kernel, args, typecode = task
+    source, target = SharedMemory(source_name), SharedMemory(target_name)
+    data = source.buf.cast('d')
+    output = target.buf.cast(typecode)
+    columns = [data[column * count + start:column * count + stop] for column in range(n_columns)]
+    try:
+        output[start:stop] = array(typecode, kernel(*columns, *args))
+    finally:
+        for view in columns:
+            view.release()
+        data.release()
+        output.release()
+        source.close()
+        target.close()
+
+
+def _triangle_areas(ax: Sequence[float], ay: Sequence[float], bx: Sequence[float], by: Sequence[float],
+                    cx: Sequence[float], cy: Sequence[float]) -> array:
+    """Kernel computing the areas of the triangles in six coordinate columns."""
+    return TriangleBatch(ax, ay, bx, by, cx, cy).areas()
+
+
+def _circle_contains(x: Sequence[float], y: Sequence[float], center_x: float, center_y: float, radius: float,
+                     include_points_on_boundary: bool) -> list[bool]:
+    """Kernel checking which points of two coordinate columns a circle contains."""
+    return Circle(Point('O', center_x, center_y), radius).contains_many(PointArray(x, y), include_points_on_boundary)
+
+
+class ParallelExecutor:
+    """Runs batch geometry kernels over a pool of worker processes.
+
+    The input columns are copied once into a shared memory block, and the workers read
+    their chunk straight from it and write their results into a shared output block, so
+    no Point objects or coordinate lists are pickled. Inputs smaller than the serial
+    threshold are processed in the calling process, where starting the workers would
+    cost more than it saves.
+
+    Attributes:
+        processes (int): The number of worker processes.
+        chunk_size (int): The number of elements per task.
+        serial_threshold (int): The smallest input size processed in parallel.
+    """
+
+    def __init__(self, processes: int | None = None, chunk_size: int = 65536, serial_threshold: int = 200_000):
+        """Initializes a ParallelExecutor. The worker processes start on first use.
+
+        Args:
+            processes (int | None): The number of worker processes. Defaults to the
+                number of CPUs.
+            chunk_size (int): The number of elements per task. Defaults to 65536.
+            serial_threshold (int): The smallest input size processed in parallel.
+                Defaults to 200000.
+
+        Raises:
+            ValueError: If processes or chunk_size isn't positive.
+        """
+        if processes is None:
+            processes = os.cpu_count() or 1
+        if processes < 1:
+            raise ValueError("processes must be positive")
+        self.processes = processes
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+        self.chunk_size = chunk_size
+        self.serial_threshold = serial_threshold
+        self._pool: ProcessPoolExecutor | None = None
+
+    def map_columns(self, kernel: Callable[..., Iterable[float]], columns: Sequence[Sequence[float]],
+                    args: tuple = (), typecode: str = 'd') -> array:
+        """Runs a kernel over chunks of equally long columns and concatenates the results.
+
+        Args:
+            kernel (Callable[..., Iterable[float]]): A module-level function taking one
+                slice per column followed by args, and returning one value per element.
+            columns (Sequence[Sequence[float]]): The input columns of floats.
+            args (tuple): Extra arguments passed to every kernel call. Defaults to ().
+            typecode (str): The array typecode of the results, 'd' for floats or 'B' for
+                booleans. Defaults to 'd'.
+
+        Returns:
+            array: The results, in input order.
+
+        Raises:
+            ValueError: If the columns don't all have the same length.
+        """
+        if len({len(column) for column in columns}) > 1:
+            raise ValueError("All columns must have the same length")
+        count = len(columns[0]) if columns else 0
+        if count < self.serial_threshold or self.processes == 1:
+            return array(typecode, kernel(*columns, *args))
+
+        item_size = array(typecode).itemsize
+        source = SharedMemory(create=True, size=8 * count * len(columns))
+        target = SharedMemory(create=True, size=item_size * count)
+        try:
+            data = source.buf.cast('d')
+            for position, column in enumerate(columns):
+                data[position * count:(position + 1) * count] = array('d', column)
+            data.release()
+
+            tasks = [(source.name, target.name, count, len(columns), start, min(start + self.chunk_size, count),
+                      kernel, args, typecode) for start in range(0, count, self.chunk_size)]
+            for _ in self._get_pool().map(_run_chunk, tasks):
+                pass
+            return array(typecode, target.buf[:item_size * count].tobytes())
+        finally:
+            source.close()
+            source.unlink()
+            target.close()
+            target.unlink()
+
+    def triangle_areas(self, triangles: TriangleBatch | Iterable[Triangle]) -> array:
+        """Calculates the area of many triangles.
+
+        Args:
+            triangles (TriangleBatch | Iterable[Triangle]): The triangles.
+
+        Returns:
+            array: The areas, as an `array('d')`, in input order.
+        """
+        if not isinstance(triangles, TriangleBatch):
+            triangles = TriangleBatch.from_triangles(triangles)
+        return self.map_columns(_triangle_areas, triangles._columns())
+
+    def circle_contains(self, circle: Circle, points: PointArray | Iterable[Point],
+                        include_points_on_boundary: bool = True) -> list[bool]:
+        """Checks which of many points a circle contains, like `Circle.contains_many`.
+
+        Args:
+            circle (Circle): The circle.
+            points (PointArray | Iterable[Point]): The points to check.
+            include_points_on_boundary (bool): If True, points exactly on the circle's
+                boundary are considered inside. Defaults to True.
+
+        Returns:
+            list[bool]: For every point, True if the circle contains it.
+        """
+        points = PointArray.coerce(points)
+        args = (circle.center.x, circle.center.y, circle.radius, include_points_on_boundary)
+        return [bool(inside) for inside in self.map_columns(_circle_contains, (points.x, points.y), args, 'B')]
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Starts the worker processes if they aren't running yet."""
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(self.processes)
+        return self._pool
+
+    def close(self) -> None:
+        """Stops the worker processes."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self) -> ParallelExecutor:
+        """Returns the executor for use in a with statement."""
+        return self
+
+    def __exit__(self, *exc) -> None:
+        """Stops the worker processes at the end of a with statement."""
+        self.close()
@@ -0,0 +1,342 @@
+# geometry/pipeline.py
+"""Streams shape records from files, measures them chunk by chunk and writes the results.
+
+A record is a shape kind followed by its numbers:
+
+    point     x, y
+    line      a, b, c             (the line a*x + b*y + c = 0)
+    circle    x, y, radius
+    triangle  ax, ay, bx, by, cx, cy
+    square    ax, ay, bx, by, cx, cy, dx, dy
+
+Records can be stored as CSV rows (kind first, an optional header row starting with
+"kind"), NDJSON objects ({"kind": ..., "values": [...]}) or fixed-size binary records
+(see RECORD). Every stage is a generator working on chunks of records, so memory use
+depends on the chunk size and not on the size of the input.
+"""
+from __future__ import annotations
+import csv
+import json
+import struct
+from itertools import islice
+from typing import IO, Iterable, Iterator, NamedTuple
+
+from .arrays import PointArray
+from .basics import Point
+from .circle import Circle
+from .line import Line
+from .square import Square
+from .triangle import Triangle
+from .triangle_batch import TriangleBatch
+
+KINDS = ('point', 'line', 'circle', 'triangle', 'square')
+ARITY = {'point': 2, 'line': 3, 'circle': 3, 'triangle': 6, 'square': 8}
+METRICS = ('area', 'perimeter', 'contains')
+FORMATS = ('csv', 'ndjson', 'binary')
+
+# A binary record: the position of the kind in KINDS, then eight float64 values, unused ones zero
+RECORD = struct.Struct('<B8d')
+
+
+class Record(NamedTuple):
+    """One shape read from an input file.
+
+    Attributes:
+        index (int): The position of the record in the input, starting at 0.
+        kind (str): The kind of shape, one of KINDS.
+        values (tuple[float, ...]): The numbers describing the shape.
+    """
+    index: int
+    kind: str
+    values: tuple[float, ...]
+
+
+def guess_format(path: str) -> str:
+    """Guesses the record format from a file name.
+
+    Args:
+        path (str): The file name.
+
+    Returns:
+        str: 'ndjson' for .ndjson and .jsonl files, 'binary' for .bin files, 'csv' otherwise.
+    """
+    lowered = path.lower()
+    if lowered.endswith(('.ndjson', '.jsonl')):
+        return 'ndjson'
+    if lowered.endswith('.bin'):
+        return 'binary'
+    return 'csv'
+
+
+def _record(index: int, kind: str, values: Iterable[float]) -> Record:
+    """Validates and builds a record.
+
+    Raises:
+        ValueError: If the kind is unknown, a value isn't a number or the number of values
+            doesn't match the kind.
+    """
+    if kind not in ARITY:
+        raise ValueError(f"Record {index}: unknown shape kind {kind!r}")
+    try:
+        values = tuple(float(value) for value in values)
+    except (TypeError, ValueError) as error:
+        raise ValueError(f"Record {index}: values must be numbers ({error})") from None
+    if len(values) != ARITY[kind]:
+        raise ValueError(f"Record {index}: a {kind} needs {ARITY[kind]} values, got {len(values)}")
+    return Record(index, kind, values)
+
+
+def _read_csv(stream: IO[str]) -> Iterator[Record]:
+    """Reads records from CSV rows."""
+    index = 0
+    for row in csv.reader(stream):
+        if not row or row[0].startswith('#') or (index == 0 and row[0].strip().lower() == 'kind'):
+            continue
+        yield _record(index, row[0].strip().lower(), (value for value in row[1:] if value.strip()))
+        index += 1
+
+
+def _read_ndjson(stream: IO[str]) -> Iterator[Record]:
+    """Reads records from NDJSON lines."""
+    index = 0
+    for line in stream:
+        if not line.strip():
+            continue
+        try:
+            item = json.loads(line)
+        except ValueError as error:
+            raise ValueError(f"Record {index}: invalid JSON ({error})") from None
+        if not isinstance(item, dict) or 'kind' not in item or not isinstance(item.get('values'), list):
+            raise ValueError(f"Record {index}: expected an object with a 'kind' and a 'values' list")
+        yield _record(index, str(item['kind']).lower(), item['values'])
+        index += 1
+
+
+def _read_binary(stream: IO[bytes], chunk_size: int) -> Iterator[Record]:
+    """Reads fixed-size binary records, chunk_size at a time."""
+    index = 0
+    size = RECORD.size
+    while True:
+        block = stream.read(size * chunk_size)
+        if not block:
+            return
+        if len(block) % size:
+            raise ValueError("The binary input ends with an incomplete record")
+        for code, *values in RECORD.iter_unpack(block):
+            if code >= len(KINDS):
+                raise ValueError(f"Record {index}: unknown shape code {code}")
+            kind = KINDS[code]
+            yield Record(index, kind, tuple(values[:ARITY[kind]]))
+            index += 1
+
+
+def read_records(stream: IO, fmt: str = 'csv', chunk_size: int = 65536) -> Iterator[list[Record]]:
+    """Reads records from a file in chunks.
+
+    Args:
+        stream (IO): The open input, in text mode for 'csv' and 'ndjson' and in binary
+            mode for 'binary'.
+        fmt (str): The record format, one of FORMATS. Defaults to 'csv'.
+        chunk_size (int): The number of records per chunk. Defaults to 65536.
+
+    Yields:
+        list[Record]: The next chunk of at most chunk_size records.
+
+    Raises:
+        ValueError: If the format is unknown, chunk_size isn't positive or a record is invalid.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+    if fmt == 'csv':
+        records = _read_csv(stream)
+    elif fmt == 'ndjson':
+        records = _read_ndjson(stream)
+    elif fmt == 'binary':
+        records = _read_binary(stream, chunk_size)
+    else:
+        raise ValueError(f"Unknown format {fmt!r}, expected one of {', '.join(FORMATS)}")
+    while True:
+        chunk = list(islice(records, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def write_binary_records(records: Iterable[tuple[str, Iterable[float]]], stream: IO[bytes]) -> int:
+    """Writes shapes as fixed-size binary records.
+
+    Args:
+        records (Iterable[tuple[str, Iterable[float]]]): The kind and values of every shape.
+        stream (IO[bytes]): The open output, in binary mode.
+
+    Returns:
+        int: The number of records written.
+    """
+    count = 0
+    for kind, values in records:
+        record = _record(count, kind, values)
+        stream.write(RECORD.pack(KINDS.index(kind), *record.values, *([0.0] * (8 - len(record.values)))))
+        count += 1
+    return count
+
+
+def build_shape(record: Record):
+    """Builds the shape object described by a record.
+
+    Args:
+        record (Record): The record.
+
+    Returns:
+        Point | Line | Circle | Triangle | Square: The shape.
+
+    Raises:
+        Exception: If the values don't describe a valid shape (see Square).
+    """
+    v = record.values
+    if record.kind == 'point':
+        return Point('P', v[0], v[1])
+    if record.kind == 'line':
+        return Line(v[0], v[1], v[2])
+    if record.kind == 'circle':
+        return Circle(Point('O', v[0], v[1]), v[2])
+    if record.kind == 'triangle':
+        return Triangle(Point('A', v[0], v[1]), Point('B', v[2], v[3]), Point('C', v[4], v[5]))
+    return Square(Point('A', v[0], v[1]), Point('B', v[2], v[3]), Point('C', v[4], v[5]), Point('D', v[6], v[7]))
+
+
+def measure(chunk: list[Record], metrics: Iterable[str] = ('area', 'perimeter'),
+            points: PointArray | Iterable[Point] | None = None) -> list[dict]:
+    """Computes metrics for one chunk of records.
+
+    Triangles are measured together from coordinate columns (a TriangleBatch); other
+    shapes are built as objects. Metrics that don't apply to a kind (the area of a
+    line, for example) are None. Records describing an invalid shape get an 'error'
+    entry instead of failing the whole stream.
+
+    Args:
+        chunk (list[Record]): The records to measure.
+        metrics (Iterable[str]): The metrics to compute, among METRICS. Defaults to
+            area and perimeter.
+        points (PointArray | Iterable[Point] | None): The query points for the
+            'contains' metric.
+
+    Returns:
+        list[dict]: One result per record, in chunk order, with the index, the kind and
+            every requested metric. 'contains' is a list of booleans, one per query point.
+
+    Raises:
+        ValueError: If a metric is unknown.
+    """
+    metrics = tuple(metrics)
+    for metric in metrics:
+        if metric not in METRICS:
+            raise ValueError(f"Unknown metric {metric!r}, expected one of {', '.join(METRICS)}")
+    if 'contains' in metrics:
+        points = PointArray.coerce(points if points is not None else [])
+    results = [dict({'index': record.index, 'kind': record.kind}, **{metric: None for metric in metrics})
+               for record in chunk]
+
+    triangles = [i for i, record in enumerate(chunk) if record.kind == 'triangle']
+    if triangles and ('area' in metrics or 'perimeter' in metrics):
+        batch = TriangleBatch(*zip(*(chunk[i].values for i in triangles)))
+        areas, perimeters = batch.areas_and_perimeters()
+        for i, area, perimeter in zip(triangles, areas, perimeters):
+            if 'area' in metrics:
+                results[i]['area'] = area
+            if 'perimeter' in metrics:
+                results[i]['perimeter'] = perimeter
+
+    for record, result in zip(chunk, results):
+        if record.kind == 'triangle' and 'contains' not in metrics:
+            continue
+        try:
+            shape = build_shape(record)
+        except Exception as error:
+            result['error'] = str(error)
+            continue
+        if record.kind == 'circle':
+            if 'area' in metrics:
+                result['area'] = shape.area
+            if 'perimeter' in metrics:
+                result['perimeter'] = shape.circumference
+        elif record.kind == 'square':
+            if 'area' in metrics:
+                result['area'] = shape.area
+            if 'perimeter' in metrics:
+                result['perimeter'] = shape.perimeter
+        if 'contains' in metrics:
+            if record.kind == 'line':
+                result['contains'] = shape.contains_many(points, 1e-9)
+            elif record.kind != 'point':
+                result['contains'] = shape.contains_many(points)
+    return results
+
+
+def write_results(results: Iterable[list[dict]], stream: IO[str], fmt: str = 'csv',
+                  metrics: Iterable[str] = ('area', 'perimeter')) -> int:
+    """Writes measured chunks as they arrive.
+
+    Args:
+        results (Iterable[list[dict]]): The measured chunks.
+        stream (IO[str]): The open output, in text mode.
+        fmt (str): 'csv' or 'ndjson'. Defaults to 'csv'.
+        metrics (Iterable[str]): The metric columns of the CSV output. Defaults to area
+            and perimeter.
+
+    Returns:
+        int: The number of results written.
+
+    Raises:
+        ValueError: If the format is unknown.
+    """
+    metrics = tuple(metrics)
+    count = 0
+    if fmt == 'ndjson':
+        for chunk in results:
+            stream.writelines(json.dumps(result) + '\n' for result in chunk)
+            stream.flush()
+            count += len(chunk)
+        return count
+    if fmt != 'csv':
+        raise ValueError(f"Unknown output format {fmt!r}, expected csv or ndjson")
+
+    def cell(value) -> str:
+        """Formats one CSV cell, containment as a string of 0 and 1 per query point."""
+        if value is None:
+            return ''
+        if isinstance(value, list):
+            return ''.join('1' if inside else '0' for inside in value)
+        return repr(value)
+
+    writer = csv.writer(stream, lineterminator='\n')
+    writer.writerow(('index', 'kind') + metrics + ('error',))
+    for chunk in results:
+        writer.writerows([result['index'], result['kind'], *(cell(result[metric]) for metric in metrics),
+                          result.get('error', '')] for result in chunk)
+        stream.flush()
+        count += len(chunk)
+    return count
+
+
+def run(source: IO, destination: IO[str], input_format: str = 'csv', output_format: str = 'csv',
+        metrics: Iterable[str] = ('area', 'perimeter'), points: Iterable[Point] | None = None,
+        chunk_size: int = 65536) -> int:
+    """Streams records from source to destination, measuring them chunk by chunk.
+
+    Args:
+        source (IO): The open input (binary mode for the 'binary' format).
+        destination (IO[str]): The open output, in text mode.
+        input_format (str): The record format, one of FORMATS. Defaults to 'csv'.
+        output_format (str): 'csv' or 'ndjson'. Defaults to 'csv'.
+        metrics (Iterable[str]): The metrics to compute, among METRICS. Defaults to
+            area and perimeter.
+        points (Iterable[Point] | None): The query points for the 'contains' metric.
+        chunk_size (int): The number of records per chunk. Defaults to 65536.
+
+    Returns:
+        int: The number of records processed.
+    """
+    metrics = tuple(metrics)
+    query = PointArray.coerce(points if points is not None else [])
+    chunks = read_records(source, input_format, chunk_size)
+    return write_results((measure(chunk, metrics, query) for chunk in chunks), destination, output_format, metrics)
@@ -0,0 +1,272 @@
+# geometry/polygon.py
+from __future__ import annotations
+from math import fsum
+from typing import Iterable
+from weakref import ref
+
+from .basics import Point, GetDistance, General, _CachedCorners, _derived
+from .arrays import PointArray
+
+
+def convex_hull_indices(points: PointArray) -> list[int]:
+    """Finds the convex hull of a point array with Andrew's monotone chain algorithm.
+
+    Works directly on the coordinate columns, so no Point objects are created.
+    Runs in O(n log n) time.
+
+    Args:
+        points (PointArray): The points to wrap.
+
+    Returns:
+        list[int]: The positions of the hull vertices, counter-clockwise, starting from the
+            lowest-leftmost point. Collinear points on the hull edges are left out.
+    """
+    xs, ys = points.x, points.y
+    order = sorted(range(len(points)), key=lambda i: (xs[i], ys[i]))
+
+    def chain(indices: list[int]) -> list[int]:
+        """Builds the half of the hull that turns counter-clockwise over the sorted points."""
+        hull: list[int] = []
+        for i in indices:
+            x, y = xs[i], ys[i]
+            while len(hull) >= 2:
+                a, b = hull[-2], hull[-1]
+                if (xs[b] - xs[a]) * (y - ys[a]) - (ys[b] - ys[a]) * (x - xs[a]) > 0:
+                    break
+                hull.pop()
+            hull.append(i)
+        return hull
+
+    lower = chain(order)
+    upper = chain(order[::-1])
+    hull = lower[:-1] + upper[:-1]
+    # Fewer than two distinct points leave both chains with a single vertex
+    return hull or order[:1]
+
+
+class _VertexList(list):
+    """A list of vertices that tells its polygon when it changes.
+
+    This lets a Polygon's cached values notice vertices being added, removed or
+    replaced in place, like they notice a vertex being moved.
+    """
+
+    __slots__ = ('_owner',)
+
+    def __init__(self, vertices: Iterable[Point] = ()):
+        """Initializes the list without a polygon to tell."""
+        super().__init__(vertices)
+        self._owner = None
+
+    def __reduce__(self):
+        """Pickles and copies the vertices only, the polygon registers again on use."""
+        return _VertexList, (list(self),)
+
+    def _changed(self) -> None:
+        """Tells the polygon that the vertices changed."""
+        polygon = self._owner and self._owner()
+        if polygon is not None:
+            polygon._forget()
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self._changed()
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._changed()
+
+    def __iadd__(self, values):
+        super().__iadd__(values)
+        self._changed()
+        return self
+
+    def __imul__(self, count):
+        super().__imul__(count)
+        self._changed()
+        return self
+
+    def append(self, vertex):
+        super().append(vertex)
+        self._changed()
+
+    def extend(self, vertices):
+        super().extend(vertices)
+        self._changed()
+
+    def insert(self, index, vertex):
+        super().insert(index, vertex)
+        self._changed()
+
+    def pop(self, index=-1):
+        vertex = super().pop(index)
+        self._changed()
+        return vertex
+
+    def remove(self, vertex):
+        super().remove(vertex)
+        self._changed()
+
+    def clear(self):
+        super().clear()
+        self._changed()
+
+    def sort(self, *, key=None, reverse=False):
+        super().sort(key=key, reverse=reverse)
+        self._changed()
+
+    def reverse(self):
+        super().reverse()
+        self._changed()
+
+
+class Polygon(_CachedCorners):
+    """Represents a simple polygon defined by its vertices in order.
+
+    Derived values (points, lengths, perimeter and area) are computed on first access
+    and cached until one of the vertices changes.
+
+    Attributes:
+        vertices (list[Point]): The vertices of the polygon, in order around it.
+        points (list[str]): A list of formatted string representations of the vertices.
+        lengths (list[float]): The lengths of the sides, starting with the first vertex.
+        perimeter (float): The perimeter of the polygon.
+        area (float): The area of the polygon, calculated with the shoelace formula.
+    """
+
+    def __init__(self, vertices: Iterable[Point]):
+        """Initializes a Polygon object.
+
+        Args:
+            vertices (Iterable[Point]): The vertices of the polygon, in order around it.
+
+        Raises:
+            ValueError: If fewer than three vertices are given.
+        """
+        self.vertices = vertices
+        if len(self.vertices) < 3:
+            raise ValueError("A polygon needs at least three vertices")
+
+    @property
+    def vertices(self) -> list[Point]:
+        """Gets the vertices of the polygon.
+
+        Returns:
+            list[Point]: The vertices, in order around the polygon. Changing this list
+                updates the cached values like moving a vertex does.
+        """
+        return self._vertices
+
+    @vertices.setter
+    def vertices(self, value: Iterable[Point]) -> None:
+        """Replaces the vertices of the polygon.
+
+        Args:
+            value (Iterable[Point]): The new vertices, in order around the polygon.
+        """
+        self._vertices = _VertexList(value)
+        self._forget()
+
+    @classmethod
+    def convex_hull(cls, points: PointArray | Iterable[Point]) -> Polygon:
+        """Builds the convex hull of a set of points.
+
+        Args:
+            points (PointArray | Iterable[Point]): The points to wrap. A PointArray is
+                processed without creating a Point object per input point.
+
+        Returns:
+            Polygon: The hull, with counter-clockwise vertices. When Point objects are
+                given, the hull uses them.
+
+        Raises:
+            ValueError: If the points don't span a region (fewer than three hull vertices).
+        """
+        if isinstance(points, PointArray):
+            return cls(points.point(i) for i in convex_hull_indices(points))
+        points = list(points)
+        return cls(points[i] for i in convex_hull_indices(PointArray.from_points(points)))
+
+    def _corners(self) -> list[Point]:
+        """Gets the vertices of the polygon."""
+        return self._vertices
+
+    def _watch_corners(self) -> bool:
+        """Registers the polygon with its vertices and its vertex list, see `_CachedCorners`."""
+        watched = self._watched
+        if watched is None:
+            watched = super()._watch_corners()
+            self._vertices._owner = ref(self)
+        return watched
+
+    @_derived
+    def points(self) -> list[str]:
+        """Gets the formatted string representations of the vertices.
+
+        Returns:
+            list[str]: A list of strings, each representing a vertex (e.g., "A(0; 0)").
+        """
+        return [vertex.format for vertex in self.vertices]
+
+    @_derived
+    def lengths(self) -> list[float]:
+        """Gets the lengths of the sides of the polygon.
+
+        Returns:
+            list[float]: The length of the side from every vertex to the next one.
+        """
+        return self.get_side_lengths()
+
+    @_derived
+    def perimeter(self) -> float:
+        """Gets the perimeter of the polygon.
+
+        Returns:
+            float: The sum of the side lengths.
+        """
+        return General.get_perimeter(self.lengths)
+
+    @_derived
+    def signed_area(self) -> float:
+        """Gets the signed area of the polygon, calculated with the shoelace formula.
+
+        Returns:
+            float: The area, positive for counter-clockwise vertices and negative otherwise.
+        """
+        return self._shoelace()
+
+    @property
+    def area(self) -> float:
+        """Gets the area of the polygon.
+
+        Returns:
+            float: The area of the polygon.
+        """
+        return abs(self.signed_area)
+
+    def get_side_lengths(self) -> list[float]:
+        """Calculates the lengths of the sides of the polygon.
+
+        Returns:
+            list[float]: The length of the side from every vertex to the next one.
+        """
+        vertices = self.vertices
+        return [GetDistance.between_points(A, B) for A, B in zip(vertices, vertices[1:] + vertices[:1])]
+
+    def _shoelace(self) -> float:
+        """Calculates the signed area of the polygon in one pass over its vertices."""
+        vertices = self.vertices
+        # Coordinates are taken relative to the first vertex to limit cancellation
+        x0, y0 = vertices[0].x, vertices[0].y
+        xs = [vertex.x - x0 for vertex in vertices]
+        ys = [vertex.y - y0 for vertex in vertices]
+        return fsum(xs[i - 1] * ys[i] - xs[i] * ys[i - 1] for i in range(len(xs))) / 2
+
+    def __str__(self) -> str:
+        """Returns a string representation of the Polygon object.
+
+        Returns:
+            str: A descriptive string including the vertices of the polygon.
+        """
+        res: str = f"POLYGON defined with vertices {self.points}."
+        return res
@@ -0,0 +1,217 @@
+# geometry/raster.py
+from __future__ import annotations
+from array import array
+from itertools import repeat
+from math import ceil, floor, sqrt
+from operator import add
+from typing import Iterable, Iterator
+
+from .circle import Circle
+from .square import Square
+from .triangle import Triangle
+
+MODES = ('count', 'max', 'boolean')
+
+
+class Rasterizer:
+    """Renders Circle, Triangle and Square shapes onto a pixel grid.
+
+    A pixel is covered by a shape if its center lies inside the shape or on its boundary.
+    Instead of testing every pixel, each shape is cut into one span of covered pixels per
+    row, and whole spans are written at once.
+
+    Rows are arrays: array('d') in the 'count' and 'max' modes and bytearray in the
+    'boolean' mode. Row j spans the y-range [ymin + j * pixel_size, ymin + (j+1) * pixel_size].
+
+    Attributes:
+        xmin (float): The left edge of the grid.
+        ymin (float): The bottom edge of the grid.
+        pixel_size (float): The side length of one pixel.
+        width (int): The number of pixels per row.
+        height (int): The number of rows.
+        mode (str): How shapes covering the same pixel combine. 'count' adds up their
+            weights, 'max' keeps the largest weight and 'boolean' marks covered pixels.
+    """
+
+    def __init__(self, xmin: float, ymin: float, pixel_size: float, width: int, height: int,
+                 mode: str = 'count'):
+        """Initializes a Rasterizer for a grid.
+
+        Args:
+            xmin (float): The left edge of the grid.
+            ymin (float): The bottom edge of the grid.
+            pixel_size (float): The side length of one pixel.
+            width (int): The number of pixels per row.
+            height (int): The number of rows.
+            mode (str): 'count', 'max' or 'boolean'. Defaults to 'count'.
+
+        Raises:
+            ValueError: If pixel_size isn't positive, the grid size is negative or the mode
+                is unknown.
+        """
+        if not pixel_size > 0:
+            raise ValueError("Pixel size must be positive")
+        if width < 0 or height < 0:
+            raise ValueError("The grid size can't be negative")
+        if mode not in MODES:
+            raise ValueError(f"Unknown mode {mode!r}, expected one of {', '.join(MODES)}")
+        self.xmin, self.ymin, self.pixel_size = xmin, ymin, pixel_size
+        self.width, self.height, self.mode = width, height, mode
+
+    def _empty_row(self):
+        """Creates a row with no pixel covered."""
+        if self.mode == 'boolean':
+            return bytearray(self.width)
+        return array('d', bytes(8 * self.width))
+
+    def _rows_between(self, low: float, high: float) -> tuple[int, int]:
+        """Finds the rows whose centers lie within a y-range, clipped to the grid."""
+        size = self.pixel_size
+        first = max(ceil((low - self.ymin) / size - 0.5), 0)
+        last = min(floor((high - self.ymin) / size - 0.5), self.height - 1)
+        return first, last
+
+    def _columns_between(self, low: float, high: float) -> tuple[int, int]:
+        """Finds the columns whose centers lie within an x-range, clipped to the grid."""
+        size = self.pixel_size
+        first = max(ceil((low - self.xmin) / size - 0.5), 0)
+        last = min(floor((high - self.xmin) / size - 0.5), self.width - 1)
+        return first, last
+
+    @staticmethod
+    def _outline(shape) -> tuple:
+        """Extracts what the span computation needs from a shape.
+
+        Returns:
+            tuple: (ylow, yhigh, circle) for a Circle, with circle as an (x, y, radius)
+                tuple, or (ylow, yhigh, corners) for a Triangle or Square, with corners as a
+                list of (x, y) pairs.
+
+        Raises:
+            TypeError: If the shape isn't a Circle, Triangle or Square.
+        """
+        if isinstance(shape, Circle):
+            x, y, r = shape.center.x, shape.center.y, shape.radius
+            return y - r, y + r, (x, y, r)
+        if isinstance(shape, (Triangle, Square)):
+            corners = [(getattr(shape, name).x, getattr(shape, name).y) for name in shape._corner_names]
+            ys = [y for _, y in corners]
+            return min(ys), max(ys), corners
+        raise TypeError(f"Can't rasterize objects of type {type(shape).__name__}")
+
+    @staticmethod
+    def _extent(outline, y: float) -> tuple[float, float] | None:
+        """Finds the x-range a shape covers along a horizontal line, or None if it misses it."""
+        if isinstance(outline, tuple):
+            cx, cy, r = outline
+            dy = y - cy
+            squared = r * r - dy * dy
+            if squared < 0:
+                return None
+            half = sqrt(squared)
+            return cx - half, cx + half
+        low, high = float('inf'), float('-inf')
+        previous = outline[-1]
+        for current in outline:
+            (x1, y1), (x2, y2) = previous, current
+            previous = current
+            if y1 == y2:
+                if y == y1:
+                    low, high = min(low, x1, x2), max(high, x1, x2)
+            elif min(y1, y2) <= y <= max(y1, y2):
+                x = x1 + (y - y1) * (x2 - x1) / (y2 - y1)
+                low, high = min(low, x), max(high, x)
+        return (low, high) if low <= high else None
+
+    def spans(self, shape) -> Iterator[tuple[int, int, int]]:
+        """Lists the pixels covered by a shape as one span per row.
+
+        Args:
+            shape (Circle | Triangle | Square): The shape to cut into spans.
+
+        Yields:
+            tuple[int, int, int]: The row and the first and last covered columns, inclusive.
+        """
+        ylow, yhigh, outline = self._outline(shape)
+        yield from self._spans(ylow, yhigh, outline, 0, self.height - 1)
+
+    def _spans(self, ylow: float, yhigh: float, outline, top: int, bottom: int) -> Iterator[tuple[int, int, int]]:
+        """Lists the spans of an outline within rows top to bottom, inclusive."""
+        first, last = self._rows_between(ylow, yhigh)
+        size, ymin = self.pixel_size, self.ymin
+        for row in range(max(first, top), min(last, bottom) + 1):
+            extent = self._extent(outline, ymin + (row + 0.5) * size)
+            if extent is None:
+                continue
+            start, end = self._columns_between(*extent)
+            if start <= end:
+                yield row, start, end
+
+    def _write(self, row, start: int, end: int, weight: float) -> None:
+        """Combines a weight into the pixels start to end, inclusive, of a row."""
+        stop = end + 1
+        if self.mode == 'boolean':
+            row[start:stop] = b'\x01' * (stop - start)
+        elif self.mode == 'count':
+            row[start:stop] = array('d', map(add, row[start:stop], repeat(weight)))
+        else:
+            row[start:stop] = array('d', map(max, row[start:stop], repeat(weight)))
+
+    def tiles(self, shapes: Iterable, weights: Iterable[float] | None = None,
+              tile_rows: int = 256) -> Iterator[tuple[int, list]]:
+        """Renders shapes one band of rows at a time, so only one band is held in memory.
+
+        Args:
+            shapes (Iterable): The Circle, Triangle and Square shapes to render.
+            weights (Iterable[float] | None): The value each shape writes in the 'count'
+                and 'max' modes. Defaults to 1 for every shape.
+            tile_rows (int): The number of rows per band. Defaults to 256.
+
+        Yields:
+            tuple[int, list]: The index of the first row of the band and its rows.
+
+        Raises:
+            ValueError: If tile_rows isn't positive.
+        """
+        if tile_rows < 1:
+            raise ValueError("A tile needs at least one row")
+        shapes = list(shapes)
+        weights = [1.0] * len(shapes) if weights is None else list(weights)
+        # Each shape, keyed by its first row, so the bands can pick them up in order
+        pending = []
+        for shape, weight in zip(shapes, weights):
+            ylow, yhigh, outline = self._outline(shape)
+            first, last = self._rows_between(ylow, yhigh)
+            if first <= last:
+                pending.append((first, last, ylow, yhigh, outline, weight))
+        pending.sort(key=lambda entry: entry[0])
+
+        active = []
+        position = 0
+        for top in range(0, self.height, tile_rows):
+            bottom = min(top + tile_rows, self.height) - 1
+            active = [entry for entry in active if entry[1] >= top]
+            while position < len(pending) and pending[position][0] <= bottom:
+                active.append(pending[position])
+                position += 1
+            rows = [self._empty_row() for _ in range(bottom - top + 1)]
+            for _, _, ylow, yhigh, outline, weight in active:
+                for row, start, end in self._spans(ylow, yhigh, outline, top, bottom):
+                    self._write(rows[row - top], start, end, weight)
+            yield top, rows
+
+    def render(self, shapes: Iterable, weights: Iterable[float] | None = None) -> list:
+        """Renders shapes onto the whole grid.
+
+        Args:
+            shapes (Iterable): The Circle, Triangle and Square shapes to render.
+            weights (Iterable[float] | None): The value each shape writes in the 'count'
+                and 'max' modes. Defaults to 1 for every shape.
+
+        Returns:
+            list: The rows of the grid, from the bottom one up.
+        """
+        rows = []
+        for _, band in self.tiles(shapes, weights, tile_rows=max(self.height, 1)):
+            rows.extend(band)
+        return rows
@@ -0,0 +1,133 @@
+# geometry/segment.py
+from __future__ import annotations
+
+from .basics import Point, GetDistance
+from .line import Line
+
+Coordinates = tuple[float, float]
+
+
+def _orientation(P: Coordinates, Q: Coordinates, R: Coordinates) -> float:
+    """Calculates the cross product of PQ and PR.
+
+    Returns:
+        float: Positive if P, Q, R turn counter-clockwise, negative if clockwise, 0 if collinear.
+    """
+    return (Q[0] - P[0]) * (R[1] - P[1]) - (Q[1] - P[1]) * (R[0] - P[0])
+
+
+def _intersect(first: tuple[float, float, float, float],
+               second: tuple[float, float, float, float]) -> Coordinates | None:
+    """Calculates where two segments given as (x1, y1, x2, y2) meet.
+
+    Both segments must have their endpoints in lexicographic (x, then y) order.
+
+    Returns:
+        Coordinates | None: The intersection point, the start of the overlap for collinear
+            overlapping segments, or None if the segments don't meet.
+    """
+    P1, P2 = (first[0], first[1]), (first[2], first[3])
+    P3, P4 = (second[0], second[1]), (second[2], second[3])
+    o1 = _orientation(P1, P2, P3)
+    o2 = _orientation(P1, P2, P4)
+    o3 = _orientation(P3, P4, P1)
+    o4 = _orientation(P3, P4, P2)
+
+    if (o1 == 0 and o2 == 0) or (o3 == 0 and o4 == 0):
+        # Collinear, the segments meet if their ranges overlap. Rounding can leave the
+        # other two orientations slightly off zero, so one pair is enough.
+        start, end = max(P1, P3), min(P2, P4)
+        return start if start <= end else None
+    if (o1 > 0 and o2 > 0) or (o1 < 0 and o2 < 0) or (o3 > 0 and o4 > 0) or (o3 < 0 and o4 < 0):
+        return None
+
+    # Touching endpoints are returned exactly instead of being recomputed. An endpoint on
+    # the line through the other segment but outside it means the segments don't meet.
+    if o1 == 0 and P1 <= P3 <= P2:
+        return P3
+    if o2 == 0 and P1 <= P4 <= P2:
+        return P4
+    if o3 == 0 and P3 <= P1 <= P4:
+        return P1
+    if o4 == 0 and P3 <= P2 <= P4:
+        return P2
+    if o1 == 0 or o2 == 0 or o3 == 0 or o4 == 0:
+        return None
+    dx1, dy1 = P2[0] - P1[0], P2[1] - P1[1]
+    dx2, dy2 = P4[0] - P3[0], P4[1] - P3[1]
+    t = ((P3[0] - P1[0]) * dy2 - (P3[1] - P1[1]) * dx2) / (dx1 * dy2 - dy1 * dx2)
+    return P1[0] + t * dx1, P1[1] + t * dy1
+
+
+class Segment:
+    """Represents a line segment between two points.
+
+    Attributes:
+        A (Point): The first endpoint of the segment.
+        B (Point): The second endpoint of the segment.
+    """
+
+    def __init__(self, A: Point, B: Point):
+        """Initializes a Segment object.
+
+        Args:
+            A (Point): The first endpoint.
+            B (Point): The second endpoint.
+        """
+        self.A = A
+        self.B = B
+
+    @property
+    def line(self) -> Line:
+        """Gets the line the segment lies on.
+
+        Returns:
+            Line: A new Line object passing through both endpoints.
+        """
+        return Line.from_points(self.A, self.B)
+
+    @property
+    def length(self) -> float:
+        """Gets the length of the segment.
+
+        Returns:
+            float: The distance between the endpoints.
+        """
+        return GetDistance.between_points(self.A, self.B)
+
+    @property
+    def coordinates(self) -> tuple[float, float, float, float]:
+        """Gets the endpoint coordinates in lexicographic (x, then y) order.
+
+        Returns:
+            tuple[float, float, float, float]: The segment as (x1, y1, x2, y2) with (x1, y1) <= (x2, y2).
+        """
+        first, second = (self.A.x, self.A.y), (self.B.x, self.B.y)
+        if second < first:
+            first, second = second, first
+        return first[0], first[1], second[0], second[1]
+
+    def intersection(self, other: Segment, letter: chr = 'I') -> Point | None:
+        """Calculates the point where this segment meets another segment.
+
+        Args:
+            other (Segment): The other Segment object.
+            letter (chr): The letter designation for the intersection point. Defaults to 'I'.
+
+        Returns:
+            Point | None: The intersection point, or None if the segments don't meet. For
+                collinear overlapping segments, the point where the overlap starts.
+        """
+        meeting = _intersect(self.coordinates, other.coordinates)
+        if meeting is None:
+            return None
+        return Point(letter, meeting[0], meeting[1])
+
+    def __str__(self) -> str:
+        """Returns a string representation of the Segment object.
+
+        Returns:
+            str: A descriptive string including the endpoints of the segment.
+        """
+        res: str = f"SEGMENT defined with endpoints {self.A} and {self.B}."
+        return res
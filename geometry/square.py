@@ -1,12 +1,17 @@
-from .basics import Point, GetDistance, Areas, General
+from __future__ import annotations
+from .basics import Point, GetDistance, Areas, General, _CachedCorners, _derived, _side_functions
+from .arrays import PointArray
 from math import sqrt, isclose
+from typing import Iterable
 
 
-class Square:
+class Square(_CachedCorners):
     """Represents a square defined by four corner points.
 
     A square is validated upon initialization to ensure the provided points
-    form a true square (all sides equal length).
+    form a true square (all sides equal length and both diagonals sqrt(2) times as
+    long). Derived values (points, lengths, perimeter and area) are computed on first
+    access and cached until one of the corner points changes.
 
     Attributes:
         A (Point): The first corner point of the square.
@@ -17,9 +22,11 @@ class Square:
         lengths (list[float]): A list containing the lengths of the four sides.
         perimeter (float): The perimeter of the square.
         area (float): The area of the square.
+        rel_tol (float): The relative tolerance used when comparing lengths.
+        abs_tol (float): The absolute tolerance used when comparing lengths.
     """
 
-    def __init__(self, A: Point, B: Point, C: Point, D: Point):
+    def __init__(self, A: Point, B: Point, C: Point, D: Point, rel_tol: float = 1e-9, abs_tol: float = 0.0):
         """Initializes a Square object with four corner points.
 
         Args:
@@ -27,25 +34,60 @@ class Square:
             B (Point): The second corner point.
             C (Point): The third corner point.
             D (Point): The fourth corner point.
+            rel_tol (float): The relative tolerance used when comparing lengths. Defaults to 1e-9.
+            abs_tol (float): The absolute tolerance used when comparing lengths, useful for
+                noisy coordinates. Defaults to 0.
 
         Raises:
             Exception: If the provided points do not form a valid square.
         """
-        self.A = A
-        self.B = B
-        self.C = C
-        self.D = D
-
-        self.points = self.get_points()
+        self._A = A
+        self._B = B
+        self._C = C
+        self._D = D
+        self.rel_tol = rel_tol
+        self.abs_tol = abs_tol
 
         if not self.check_validity():
             raise Exception(f"The points provided don't form a square. {self.points}")
 
-        self.lengths = self.get_side_lengths()
+    _corner_names = ('A', 'B', 'C', 'D')
+
+    @_derived
+    def points(self) -> list[str]:
+        """Gets the formatted string representations of the corner points.
+
+        Returns:
+            list[str]: A list of strings, each representing a corner point (e.g., "A(0; 0)").
+        """
+        return self.get_points()
+
+    @_derived
+    def lengths(self) -> list[float]:
+        """Gets the lengths of the four sides of the square.
+
+        Returns:
+            list[float]: The lengths of sides AB, BC, CD, and AD.
+        """
+        return self.get_side_lengths()
+
+    @_derived
+    def perimeter(self) -> float:
+        """Gets the perimeter of the square.
+
+        Returns:
+            float: The sum of the side lengths.
+        """
+        return General.get_perimeter(self.lengths)
 
-        self.perimeter = General.get_perimeter(self.lengths)
+    @_derived
+    def area(self) -> float:
+        """Gets the area of the square.
 
-        self.area = Areas.Square.area(self.lengths[0])
+        Returns:
+            float: The area of the square.
+        """
+        return Areas.Square.area(self.lengths[0])
 
     def get_side_lengths(self) -> list[float]:
         """Calculates the lengths of the four sides of the square.
@@ -53,24 +95,98 @@ class Square:
         Returns:
             list[float]: A list containing the lengths of sides AB, BC, CD, and AD.
         """
-        AB: float = GetDistance.between_points(self.A, self.B)
-        BC: float = GetDistance.between_points(self.B, self.C)
-        CD: float = GetDistance.between_points(self.C, self.D)
-        AD: float = GetDistance.between_points(self.A, self.D)
+        # Every coordinate is read once, with the same formula as GetDistance.between_points
+        A, B, C, D = self._A, self._B, self._C, self._D
+        ax, ay, bx, by, cx, cy, dx, dy = A.x, A.y, B.x, B.y, C.x, C.y, D.x, D.y
+        AB: float = sqrt((ax - bx) ** 2 + (ay - by) ** 2)
+        BC: float = sqrt((bx - cx) ** 2 + (by - cy) ** 2)
+        CD: float = sqrt((cx - dx) ** 2 + (cy - dy) ** 2)
+        AD: float = sqrt((ax - dx) ** 2 + (ay - dy) ** 2)
 
         return [AB, BC, CD, AD]
 
     def check_validity(self) -> bool:
         """Checks if the four provided points form a valid square.
 
-        This is determined by checking if all side lengths are approximately equal.
+        This is determined by checking if all side lengths are approximately equal and
+        both diagonals are approximately side * sqrt(2) long, which rules out rhombi and
+        points that fold onto each other. Sides of zero length, within abs_tol, are rejected.
 
         Returns:
             bool: True if the points form a square, False otherwise.
         """
-        [AB, BC, CD, AD] = self.get_side_lengths()
+        [AB, BC, CD, AD] = self.lengths
+        if isclose(AB, 0.0, abs_tol=self.abs_tol):
+            return False
+        AC: float = GetDistance.between_points(self.A, self.C)
+        BD: float = GetDistance.between_points(self.B, self.D)
+        diagonal: float = AB * sqrt(2)
 
-        return all(isclose(side, AB, rel_tol=1e-9) for side in [BC, CD, AD])
+        sides_equal = all(isclose(side, AB, rel_tol=self.rel_tol, abs_tol=self.abs_tol) for side in [BC, CD, AD])
+        return sides_equal and all(isclose(length, diagonal, rel_tol=self.rel_tol, abs_tol=self.abs_tol)
+                                   for length in [AC, BD])
+
+    def contains(self, check: Point, include_points_on_boundary: bool = True) -> bool:
+        """Checks if a given point is inside or on the boundary of the square.
+
+        Args:
+            check (Point): The point to check for containment.
+            include_points_on_boundary (bool): If True, points exactly on the
+                square's sides are considered inside. Defaults to True.
+
+        Returns:
+            bool: True if the point is contained within (or on) the square, False otherwise.
+        """
+        return self.contains_many([check], include_points_on_boundary)[0]
+
+    def contains_many(self, points: PointArray | Iterable[Point],
+                      include_points_on_boundary: bool = True) -> list[bool]:
+        """Checks which of many points are inside or on the boundary of the square.
+
+        Every side is turned into a linear function that is positive on the inner side,
+        as in Triangle.contains_many.
+
+        Args:
+            points (PointArray | Iterable[Point]): The points to check for containment.
+            include_points_on_boundary (bool): If True, points exactly on the
+                square's sides are considered inside. Defaults to True.
+
+        Returns:
+            list[bool]: For every point, True if it is contained within (or on) the square.
+        """
+        points = PointArray.coerce(points)
+        sides = self._side_functions()
+        if sides is None:
+            # A flat square has no inside, only its sides
+            if not include_points_on_boundary:
+                return [False] * len(points)
+            return [self._on_flat_boundary(x, y) for x, y in zip(points.x, points.y)]
+        if include_points_on_boundary:
+            return [all(u * (y - y1) - v * (x - x1) >= 0 for x1, y1, u, v in sides) for x, y in zip(points.x, points.y)]
+        return [all(u * (y - y1) - v * (x - x1) > 0 for x1, y1, u, v in sides) for x, y in zip(points.x, points.y)]
+
+    def _side_functions(self) -> tuple | None:
+        """Gets the side functions of the square, positive towards its inside.
+
+        Returns:
+            tuple | None: Four (x1, y1, u, v) quadruples, see `basics._side_functions`,
+                or None if a corner lies on the line through a side, after corners moved.
+        """
+        return self._sides
+
+    @_derived
+    def _sides(self) -> tuple | None:
+        """Computes the side functions of the square, see `_side_functions`."""
+        return _side_functions([(self.A.x, self.A.y), (self.B.x, self.B.y), (self.C.x, self.C.y), (self.D.x, self.D.y)])
+
+    def _on_flat_boundary(self, x: float, y: float) -> bool:
+        """Checks if a point lies on one of the sides of a square that went flat."""
+        corners = [(self.A.x, self.A.y), (self.B.x, self.B.y), (self.C.x, self.C.y), (self.D.x, self.D.y)]
+        for (ax, ay), (bx, by) in zip(corners, corners[1:] + corners[:1]):
+            if (min(ax, bx) <= x <= max(ax, bx) and min(ay, by) <= y <= max(ay, by)
+                    and (bx - ax) * (y - ay) - (by - ay) * (x - ax) == 0):
+                return True
+        return False
 
     def get_points(self) -> list[str]:
         """Gets the formatted string representations of the square's corner points.
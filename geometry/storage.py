@@ -0,0 +1,305 @@
+# geometry/storage.py
+"""Reads and writes shapes in a fixed-layout binary file.
+
+Layout, all little-endian:
+
+    header      HEADER: magic, version, reserved, the counts of points, circles, lines
+                and triangles, and the byte size of the label text
+    points      float64 columns x, y
+    circles     float64 columns x, y, radius (of the center and radius)
+    lines       float64 columns a, b, c (of a*x + b*y + c = 0)
+    triangles   float64 columns ax, ay, bx, by, cx, cy
+    labels      int64 offsets (one more than the number of points), then the UTF-8
+                encoded point letters, back to back
+
+Every column starts on an 8-byte boundary, so the reader can hand out memoryviews of
+the mapped file cast to doubles without copying anything.
+"""
+from __future__ import annotations
+import mmap
+import struct
+import sys
+from array import array
+from typing import Iterable, Iterator
+
+from .arrays import PointArray
+from .basics import Point
+from .circle import Circle
+from .line import Line
+from .triangle import Triangle
+
+MAGIC = b'GEOM'
+VERSION = 1
+HEADER = struct.Struct('<4sHH5Q')
+COLUMNS = {
+    'points': ('x', 'y'),
+    'circles': ('x', 'y', 'r'),
+    'lines': ('a', 'b', 'c'),
+    'triangles': ('ax', 'ay', 'bx', 'by', 'cx', 'cy'),
+}
+
+
+def _write_column(stream, values: Iterable[float]) -> None:
+    """Writes one float64 column in little-endian order."""
+    column = array('d', values)
+    if sys.byteorder != 'little':
+        column.byteswap()
+    stream.write(column.tobytes())
+
+
+def write_shapes(path: str, points: PointArray | Iterable[Point] = (), circles: Iterable[Circle] = (),
+                 lines: Iterable[Line] = (), triangles: Iterable[Triangle] = ()) -> None:
+    """Writes shapes to a binary file.
+
+    Args:
+        path (str): The file to create or overwrite.
+        points (PointArray | Iterable[Point]): The points, whose letters are kept as labels.
+        circles (Iterable[Circle]): The circles.
+        lines (Iterable[Line]): The lines.
+        triangles (Iterable[Triangle]): The triangles.
+    """
+    points = PointArray.coerce(points)
+    circles, lines, triangles = list(circles), list(lines), list(triangles)
+    labels = [str(label).encode('utf-8') for label in (points.labels or [''] * len(points))]
+    offsets = array('q', [0])
+    for label in labels:
+        offsets.append(offsets[-1] + len(label))
+    if sys.byteorder != 'little':
+        offsets.byteswap()
+
+    with open(path, 'wb') as stream:
+        stream.write(HEADER.pack(MAGIC, VERSION, 0, len(points), len(circles), len(lines), len(triangles),
+                                 sum(len(label) for label in labels)))
+        _write_column(stream, points.x)
+        _write_column(stream, points.y)
+        _write_column(stream, (circle.center.x for circle in circles))
+        _write_column(stream, (circle.center.y for circle in circles))
+        _write_column(stream, (circle.radius for circle in circles))
+        for name in ('a', 'b', 'c'):
+            _write_column(stream, (getattr(line, name) for line in lines))
+        for corner in ('A', 'B', 'C'):
+            _write_column(stream, (getattr(triangle, corner).x for triangle in triangles))
+            _write_column(stream, (getattr(triangle, corner).y for triangle in triangles))
+        stream.write(offsets.tobytes())
+        stream.write(b''.join(labels))
+
+
+class ShapeFile:
+    """A binary shape file opened through a memory map.
+
+    Opening only reads the header, whatever the file size. Columns are memoryviews of
+    the mapped file, so pages are read from disk lazily as they are touched, and objects
+    are only built for the records asked for.
+
+    Attributes:
+        path (str): The file name.
+        counts (dict[str, int]): The number of records per section.
+    """
+
+    def __init__(self, path: str):
+        """Opens a binary shape file.
+
+        Args:
+            path (str): The file to open.
+
+        Raises:
+            ValueError: If the file isn't a shape file of a supported version, or is truncated.
+        """
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # An empty file can't be mapped
+            self._file.close()
+            raise ValueError(f"{path} is empty, not a shape file")
+        self._views: list[memoryview] = []
+        self._columns: dict[tuple[str, str], memoryview] = {}
+        try:
+            self._parse_header()
+        except ValueError:
+            self.close()
+            raise
+
+    def _parse_header(self) -> None:
+        """Reads the header and finds the offset of every column."""
+        if len(self._map) < HEADER.size:
+            raise ValueError(f"{self.path} is too short to be a shape file")
+        magic, version, _, *counts, label_size = HEADER.unpack_from(self._map)
+        if magic != MAGIC:
+            raise ValueError(f"{self.path} isn't a shape file")
+        if version != VERSION:
+            raise ValueError(f"{self.path} uses format version {version}, only {VERSION} is supported")
+        self.counts = dict(zip(COLUMNS, counts))
+
+        self._offsets: dict[tuple[str, str], int] = {}
+        offset = HEADER.size
+        for section, names in COLUMNS.items():
+            for name in names:
+                self._offsets[(section, name)] = offset
+                offset += 8 * self.counts[section]
+        self._label_offsets = offset
+        self._label_text = offset + 8 * (self.counts['points'] + 1)
+        if len(self._map) < self._label_text + label_size:
+            raise ValueError(f"{self.path} is truncated")
+        self._base = memoryview(self._map)
+        self._views.append(self._base)
+
+    def _view(self, start: int, count: int, code: str):
+        """Gets count typed values starting at a byte offset, as a view when the byte order allows."""
+        raw = self._base[start:start + 8 * count]
+        if sys.byteorder == 'little':
+            view = raw.cast(code)
+            self._views.append(raw)
+            self._views.append(view)
+            return view
+        values = array(code, raw.tobytes())
+        values.byteswap()
+        return values
+
+    def column(self, section: str, name: str) -> memoryview:
+        """Gets one column of a section without copying it.
+
+        Args:
+            section (str): 'points', 'circles', 'lines' or 'triangles'.
+            name (str): The column name, see COLUMNS.
+
+        Returns:
+            memoryview: The float64 values of the column, the same view on every call. On
+                big-endian machines, where a view isn't possible, a converted array is
+                returned instead.
+
+        Raises:
+            KeyError: If the section or column doesn't exist.
+        """
+        key = (section, name)
+        column = self._columns.get(key)
+        if column is None:
+            column = self._columns[key] = self._view(self._offsets[key], self.counts[section], 'd')
+        return column
+
+    def __len__(self) -> int:
+        """Returns the total number of records.
+
+        Returns:
+            int: The number of points, circles, lines and triangles together.
+        """
+        return sum(self.counts.values())
+
+    def label(self, i: int) -> str:
+        """Gets the letter of a point.
+
+        Args:
+            i (int): The position of the point.
+
+        Returns:
+            str: The letter.
+
+        Raises:
+            IndexError: If there is no point at that position.
+        """
+        if not 0 <= i < self.counts['points']:
+            raise IndexError(f"points index {i} out of range")
+        start, end = struct.unpack_from('<2q', self._map, self._label_offsets + 8 * i)
+        return self._map[self._label_text + start:self._label_text + end].decode('utf-8')
+
+    def point_array(self) -> PointArray:
+        """Loads all points into a PointArray, copying the columns once.
+
+        Returns:
+            PointArray: The points with their letters.
+        """
+        count = self.counts['points']
+        return PointArray(self.column('points', 'x'), self.column('points', 'y'),
+                          [self.label(i) for i in range(count)])
+
+    def _record(self, section: str, i: int) -> list[float]:
+        """Reads the values of one record of a section."""
+        count = self.counts[section]
+        if not 0 <= i < count:
+            raise IndexError(f"{section} index {i} out of range")
+        return [struct.unpack_from('<d', self._map, self._offsets[(section, name)] + 8 * i)[0]
+                for name in COLUMNS[section]]
+
+    def point(self, i: int) -> Point:
+        """Rebuilds one point.
+
+        Args:
+            i (int): The position of the point.
+
+        Returns:
+            Point: The point, with its letter.
+        """
+        x, y = self._record('points', i)
+        return Point(self.label(i), x, y)
+
+    def circle(self, i: int) -> Circle:
+        """Rebuilds one circle.
+
+        Args:
+            i (int): The position of the circle.
+
+        Returns:
+            Circle: The circle, centered on a point named O.
+        """
+        x, y, r = self._record('circles', i)
+        return Circle(Point('O', x, y), r)
+
+    def line(self, i: int) -> Line:
+        """Rebuilds one line.
+
+        Args:
+            i (int): The position of the line.
+
+        Returns:
+            Line: The line.
+        """
+        return Line(*self._record('lines', i))
+
+    def triangle(self, i: int) -> Triangle:
+        """Rebuilds one triangle.
+
+        Args:
+            i (int): The position of the triangle.
+
+        Returns:
+            Triangle: The triangle, with corners named A, B and C.
+        """
+        ax, ay, bx, by, cx, cy = self._record('triangles', i)
+        return Triangle(Point('A', ax, ay), Point('B', bx, by), Point('C', cx, cy))
+
+    def shapes(self, section: str) -> Iterator:
+        """Rebuilds the objects of a section one at a time.
+
+        Args:
+            section (str): 'points', 'circles', 'lines' or 'triangles'.
+
+        Yields:
+            Point | Circle | Line | Triangle: The next object.
+        """
+        build = {'points': self.point, 'circles': self.circle, 'lines': self.line,
+                 'triangles': self.triangle}[section]
+        for i in range(self.counts[section]):
+            yield build(i)
+
+    def close(self) -> None:
+        """Releases the views handed out by this object and unmaps the file.
+
+        Raises:
+            BufferError: If a view of the file is still referenced elsewhere, e.g. a
+                slice of a column.
+        """
+        for view in reversed(self._views):
+            view.release()
+        self._views.clear()
+        self._columns.clear()
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self) -> ShapeFile:
+        """Returns the open file for use in a with statement."""
+        return self
+
+    def __exit__(self, *exc) -> None:
+        """Closes the file at the end of a with statement."""
+        self.close()
@@ -0,0 +1,153 @@
+# geometry/sweep.py
+from __future__ import annotations
+from bisect import bisect_left, bisect_right
+from heapq import heappush, heappop
+from itertools import combinations
+from typing import Iterable
+
+from .basics import Point
+from .segment import Segment, _intersect
+
+Intersection = tuple[int, int, Point]
+
+
+def _passes_near(segment: tuple[float, float, float, float], point: tuple[float, float], tol: float) -> bool:
+    """Checks if a segment passes within tol of a point, measured vertically as in the sweep."""
+    x1, y1, x2, y2 = segment
+    px, py = point
+    if not x1 <= px <= x2:
+        return False
+    if x1 == x2:
+        return y1 <= py <= y2
+    return abs(y1 + (px - x1) * (y2 - y1) / (x2 - x1) - py) <= tol
+
+
+def _brute_force(segments: list[tuple[float, float, float, float]],
+                 tol: float) -> dict[tuple[int, int], tuple[float, float]]:
+    """Tests every pair of segments against each other.
+
+    Besides crossing, two segments meet when an endpoint of one lies within tol of the
+    other, so the pairs match the ones the sweep finds.
+
+    Returns:
+        dict: The meeting point of every intersecting pair (i, j) with i < j.
+    """
+    found = {}
+    for i, j in combinations(range(len(segments)), 2):
+        first, second = segments[i], segments[j]
+        meeting = _intersect(first, second)
+        if meeting is None:
+            for segment, (x1, y1, x2, y2) in ((first, second), (second, first)):
+                meeting = next((end for end in ((x1, y1), (x2, y2)) if _passes_near(segment, end, tol)), None)
+                if meeting is not None:
+                    break
+        if meeting is not None:
+            found[(i, j)] = meeting
+    return found
+
+
+def _bentley_ottmann(segments: list[tuple[float, float, float, float]],
+                     tol: float) -> dict[tuple[int, int], tuple[float, float]]:
+    """Finds all intersecting pairs of segments with a Bentley-Ottmann sweep.
+
+    A vertical sweep line moves over the event points in lexicographic (x, then y) order
+    while the segments it crosses are kept sorted by height. Only segments next to each
+    other in that order can meet before the next event, so only they are tested.
+
+    Returns:
+        dict: The meeting point of every intersecting pair (i, j) with i < j.
+    """
+    starts: dict[tuple[float, float], list[int]] = {}
+    events: list[tuple[float, float]] = []
+    queued: set[tuple[float, float]] = set()
+    slopes = []
+    for i, (x1, y1, x2, y2) in enumerate(segments):
+        starts.setdefault((x1, y1), []).append(i)
+        for event in ((x1, y1), (x2, y2)):
+            if event not in queued:
+                queued.add(event)
+                heappush(events, event)
+        slopes.append((y2 - y1) / (x2 - x1) if x2 != x1 else float('inf'))
+
+    found = {}
+    status: list[int] = []
+
+    def check(i: int, j: int, after: tuple[float, float]) -> None:
+        """Queues the meeting point of two neighbouring segments if it is still ahead."""
+        meeting = _intersect(segments[i], segments[j])
+        if meeting is not None and meeting > after and meeting not in queued:
+            queued.add(meeting)
+            heappush(events, meeting)
+
+    while events:
+        event = heappop(events)
+        px, py = event
+
+        def height(i: int) -> float:
+            """Gets where a segment crosses the sweep line."""
+            x1, y1, x2, y2 = segments[i]
+            if x1 == x2:
+                # Vertical segments sit at the event while the sweep moves along them
+                return py
+            return y1 + (px - x1) * (y2 - y1) / (x2 - x1)
+
+        low = bisect_left(status, py - tol, key=height)
+        high = bisect_right(status, py + tol, key=height)
+        through = status[low:high]
+        starting = starts.get(event, [])
+
+        involved = sorted(through + starting)
+        for i, j in combinations(involved, 2):
+            found.setdefault((i, j), event)
+
+        # Segments that go on past the event are reordered by how they leave it
+        continuing = [i for i in through + starting if (segments[i][2], segments[i][3]) != event]
+        continuing.sort(key=lambda i: (slopes[i], i))
+        status[low:high] = continuing
+
+        if not continuing:
+            if 0 < low < len(status):
+                check(status[low - 1], status[low], event)
+        else:
+            if low > 0:
+                check(status[low - 1], continuing[0], event)
+            above = low + len(continuing)
+            if above < len(status):
+                check(continuing[-1], status[above], event)
+    return found
+
+
+def find_intersections(segments: Iterable[Segment], method: str = 'sweep',
+                       tol: float = 1e-9) -> list[Intersection]:
+    """Finds every pair of intersecting segments.
+
+    The sweep reports all k intersecting pairs among n segments with O((n + k) log n)
+    intersection tests. The brute-force method tests all pairs and is kept as a reference.
+
+    Args:
+        segments (Iterable[Segment]): The segments to test.
+        method (str): Either 'sweep' for the Bentley-Ottmann sweep or 'brute' for
+            testing every pair. Defaults to 'sweep'.
+        tol (float): How close to an event point a segment must pass to count as going
+            through it, measured vertically. Brute force applies it to the endpoints of
+            both segments. Must be positive, the sweep needs it to absorb the rounding of
+            computed crossing heights. Defaults to 1e-9.
+
+    Returns:
+        list[Intersection]: Tuples (i, j, P) with i < j the positions of two intersecting
+            segments and P a point where they meet, sorted by (i, j). Collinear
+            overlapping segments are reported once, at the start of their overlap.
+
+    Raises:
+        ValueError: If method isn't 'sweep' or 'brute', or tol isn't positive.
+    """
+    if not tol > 0:
+        raise ValueError("tol must be positive")
+    coordinates = [segment.coordinates for segment in segments]
+    if method == 'sweep':
+        found = _bentley_ottmann(coordinates, tol)
+    elif method == 'brute':
+        found = _brute_force(coordinates, tol)
+    else:
+        raise ValueError("method must be 'sweep' or 'brute'")
+    return [(i, j, Point('I', x, y)) for (i, j), (x, y) in sorted(found.items())]
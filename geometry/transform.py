@@ -0,0 +1,283 @@
+# geometry/transform.py
+from __future__ import annotations
+from math import cos, sin, sqrt, isclose
+from typing import Iterable
+
+from .basics import Point, FrozenPoint
+from .circle import Circle
+from .line import Line
+from .polygon import Polygon
+from .segment import Segment
+from .square import Square
+from .triangle import Triangle
+
+
+class Affine:
+    """Represents an affine transformation of the plane.
+
+    The transformation maps (x, y) to (a*x + b*y + c, d*x + e*y + f), which is the 3x3
+    matrix [[a, b, c], [d, e, f], [0, 0, 1]] applied to (x, y, 1).
+
+    Attributes:
+        a, b, c (float): The first row of the matrix.
+        d, e, f (float): The second row of the matrix.
+    """
+
+    def __init__(self, a: float, b: float, c: float, d: float, e: float, f: float):
+        """Initializes an Affine transformation from its matrix coefficients.
+
+        Args:
+            a (float): The factor of x in the new x-coordinate.
+            b (float): The factor of y in the new x-coordinate.
+            c (float): The offset of the new x-coordinate.
+            d (float): The factor of x in the new y-coordinate.
+            e (float): The factor of y in the new y-coordinate.
+            f (float): The offset of the new y-coordinate.
+        """
+        self.a, self.b, self.c = a, b, c
+        self.d, self.e, self.f = d, e, f
+
+    @classmethod
+    def identity(cls) -> Affine:
+        """Initializes the transformation that changes nothing.
+
+        Returns:
+            Affine: The identity transformation.
+        """
+        return cls(1, 0, 0, 0, 1, 0)
+
+    @classmethod
+    def translate(cls, dx: float, dy: float) -> Affine:
+        """Initializes a translation.
+
+        Args:
+            dx (float): The shift along the x-axis.
+            dy (float): The shift along the y-axis.
+
+        Returns:
+            Affine: The translation.
+        """
+        return cls(1, 0, dx, 0, 1, dy)
+
+    @classmethod
+    def rotate(cls, angle: float, origin: Point | None = None) -> Affine:
+        """Initializes a counter-clockwise rotation.
+
+        Args:
+            angle (float): The rotation angle, in radians.
+            origin (Point | None): The center of the rotation. Defaults to (0, 0).
+
+        Returns:
+            Affine: The rotation.
+        """
+        cosine, sine = cos(angle), sin(angle)
+        return cls._around(cls(cosine, -sine, 0, sine, cosine, 0), origin)
+
+    @classmethod
+    def scale(cls, sx: float, sy: float | None = None, origin: Point | None = None) -> Affine:
+        """Initializes a scaling.
+
+        Args:
+            sx (float): The scale factor along the x-axis.
+            sy (float | None): The scale factor along the y-axis. Defaults to sx.
+            origin (Point | None): The fixed point of the scaling. Defaults to (0, 0).
+
+        Returns:
+            Affine: The scaling.
+        """
+        return cls._around(cls(sx, 0, 0, 0, sx if sy is None else sy, 0), origin)
+
+    @classmethod
+    def matrix(cls, rows: Iterable[Iterable[float]]) -> Affine:
+        """Initializes a transformation from a general 3x3 matrix.
+
+        Args:
+            rows (Iterable[Iterable[float]]): The three rows of the matrix. The last row
+                must be (0, 0, 1).
+
+        Returns:
+            Affine: The transformation.
+
+        Raises:
+            ValueError: If the matrix isn't 3x3 or its last row isn't (0, 0, 1).
+        """
+        rows = [list(row) for row in rows]
+        if len(rows) != 3 or any(len(row) != 3 for row in rows):
+            raise ValueError("The matrix must be 3x3")
+        if rows[2] != [0, 0, 1]:
+            raise ValueError("The last row of an affine matrix must be (0, 0, 1)")
+        return cls(*rows[0], *rows[1])
+
+    @classmethod
+    def _around(cls, linear: Affine, origin: Point | None) -> Affine:
+        """Moves the fixed point of a linear transformation from (0, 0) to origin."""
+        if origin is None:
+            return linear
+        return cls.translate(origin.x, origin.y) @ linear @ cls.translate(-origin.x, -origin.y)
+
+    def __matmul__(self, other: Affine) -> Affine:
+        """Composes two transformations, `other` being applied first.
+
+        Args:
+            other (Affine): The transformation applied before this one.
+
+        Returns:
+            Affine: The combined transformation.
+        """
+        return Affine(self.a * other.a + self.b * other.d, self.a * other.b + self.b * other.e,
+                      self.a * other.c + self.b * other.f + self.c,
+                      self.d * other.a + self.e * other.d, self.d * other.b + self.e * other.e,
+                      self.d * other.c + self.e * other.f + self.f)
+
+    @property
+    def determinant(self) -> float:
+        """Gets the determinant of the linear part, the factor applied to signed areas.
+
+        Returns:
+            float: The value of a*e - b*d.
+        """
+        return self.a * self.e - self.b * self.d
+
+    @property
+    def similarity_factor(self) -> float | None:
+        """Gets the factor applied to all lengths, if the transformation preserves shapes.
+
+        Returns:
+            float | None: The length scale factor of a similarity (rotation, reflection,
+                uniform scaling and translation), or None for any other transformation.
+        """
+        a, b, d, e = self.a, self.b, self.d, self.e
+        first, second = a * a + d * d, b * b + e * e
+        if not isclose(first, second, rel_tol=1e-12) or not isclose(a * b + d * e, 0, abs_tol=1e-12 * first):
+            return None
+        return sqrt(first)
+
+    def inverse(self) -> Affine:
+        """Calculates the transformation undoing this one.
+
+        Returns:
+            Affine: The inverse transformation.
+
+        Raises:
+            ValueError: If the transformation is singular.
+        """
+        det = self.determinant
+        if det == 0:
+            raise ValueError("A singular transformation can't be inverted")
+        a, b, d, e = self.e / det, -self.b / det, -self.d / det, self.a / det
+        return Affine(a, b, -(a * self.c + b * self.f), d, e, -(d * self.c + e * self.f))
+
+    def __call__(self, P: Point) -> Point:
+        """Builds the image of a point, leaving the point itself unchanged.
+
+        Args:
+            P (Point): The point to transform.
+
+        Returns:
+            Point: A new point with the same letter at the transformed coordinates.
+        """
+        return Point(P.letter, self.a * P.x + self.b * P.y + self.c, self.d * P.x + self.e * P.y + self.f)
+
+    def apply(self, shapes: Iterable) -> None:
+        """Transforms a collection of shapes in place.
+
+        Accepts Point, Line, Circle, Segment, Triangle, Square and Polygon objects. Every
+        distinct corner point is moved exactly once, in one pass over all coordinates, even
+        when shapes share points. The cached lengths, perimeters and areas of Triangle,
+        Square and Polygon objects are carried over instead of recomputed: similarity
+        transformations scale lengths by a common factor, and every affine transformation
+        scales areas by its determinant.
+
+        Args:
+            shapes (Iterable): The shapes to transform.
+
+        Raises:
+            ValueError: If a Circle or Square would be distorted by a transformation that
+                isn't a similarity, or a Line would be mapped by a singular one.
+            TypeError: If a shape of an unsupported type is given, or a point to move is
+                an immutable FrozenPoint. Nothing is changed when an error is raised.
+        """
+        shapes = list(shapes)
+        factor = self.similarity_factor
+        det = self.determinant
+
+        points: dict[int, Point] = {}
+        lines: list[Line] = []
+        circles: list[Circle] = []
+        cached: list[tuple] = []
+        for shape in shapes:
+            if isinstance(shape, Line):
+                lines.append(shape)
+                continue
+            if isinstance(shape, Circle):
+                if factor is None:
+                    raise ValueError("Only similarity transformations keep a circle a circle")
+                circles.append(shape)
+                corners = [shape.center]
+            elif isinstance(shape, (Triangle, Square)):
+                if isinstance(shape, Square) and factor is None:
+                    raise ValueError("Only similarity transformations keep a square a square")
+                corners = [getattr(shape, name) for name in shape._corner_names]
+                cached.append((shape, shape._valid_cache()))
+            elif isinstance(shape, Polygon):
+                corners = shape.vertices
+                cached.append((shape, shape._valid_cache()))
+            elif isinstance(shape, Segment):
+                corners = [shape.A, shape.B]
+            elif hasattr(shape, 'x') and hasattr(shape, 'y') and hasattr(shape, 'letter'):
+                corners = [shape]
+            else:
+                raise TypeError(f"Can't transform objects of type {type(shape).__name__}")
+            for corner in corners:
+                points[id(corner)] = corner
+        # Checked before anything moves, so a rejected call leaves every shape unchanged
+        for P in points.values():
+            if isinstance(P, FrozenPoint):
+                raise TypeError(f"Can't move the immutable point {P}")
+        inverse = self.inverse() if lines else None
+
+        # Move every distinct point once
+        unique = list(points.values())
+        xs = [P.x for P in unique]
+        ys = [P.y for P in unique]
+        a, b, c, d, e, f = self.a, self.b, self.c, self.d, self.e, self.f
+        new_xs = [a * x + b * y + c for x, y in zip(xs, ys)]
+        new_ys = [d * x + e * y + f for x, y in zip(xs, ys)]
+        for P, x, y in zip(unique, new_xs, new_ys):
+            P.x = x
+            P.y = y
+
+        for circle in circles:
+            circle.radius = circle.radius * factor
+
+        # A line's coefficients map through the inverse: (a, b, c) -> (a, b, c) @ inverse
+        for line in lines:
+            la, lb, lc = line.a, line.b, line.c
+            line.a, line.b, line.c = (la * inverse.a + lb * inverse.d, la * inverse.b + lb * inverse.e,
+                                      la * inverse.c + lb * inverse.f + lc)
+
+        for shape, values in cached:
+            shape._reset_cache(self._carry(values, factor, det))
+
+    @staticmethod
+    def _carry(values: dict, factor: float | None, det: float) -> dict:
+        """Derives the cached values of a shape after a transformation from those before it."""
+        carried = {}
+        if factor is not None:
+            if 'lengths' in values:
+                carried['lengths'] = [length * factor for length in values['lengths']]
+            if 'perimeter' in values:
+                carried['perimeter'] = values['perimeter'] * factor
+        if 'area' in values:
+            carried['area'] = values['area'] * abs(det)
+        if 'signed_area' in values:
+            carried['signed_area'] = values['signed_area'] * det
+        return carried
+
+    def __str__(self) -> str:
+        """Returns a string representation of the Affine transformation.
+
+        Returns:
+            str: The two non-trivial rows of the matrix.
+        """
+        return f"AFFINE transformation [[{self.a}, {self.b}, {self.c}], [{self.d}, {self.e}, {self.f}]]."
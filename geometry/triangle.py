@@ -1,9 +1,17 @@
-from .basics import Point, GetDistance, Areas, General
+from __future__ import annotations
+from math import sqrt
+from typing import Iterable
 
+from .basics import Point, Areas, General, _CachedCorners, _derived, _side_functions
+from .arrays import PointArray
 
-class Triangle:
+
+class Triangle(_CachedCorners):
     """Represents a triangle defined by three corner points.
 
+    Derived values (points, lengths, perimeter and area) are computed on first access
+    and cached until one of the corner points changes.
+
     Attributes:
         A (Point): The first corner point of the triangle.
         B (Point): The second corner point of the triangle.
@@ -22,17 +30,47 @@ class Triangle:
             B (Point): The second corner point.
             C (Point): The third corner point.
         """
-        self.A = A
-        self.B = B
-        self.C = C
+        self._A = A
+        self._B = B
+        self._C = C
+
+    _corner_names = ('A', 'B', 'C')
+
+    @_derived
+    def points(self) -> list[str]:
+        """Gets the formatted string representations of the corner points.
+
+        Returns:
+            list[str]: A list of strings, each representing a corner point (e.g., "A(0; 0)").
+        """
+        return self.get_points()
 
-        self.points = self.get_points()
+    @_derived
+    def lengths(self) -> list[float]:
+        """Gets the lengths of the three sides of the triangle.
 
-        self.lengths = self.get_side_lengths()
+        Returns:
+            list[float]: The lengths of sides c (AB), a (BC), and b (AC) in that order.
+        """
+        return self.get_side_lengths()
+
+    @_derived
+    def perimeter(self) -> float:
+        """Gets the perimeter of the triangle.
+
+        Returns:
+            float: The sum of the side lengths.
+        """
+        return General.get_perimeter(self.lengths)
 
-        self.perimeter = General.get_perimeter(self.lengths)
+    @_derived
+    def area(self) -> float:
+        """Gets the area of the triangle, calculated using Heron's formula.
 
-        self.area = Areas.Triangle.Heron(self.lengths)
+        Returns:
+            float: The area of the triangle.
+        """
+        return Areas.Triangle.Heron(self.lengths)
 
     def get_side_lengths(self) -> list[float]:
         """Calculates the lengths of the three sides of the triangle.
@@ -42,13 +80,90 @@ class Triangle:
         Returns:
             list[float]: A list containing the lengths of sides c (AB), a (BC), and b (AC) in that order.
         """
+        # Every coordinate is read once, with the same formula as GetDistance.between_points
+        A, B, C = self._A, self._B, self._C
+        ax, ay, bx, by, cx, cy = A.x, A.y, B.x, B.y, C.x, C.y
         # The side is named after the letter of its opposing corner, lowercased
-        c: float = GetDistance.between_points(self.A, self.B)  # Side opposite C
-        a: float = GetDistance.between_points(self.B, self.C)  # Side opposite A
-        b: float = GetDistance.between_points(self.A, self.C)  # Side opposite B
+        c: float = sqrt((ax - bx) ** 2 + (ay - by) ** 2)  # Side opposite C
+        a: float = sqrt((bx - cx) ** 2 + (by - cy) ** 2)  # Side opposite A
+        b: float = sqrt((ax - cx) ** 2 + (ay - cy) ** 2)  # Side opposite B
 
         return [c, a, b]  # Returns AB, then BC, then AC
 
+    def contains(self, check: Point, include_points_on_boundary: bool = True) -> bool:
+        """Checks if a given point is inside or on the boundary of the triangle.
+
+        Args:
+            check (Point): The point to check for containment.
+            include_points_on_boundary (bool): If True, points exactly on the
+                triangle's sides are considered inside. Defaults to True.
+
+        Returns:
+            bool: True if the point is contained within (or on) the triangle, False otherwise.
+        """
+        return self._contains_coordinates(check.x, check.y, include_points_on_boundary)
+
+    def contains_many(self, points: PointArray | Iterable[Point],
+                      include_points_on_boundary: bool = True) -> list[bool]:
+        """Checks which of many points are inside or on the boundary of the triangle.
+
+        Every side is turned into an orientation test relative to one of its corners,
+        positive on the inner side, so each point costs two multiplications per side and
+        no division.
+
+        Args:
+            points (PointArray | Iterable[Point]): The points to check for containment.
+            include_points_on_boundary (bool): If True, points exactly on the
+                triangle's sides are considered inside. Defaults to True.
+
+        Returns:
+            list[bool]: For every point, True if it is contained within (or on) the triangle.
+        """
+        points = PointArray.coerce(points)
+        sides = self._side_functions()
+        if sides is None:
+            return [self._contains_coordinates(x, y, include_points_on_boundary) for x, y in zip(points.x, points.y)]
+        (x1, y1, u1, v1), (x2, y2, u2, v2), (x3, y3, u3, v3) = sides
+        if include_points_on_boundary:
+            return [u1 * (y - y1) - v1 * (x - x1) >= 0 and u2 * (y - y2) - v2 * (x - x2) >= 0
+                    and u3 * (y - y3) - v3 * (x - x3) >= 0 for x, y in zip(points.x, points.y)]
+        return [u1 * (y - y1) - v1 * (x - x1) > 0 and u2 * (y - y2) - v2 * (x - x2) > 0
+                and u3 * (y - y3) - v3 * (x - x3) > 0 for x, y in zip(points.x, points.y)]
+
+    def _side_functions(self) -> tuple | None:
+        """Gets the side functions of the triangle, positive towards the opposite corner.
+
+        Returns:
+            tuple | None: Three (x1, y1, u, v) quadruples, see `basics._side_functions`,
+                or None if the corners are collinear.
+        """
+        return self._sides
+
+    @_derived
+    def _sides(self) -> tuple | None:
+        """Computes the side functions of the triangle, see `_side_functions`."""
+        return _side_functions([(self.A.x, self.A.y), (self.B.x, self.B.y), (self.C.x, self.C.y)])
+
+    def _contains_coordinates(self, x: float, y: float, include_points_on_boundary: bool) -> bool:
+        """Checks if the point at the given coordinates is contained in the triangle."""
+        sides = self._side_functions()
+        if sides is None:
+            # A flat triangle has no inside, only its sides
+            return include_points_on_boundary and self._on_flat_boundary(x, y)
+        if include_points_on_boundary:
+            return all(u * (y - y1) - v * (x - x1) >= 0 for x1, y1, u, v in sides)
+        return all(u * (y - y1) - v * (x - x1) > 0 for x1, y1, u, v in sides)
+
+    def _on_flat_boundary(self, x: float, y: float) -> bool:
+        """Checks if a point lies on a triangle whose corners are collinear."""
+        xs, ys = (self.A.x, self.B.x, self.C.x), (self.A.y, self.B.y, self.C.y)
+        if not (min(xs) <= x <= max(xs) and min(ys) <= y <= max(ys)):
+            return False
+        # Use the two corners farthest apart to span the flat triangle
+        ax, ay, bx, by = max(((xs[i], ys[i], xs[j], ys[j]) for i, j in ((0, 1), (1, 2), (0, 2))),
+                             key=lambda c: (c[2] - c[0]) ** 2 + (c[3] - c[1]) ** 2)
+        return (bx - ax) * (y - ay) - (by - ay) * (x - ax) == 0
+
     def get_points(self) -> list[str]:
         """Gets the formatted string representations of the triangle's corner points.
 
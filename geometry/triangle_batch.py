@@ -0,0 +1,144 @@
+# geometry/triangle_batch.py
+from __future__ import annotations
+from array import array
+from math import fsum, hypot
+from typing import Iterable
+
+from .basics import Areas
+from .triangle import Triangle
+
+
+class TriangleBatch:
+    """Stores many triangles as contiguous vertex coordinate columns.
+
+    Areas come from the cross product of two edge vectors (the shoelace formula), which
+    needs no square root and stays accurate for needle-shaped triangles.
+
+    Attributes:
+        ax, ay (array): The coordinates of the first corners.
+        bx, by (array): The coordinates of the second corners.
+        cx, cy (array): The coordinates of the third corners.
+    """
+
+    def __init__(self, ax: Iterable[float], ay: Iterable[float], bx: Iterable[float],
+                 by: Iterable[float], cx: Iterable[float], cy: Iterable[float]):
+        """Initializes a TriangleBatch from its six coordinate columns.
+
+        Args:
+            ax (Iterable[float]): The x-coordinates of the first corners.
+            ay (Iterable[float]): The y-coordinates of the first corners.
+            bx (Iterable[float]): The x-coordinates of the second corners.
+            by (Iterable[float]): The y-coordinates of the second corners.
+            cx (Iterable[float]): The x-coordinates of the third corners.
+            cy (Iterable[float]): The y-coordinates of the third corners.
+
+        Raises:
+            ValueError: If the columns don't all have the same length.
+        """
+        self.ax, self.ay = array('d', ax), array('d', ay)
+        self.bx, self.by = array('d', bx), array('d', by)
+        self.cx, self.cy = array('d', cx), array('d', cy)
+        if len({len(column) for column in self._columns()}) > 1:
+            raise ValueError("All coordinate columns must have the same length")
+
+    @classmethod
+    def from_vertices(cls, vertices: Iterable) -> TriangleBatch:
+        """Initializes a TriangleBatch from an (N, 3, 2) nested sequence of vertices.
+
+        Args:
+            vertices (Iterable): For every triangle, three (x, y) pairs.
+
+        Returns:
+            TriangleBatch: A new batch holding the triangles.
+        """
+        columns = ([], [], [], [], [], [])
+        for (ax, ay), (bx, by), (cx, cy) in vertices:
+            for column, value in zip(columns, (ax, ay, bx, by, cx, cy)):
+                column.append(value)
+        return cls(*columns)
+
+    @classmethod
+    def from_triangles(cls, triangles: Iterable[Triangle]) -> TriangleBatch:
+        """Initializes a TriangleBatch from Triangle objects.
+
+        Args:
+            triangles (Iterable[Triangle]): The triangles to copy.
+
+        Returns:
+            TriangleBatch: A new batch holding the corner coordinates of the triangles.
+        """
+        return cls.from_vertices(((T.A.x, T.A.y), (T.B.x, T.B.y), (T.C.x, T.C.y)) for T in triangles)
+
+    def _columns(self) -> tuple[array, ...]:
+        """Returns the six coordinate columns in (ax, ay, bx, by, cx, cy) order."""
+        return self.ax, self.ay, self.bx, self.by, self.cx, self.cy
+
+    def __len__(self) -> int:
+        """Returns the number of triangles in the batch.
+
+        Returns:
+            int: The number of triangles.
+        """
+        return len(self.ax)
+
+    def signed_areas(self) -> array:
+        """Calculates the signed area of every triangle.
+
+        Returns:
+            array: The areas as an `array('d')`, positive for counter-clockwise corners
+                and negative for clockwise corners.
+        """
+        return array('d', [((bx - ax) * (cy - ay) - (by - ay) * (cx - ax)) / 2
+                           for ax, ay, bx, by, cx, cy in zip(*self._columns())])
+
+    def areas(self) -> array:
+        """Calculates the area of every triangle with the shoelace formula.
+
+        Returns:
+            array: The areas, as an `array('d')`.
+        """
+        return array('d', map(abs, self.signed_areas()))
+
+    def side_lengths(self) -> tuple[array, array, array]:
+        """Calculates the side lengths of every triangle.
+
+        Uses the same order as `Triangle.get_side_lengths`.
+
+        Returns:
+            tuple[array, array, array]: The lengths of sides c (AB), a (BC) and b (AC).
+        """
+        ax, ay, bx, by, cx, cy = self._columns()
+        c = array('d', map(hypot, [x2 - x1 for x1, x2 in zip(ax, bx)], [y2 - y1 for y1, y2 in zip(ay, by)]))
+        a = array('d', map(hypot, [x2 - x1 for x1, x2 in zip(bx, cx)], [y2 - y1 for y1, y2 in zip(by, cy)]))
+        b = array('d', map(hypot, [x2 - x1 for x1, x2 in zip(ax, cx)], [y2 - y1 for y1, y2 in zip(ay, cy)]))
+        return c, a, b
+
+    def perimeters(self) -> array:
+        """Calculates the perimeter of every triangle.
+
+        Returns:
+            array: The perimeters, as an `array('d')`.
+        """
+        return array('d', map(fsum, zip(*self.side_lengths())))
+
+    def areas_and_perimeters(self) -> tuple[array, array]:
+        """Calculates the area and perimeter of every triangle.
+
+        Returns:
+            tuple[array, array]: The areas and the perimeters.
+        """
+        return self.areas(), self.perimeters()
+
+    @staticmethod
+    def areas_from_lengths(lengths: Iterable[Iterable[float]]) -> array:
+        """Calculates triangle areas from side lengths with Kahan's stable Heron formula.
+
+        This is the batch form of `Areas.Triangle.StableHeron`.
+
+        Args:
+            lengths (Iterable[Iterable[float]]): For every triangle, its three side lengths.
+
+        Returns:
+            array: The areas, as an `array('d')`.
+        """
+        return array('d', map(Areas.Triangle.StableHeron, lengths))
@@ -0,0 +1,120 @@
+# geometry/union.py
+from __future__ import annotations
+from math import acos, atan2, cos, fsum, hypot, pi, sin
+from typing import Iterable
+
+from .circle import Circle
+from .index import CircleIndex
+
+TAU = 2 * pi
+
+
+def _visible_circles(circles: list[Circle], xs: list[float], ys: list[float], rs: list[float],
+                     tol: float) -> list[int]:
+    """Drops the circles lying inside another circle, keeping one of several equal circles.
+
+    Returns:
+        list[int]: The positions of the remaining circles.
+    """
+    candidates = CircleIndex.build(circles)._rect_candidates
+
+    def contains(outer: int, inner: int) -> bool:
+        """Checks whether the circle at inner lies within the one at outer, up to the tolerance."""
+        return hypot(xs[inner] - xs[outer], ys[inner] - ys[outer]) + rs[inner] <= rs[outer] + tol
+
+    kept = []
+    for i in range(len(xs)):
+        x, y, r = xs[i], ys[i], rs[i]
+        for j in candidates(x - r, y - r, x + r, y + r):
+            # Of two circles containing each other, the one listed first is kept
+            if j != i and contains(j, i) and (j < i or not contains(i, j)):
+                break
+        else:
+            kept.append(i)
+    return kept
+
+
+def _covered_arcs(i: int, others: Iterable[int], xs: list[float], ys: list[float], rs: list[float],
+                  tol: float) -> list[tuple[float, float]]:
+    """Finds the angle intervals of the boundary of circle i lying inside other circles.
+
+    Returns:
+        list[tuple[float, float]]: The merged intervals within [0, 2*pi], sorted.
+    """
+    x, y, r = xs[i], ys[i], rs[i]
+    arcs = []
+    for j in others:
+        if j == i:
+            continue
+        dx, dy = xs[j] - x, ys[j] - y
+        d = hypot(dx, dy)
+        if d == 0 or d >= r + rs[j] - tol:
+            continue
+        cosine = (r * r + d * d - rs[j] ** 2) / (2 * r * d)
+        half = acos(max(-1.0, min(1.0, cosine)))
+        start = (atan2(dy, dx) - half) % TAU
+        end = start + 2 * half
+        if end > TAU:
+            arcs.append((start, TAU))
+            arcs.append((0.0, end - TAU))
+        else:
+            arcs.append((start, end))
+    arcs.sort()
+
+    merged = []
+    for start, end in arcs:
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _arc_integral(x: float, y: float, r: float, start: float, end: float) -> float:
+    """Integrates (x dy - y dx) / 2 along a counter-clockwise arc of a circle."""
+    return 0.5 * (r * r * (end - start) + r * x * (sin(end) - sin(start)) - r * y * (cos(end) - cos(start)))
+
+
+def union_area(circles: Iterable[Circle], tol: float = 1e-12) -> float:
+    """Calculates the area covered by the union of many circles.
+
+    Circles inside other circles are dropped first. By Green's theorem, the area of the
+    union is then the sum of (x dy - y dx) / 2 along the parts of each boundary not
+    covered by any other circle. Each circle is only compared with the circles sharing a
+    grid cell with it, so the work grows with the number of overlapping pairs instead of
+    with N^2. The result is exact up to floating-point rounding.
+
+    Args:
+        circles (Iterable[Circle]): The circles to unite.
+        tol (float): The distance under which circles count as touching rather than
+            overlapping, and a circle counts as contained in another. Defaults to 1e-12.
+
+    Returns:
+        float: The area of the union.
+
+    Raises:
+        ValueError: If tol is negative.
+    """
+    if tol < 0:
+        raise ValueError("tol can't be negative")
+    circles = [circle for circle in circles if circle.radius > 0]
+    xs = [circle.center.x for circle in circles]
+    ys = [circle.center.y for circle in circles]
+    rs = [circle.radius for circle in circles]
+    kept = _visible_circles(circles, xs, ys, rs, tol)
+    xs, ys, rs = [xs[i] for i in kept], [ys[i] for i in kept], [rs[i] for i in kept]
+    candidates = CircleIndex.build([circles[i] for i in kept])._rect_candidates
+
+    terms = []
+    for i in range(len(xs)):
+        x, y, r = xs[i], ys[i], rs[i]
+        covered = _covered_arcs(i, candidates(x - r, y - r, x + r, y + r), xs, ys, rs, tol)
+        previous = 0.0
+        for start, end in covered:
+            if start > previous:
+                terms.append(_arc_integral(x, y, r, previous, start))
+            previous = max(previous, end)
+        if previous < TAU:
+            terms.append(_arc_integral(x, y, r, previous, TAU))
+    return fsum(terms)
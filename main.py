@@ -2,7 +2,8 @@
 
 This script initializes various geometric shapes (Square, Triangle, Circle) and
 a Line, then prints out some of their properties and performs basic operations.
-It serves as an example of how to interact with the `geometry` package.
+It serves as an example of how to interact with the `geometry` package. To measure
+shapes from record files in bulk, use the command line pipeline, `python -m geometry`.
 """
 
 from geometry.basics import Point
@@ -0,0 +1,103 @@
+import copy
+import pickle
+from math import isclose
+
+from geometry.basics import Point, CompactPoint
+from geometry.polygon import Polygon
+from geometry.triangle import Triangle
+
+
+def test_cached_reads_are_plain_attribute_reads(monkeypatch):
+    triangle = Triangle(Point('A', 0, 0), Point('B', 4, 0), Point('C', 0, 3))
+    assert isclose(triangle.area, 6)
+    assert 'area' in vars(triangle)
+    calls = []
+    monkeypatch.setattr(Triangle, '_corners', lambda self: calls.append(1) or [])
+    for _ in range(100):
+        assert isclose(triangle.area, 6)
+    Point('E', 5, 5).x = 6
+    assert isclose(triangle.area, 6)
+    assert calls == []
+
+
+def test_moving_renaming_or_replacing_a_corner_updates_the_cache():
+    triangle = Triangle(Point('A', 0, 0), Point('B', 4, 0), Point('C', 0, 3))
+    assert isclose(triangle.area, 6)
+    triangle.B.x = 8
+    assert isclose(triangle.area, 12)
+    triangle.C = Point('C', 0, 6)
+    assert isclose(triangle.area, 24)
+    triangle.A.letter = 'Z'
+    assert triangle.points[0].startswith('Z(')
+
+
+def test_compact_point_corners_are_compared_on_every_read():
+    triangle = Triangle(CompactPoint('A', 0, 0), CompactPoint('B', 4, 0), CompactPoint('C', 0, 3))
+    assert isclose(triangle.area, 6)
+    triangle.A.x = -4
+    assert isclose(triangle.area, 12)
+
+
+def unit_square() -> Polygon:
+    return Polygon([Point('A', 0, 0), Point('B', 1, 0), Point('C', 1, 1), Point('D', 0, 1)])
+
+
+def test_cached_polygon_reads_skip_the_vertices(monkeypatch):
+    polygon = unit_square()
+    assert polygon.area == 1
+    calls = []
+    monkeypatch.setattr(Polygon, '_corners', lambda self: calls.append(1) or [])
+    for _ in range(100):
+        assert polygon.area == 1
+    assert calls == []
+
+
+def test_changing_the_vertex_list_updates_the_cache():
+    polygon = unit_square()
+    assert polygon.area == 1
+    polygon.vertices[2] = Point('C', 2, 2)
+    assert polygon.area == 2
+    polygon.vertices.append(Point('E', -1, 1))
+    assert polygon.area == 2.5
+    polygon.vertices = [Point('A', 0, 0), Point('B', 1, 0), Point('C', 0, 1)]
+    assert polygon.area == 0.5
+
+
+def test_replacing_a_corner_with_an_equal_compact_point_keeps_tracking_it():
+    triangle = Triangle(Point('A', 0, 0), Point('B', 4, 0), Point('C', 0, 3))
+    assert isclose(triangle.area, 6)
+    triangle.A = CompactPoint('A', 0, 0)
+    assert isclose(triangle.area, 6)
+    triangle.A.x = -4
+    assert isclose(triangle.area, 12)
+
+
+def test_copies_track_their_own_corners():
+    triangle = Triangle(Point('A', 0, 0), Point('B', 4, 0), Point('C', 0, 3))
+    assert isclose(triangle.area, 6)
+    for twin in (copy.deepcopy(triangle), pickle.loads(pickle.dumps(triangle))):
+        assert 'area' not in vars(twin)
+        assert isclose(twin.area, 6)
+        twin.B.x = 8
+        assert isclose(twin.area, 12)
+    assert isclose(triangle.area, 6)
+
+
+def test_points_forget_shapes_that_no_longer_exist():
+    A, B, C = Point('A', 0, 0), Point('B', 4, 0), Point('C', 0, 3)
+    for _ in range(1000):
+        assert isclose(Triangle(A, B, C).area, 6)
+    assert len(A._owners) < 16
+    A.x = 4
+    assert A._owners is None
+
+
+def test_changing_a_vertex_list_only_affects_its_polygon():
+    polygon, other = unit_square(), unit_square()
+    triangle = Triangle(*polygon.vertices[:3])
+    for shape in (polygon, other, triangle):
+        assert shape.area
+    polygon.vertices.append(Point('E', -1, 0.5))
+    assert 'signed_area' not in vars(polygon)
+    assert 'signed_area' in vars(other) and 'area' in vars(triangle)
+    assert polygon.area == 1.5
@@ -0,0 +1,23 @@
+import random
+
+from geometry.arrays import PointArray
+from geometry.basics import Point
+from geometry.circle import Circle
+
+
+def test_enclosing_circle_contains_every_point():
+    generator = random.Random(0)
+    for trial in range(200):
+        scale = 10.0 ** generator.randint(-6, 6)
+        points = [Point('P', generator.gauss(0, scale), generator.gauss(0, scale))
+                  for _ in range(generator.randint(1, 200))]
+        circle = Circle.enclosing(points, seed=trial)
+        assert all(circle.contains(point) for point in points)
+        assert all(circle.contains_many(points))
+
+
+def test_enclosing_circle_of_cocircular_points():
+    points = PointArray([1.0, -1.0, 0.0, 0.0, 0.6], [0.0, 0.0, 1.0, -1.0, 0.8])
+    circle = Circle.enclosing(points, seed=0)
+    assert abs(circle.radius - 1) <= 1e-12
+    assert all(circle.contains(points.point(i)) for i in range(len(points)))
@@ -0,0 +1,42 @@
+import random
+from math import pi
+
+from geometry.basics import Point
+from geometry.broadphase import BroadPhase
+from geometry.circle import Circle
+from geometry.index import CircleIndex
+from geometry.union import union_area
+
+
+def small_circles_and_a_huge_one(count: int, seed: int, huge: Circle) -> list[Circle]:
+    """Builds count circles of radius 0.5 over a 100 x 100 square, followed by a huge circle."""
+    generator = random.Random(seed)
+    circles = [Circle(Point('O', generator.uniform(0, 100), generator.uniform(0, 100)), 0.5) for _ in range(count)]
+    return circles + [huge]
+
+
+def test_huge_circle_is_kept_out_of_the_grid():
+    huge = Circle(Point('O', 3050, 50), 3000)
+    circles = small_circles_and_a_huge_one(10_000, 0, huge)
+    index = CircleIndex.build(circles)
+    assert index.cell_size == 1
+    # Registering the huge circle in each cell it covers would take 36 million cells
+    assert len(index._cells) < 20_000
+    assert index.query_point(Point('P', 5000, 50)) == [huge]
+    assert index.query_rect(4000, 0, 4001, 1) == [huge]
+    assert huge in index.query_point(circles[0].center)
+    index.remove(huge)
+    assert index.query_point(Point('P', 5000, 50)) == []
+
+
+def test_pairs_and_union_with_a_huge_circle():
+    huge = Circle(Point('O', 3050, 50), 3000)
+    circles = small_circles_and_a_huge_one(500, 1, huge)
+    broad = BroadPhase(circles)
+    assert broad.pairs() == broad.pairs_brute()
+    huge.center.x = -2950
+    assert broad.update() == 0
+    assert broad.pairs() == broad.pairs_brute()
+
+    covering = Circle(Point('O', 0, 0), 3000)
+    assert abs(union_area(small_circles_and_a_huge_one(10_000, 2, covering)) - pi * 3000 ** 2) <= 1e-6
@@ -0,0 +1,39 @@
+import random
+
+from geometry.arrays import PointArray
+from geometry.basics import Point
+from geometry.delaunay import triangulate
+from geometry.polygon import Polygon, convex_hull_indices
+
+
+def random_points(count: int, seed: int) -> PointArray:
+    """Builds points spread uniformly over the unit square."""
+    generator = random.Random(seed)
+    return PointArray([generator.random() for _ in range(count)], [generator.random() for _ in range(count)])
+
+
+def test_mesh_covers_the_convex_hull():
+    for count, seed in ((10, 0), (1_000, 1), (20_000, 2)):
+        points = random_points(count, seed)
+        mesh = triangulate(points)
+        hull = Polygon.convex_hull(points)
+        assert abs(mesh.area - hull.area) <= 1e-12
+        assert abs(mesh.perimeter - hull.perimeter) <= 1e-12
+
+
+def test_triangle_count_matches_the_hull_size():
+    for count, seed in ((10, 3), (1_000, 4), (20_000, 5)):
+        points = random_points(count, seed)
+        assert len(triangulate(points)) == 2 * count - len(convex_hull_indices(points)) - 2
+
+
+def test_grid_with_collinear_hull_points_and_duplicates():
+    points = [Point('P', x, y) for x in range(10) for y in range(10)] + [Point('P', 3, 3)]
+    mesh = triangulate(points)
+    # All 36 boundary points of the grid are on the hull, and the duplicate is used once
+    assert len(mesh) == 2 * 100 - 36 - 2
+    assert mesh.area == 81
+
+
+def test_collinear_points_have_no_triangles():
+    assert len(triangulate([Point('P', i, 2 * i) for i in range(5)])) == 0
@@ -0,0 +1,29 @@
+import random
+from math import cos, pi, sin
+
+from geometry.arrays import PointArray
+from geometry.basics import Point
+from geometry.detection import find_collinear
+
+
+def test_planted_lines_are_found_with_a_tight_tolerance():
+    generator = random.Random(1)
+    xs, ys, planted = [], [], []
+    for _ in range(300):
+        x, y, angle = generator.uniform(0, 100), generator.uniform(0, 100), generator.uniform(0, pi)
+        planted.append(frozenset(range(len(xs), len(xs) + 3)))
+        for t in generator.sample(range(-50, 50), 3):
+            xs.append(x + 0.3 * t * cos(angle))
+            ys.append(y + 0.3 * t * sin(angle))
+    points = PointArray(xs, ys)
+    positions = {(x, y): i for i, (x, y) in enumerate(zip(xs, ys))}
+    found = [frozenset(positions[(p.x, p.y)] for p in members)
+             for _, members in find_collinear(points, 3, 1e-12)]
+    assert all(any(line <= members for members in found) for line in planted)
+
+
+def test_lines_keep_their_points_in_input_order():
+    points = [Point('A', 0, 0), Point('B', 5, 1), Point('C', 2, 2), Point('D', 1, 1), Point('E', 3, 3)]
+    lines = find_collinear(points, 3)
+    assert len(lines) == 1
+    assert [point.letter for point in lines[0][1]] == ['A', 'C', 'D', 'E']
@@ -0,0 +1,42 @@
+import random
+
+from geometry.arrays import PointArray
+from geometry.basics import Point
+from geometry.circle import Circle
+from geometry.kdtree import KDTree
+
+
+def random_points(count: int, seed: int) -> list[Point]:
+    """Builds points on a coarse grid, so many of them tie on distance."""
+    generator = random.Random(seed)
+    return [Point('P', generator.randint(0, 20) / 2, generator.randint(0, 20) / 2) for _ in range(count)]
+
+
+def test_radius_queries_match_circle_contains():
+    points = random_points(2_000, 0)
+    tree = KDTree(points, leaf_size=8)
+    generator = random.Random(1)
+    for _ in range(200):
+        center = Point('O', generator.randint(0, 20) / 2, generator.randint(0, 20) / 2)
+        circle = Circle(center, generator.randint(1, 6) / 2)
+        for inclusive in (True, False):
+            expected = [P for P in points if circle.contains(P, inclusive)]
+            assert tree.query_radius(center, circle.radius, inclusive) == expected
+
+
+def test_nearest_neighbours_match_a_full_sort():
+    points = random_points(2_000, 2)
+    array = PointArray.from_points(points)
+    tree = KDTree(array)
+    generator = random.Random(3)
+    for _ in range(200):
+        x, y, k = generator.uniform(-2, 12), generator.uniform(-2, 12), generator.randint(1, 30)
+        by_distance = sorted(range(len(points)), key=lambda i: ((x - array.x[i]) ** 2 + (y - array.y[i]) ** 2, i))
+        assert [i for i, _ in tree.knn_indices(x, y, k)] == by_distance[:k]
+
+
+def test_empty_tree_finds_nothing():
+    tree = KDTree([])
+    assert len(tree) == 0
+    assert tree.query_radius(Point('O', 0, 0), 1) == []
+    assert tree.query_knn(Point('O', 0, 0), 3) == []
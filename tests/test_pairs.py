@@ -0,0 +1,31 @@
+import random
+
+import pytest
+
+from geometry.arrays import PointArray
+from geometry.basics import Point
+from geometry.pairs import closest_pair, closest_pair_brute, farthest_pair, farthest_pair_brute
+
+
+def test_pairs_match_brute_force():
+    for seed in range(30):
+        generator = random.Random(seed)
+        count = generator.randint(2, 300)
+        # Coarse coordinates give duplicates and collinear hull points
+        points = [Point('P', generator.randint(0, 15), generator.randint(0, 15)) for _ in range(count)]
+        assert closest_pair(points)[2] == closest_pair_brute(points)[2]
+        assert farthest_pair(points)[2] == farthest_pair_brute(points)[2]
+
+
+def test_pairs_return_the_given_points():
+    points = [Point('A', 0, 0), Point('B', 5, 0), Point('C', 5, 1), Point('D', -3, 4)]
+    A, B, distance = closest_pair(points)
+    assert {A.letter, B.letter} == {'B', 'C'} and distance == 1
+    A, B, _ = farthest_pair(PointArray.from_points(points))
+    assert {(A.x, A.y), (B.x, B.y)} == {(-3, 4), (5, 0)}
+
+
+def test_single_point_is_rejected():
+    for search in (closest_pair, farthest_pair):
+        with pytest.raises(ValueError):
+            search([Point('A', 0, 0)])
@@ -0,0 +1,42 @@
+import random
+
+import pytest
+
+from geometry.arrays import PointArray
+from geometry.basics import Point
+from geometry.circle import Circle
+from geometry.parallel import ParallelExecutor
+from geometry.triangle_batch import TriangleBatch
+
+
+def random_batch(count: int, seed: int) -> TriangleBatch:
+    generator = random.Random(seed)
+    return TriangleBatch(*([generator.uniform(-10, 10) for _ in range(count)] for _ in range(6)))
+
+
+def test_parallel_results_match_the_serial_ones():
+    batch = random_batch(1_000, 0)
+    generator = random.Random(1)
+    points = PointArray([generator.uniform(-5, 5) for _ in range(1_000)], [generator.uniform(-5, 5) for _ in range(1_000)])
+    circle = Circle(Point('O', 1, -1), 3)
+    # Above the serial threshold and with uneven chunks, so several workers share the input
+    with ParallelExecutor(processes=2, chunk_size=96, serial_threshold=100) as executor:
+        assert executor.triangle_areas(batch) == batch.areas()
+        assert executor.circle_contains(circle, points) == circle.contains_many(points)
+        assert executor.circle_contains(circle, points, False) == circle.contains_many(points, False)
+
+
+def test_small_inputs_stay_in_the_calling_process():
+    batch = random_batch(50, 2)
+    executor = ParallelExecutor(processes=2, serial_threshold=100)
+    assert executor.triangle_areas(batch) == batch.areas()
+    assert executor._pool is None
+
+
+def test_processes_and_chunk_size_must_be_positive():
+    for processes in (0, -1):
+        with pytest.raises(ValueError):
+            ParallelExecutor(processes=processes)
+    with pytest.raises(ValueError):
+        ParallelExecutor(chunk_size=0)
+    assert ParallelExecutor().processes >= 1
@@ -0,0 +1,46 @@
+import builtins
+import io
+
+import pytest
+
+from geometry import cli
+from geometry.pipeline import read_records
+
+
+def test_ndjson_record_without_values_names_its_index():
+    stream = io.StringIO('{"kind": "circle", "values": [0, 0, 1]}\n{"kind": "circle"}\n')
+    with pytest.raises(ValueError, match="Record 1"):
+        for _ in read_records(stream, 'ndjson'):
+            pass
+
+
+def test_ndjson_record_that_is_not_json_names_its_index():
+    stream = io.StringIO('{"kind": "circle", "values": [0, 0, 1]}\nnot json\n')
+    with pytest.raises(ValueError, match="Record 1"):
+        for _ in read_records(stream, 'ndjson'):
+            pass
+
+
+def test_record_with_a_value_that_is_not_a_number_names_its_index():
+    for stream, kind in ((io.StringIO('circle,0,0,1\ncircle,0,zero,1\n'), 'csv'),
+                         (io.StringIO('{"kind": "circle", "values": [0, 0, 1]}\n'
+                                      '{"kind": "circle", "values": [0, null, 1]}\n'), 'ndjson')):
+        with pytest.raises(ValueError, match="Record 1: values must be numbers"):
+            for _ in read_records(stream, kind):
+                pass
+
+
+def test_input_is_closed_when_the_output_cannot_be_opened(tmp_path, monkeypatch, capsys):
+    source = tmp_path / 'shapes.csv'
+    source.write_text('circle,0,0,1\n')
+    opened = []
+
+    def recording_open(*args, **kwargs):
+        stream = builtins.open(*args, **kwargs)
+        opened.append(stream)
+        return stream
+    monkeypatch.setattr(cli, 'open', recording_open, raising=False)
+
+    assert cli.main([str(source), '-o', str(tmp_path / 'missing' / 'out.csv')]) == 1
+    assert 'error:' in capsys.readouterr().err
+    assert len(opened) == 1 and opened[0].closed
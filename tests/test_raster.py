@@ -0,0 +1,45 @@
+import random
+
+from geometry.basics import Point
+from geometry.circle import Circle
+from geometry.raster import Rasterizer
+from geometry.square import Square
+from geometry.triangle import Triangle
+
+
+def random_shapes(count: int, seed: int) -> list:
+    generator = random.Random(seed)
+    shapes = []
+    for _ in range(count):
+        x, y = generator.uniform(-1, 11), generator.uniform(-1, 11)
+        shapes.append(Circle(Point('O', x, y), generator.uniform(0.1, 3)))
+        shapes.append(Triangle(*(Point(label, x + generator.uniform(-3, 3), y + generator.uniform(-3, 3))
+                                 for label in 'ABC')))
+    # A tilted square, which the rasterizer cuts like a triangle
+    shapes.append(Square(Point('A', 3, 3), Point('B', 5, 4), Point('C', 4, 6), Point('D', 2, 5)))
+    return shapes
+
+
+def test_render_matches_a_test_per_pixel_center():
+    shapes = random_shapes(40, 0)
+    generator = random.Random(1)
+    weights = [generator.randint(1, 5) for _ in shapes]
+    xmin, ymin, size, width, height = -0.37, -0.21, 0.13, 80, 90
+    rows = Rasterizer(xmin, ymin, size, width, height).render(shapes, weights)
+    peaks = Rasterizer(xmin, ymin, size, width, height, 'max').render(shapes, weights)
+    for j in range(height):
+        for i in range(width):
+            center = Point('P', xmin + (i + 0.5) * size, ymin + (j + 0.5) * size)
+            covering = [weight for shape, weight in zip(shapes, weights) if shape.contains(center)]
+            assert rows[j][i] == sum(covering)
+            assert peaks[j][i] == max(covering, default=0)
+
+
+def test_tiles_stitch_into_the_full_render():
+    shapes = random_shapes(20, 2)
+    rasterizer = Rasterizer(0, 0, 0.1, 100, 100, 'boolean')
+    stitched = []
+    for top, band in rasterizer.tiles(shapes, tile_rows=7):
+        assert top == len(stitched)
+        stitched.extend(band)
+    assert stitched == rasterizer.render(shapes)
@@ -0,0 +1,35 @@
+import pytest
+
+from geometry.basics import Point
+from geometry.square import Square
+
+
+def test_square_with_noisy_corners_is_accepted():
+    square = Square(Point('A', 0, 0), Point('B', 1, 1e-7), Point('C', 1, 1), Point('D', 0, 1), abs_tol=1e-6)
+    assert abs(square.area - 1) < 1e-6
+
+
+def test_rhombus_is_rejected():
+    with pytest.raises(Exception):
+        Square(Point('A', 0, 0), Point('B', 2, 1), Point('C', 4, 0), Point('D', 2, -1))
+    with pytest.raises(Exception):
+        Square(Point('A', 0, 0), Point('B', 1, 0), Point('C', 1.5, 3 ** 0.5 / 2), Point('D', 0.5, 3 ** 0.5 / 2))
+
+
+def test_corners_folded_onto_each_other_are_rejected():
+    P, Q = Point('P', 0, 0), Point('Q', 1, 0)
+    with pytest.raises(Exception):
+        Square(P, Q, P, Q)
+    A = Point('A', 2, 3)
+    with pytest.raises(Exception):
+        Square(A, A, A, A)
+
+
+def test_square_that_went_flat_contains_only_its_sides():
+    square = Square(Point('A', 0, 0), Point('B', 1, 0), Point('C', 1, 1), Point('D', 0, 1))
+    square.C.x, square.C.y = 0, 0
+    assert square.contains(Point('P', 0.5, 0))
+    assert square.contains(Point('P', 0, 0.5))
+    assert not square.contains(Point('P', 0.5, 0.5))
+    assert not square.contains(Point('P', 0.5, 0), include_points_on_boundary=False)
+    assert square.contains_many([Point('P', 0.5, 0), Point('P', 2, 0)]) == [True, False]
@@ -0,0 +1,59 @@
+import os
+
+import pytest
+
+from geometry.arrays import PointArray
+from geometry.basics import Point
+from geometry.circle import Circle
+from geometry.line import Line
+from geometry.storage import ShapeFile, write_shapes
+from geometry.triangle import Triangle
+
+
+def test_shapes_survive_a_round_trip(tmp_path):
+    path = str(tmp_path / 'shapes.bin')
+    points = PointArray([0.5, -2.0, 3.25], [1.0, 0.0, -7.5], ['A', 'Ä', '点'])
+    circle = Circle(Point('O', 1, 2), 3)
+    line = Line(3, -4, 12)
+    triangle = Triangle(Point('A', 0, 0), Point('B', 4, 0), Point('C', 0, 3))
+    write_shapes(path, points, [circle], [line], [triangle])
+    with ShapeFile(path) as shapes:
+        assert shapes.counts == {'points': 3, 'circles': 1, 'lines': 1, 'triangles': 1}
+        assert [point.format for point in shapes.shapes('points')] == ['A(0.5; 1.0)', 'Ä(-2.0; 0.0)', '点(3.25; -7.5)']
+        assert shapes.point_array().labels == ['A', 'Ä', '点']
+        assert (shapes.circle(0).center.x, shapes.circle(0).center.y, shapes.circle(0).radius) == (1, 2, 3)
+        assert (shapes.line(0).a, shapes.line(0).b, shapes.line(0).c) == (line.a, line.b, line.c)
+        assert shapes.triangle(0).area == 6
+        assert shapes.column('points', 'x') is shapes.column('points', 'x')
+        for i in (-1, 3):
+            with pytest.raises(IndexError):
+                shapes.label(i)
+            with pytest.raises(IndexError):
+                shapes.point(i)
+
+
+def test_file_without_shapes_round_trips(tmp_path):
+    path = str(tmp_path / 'empty.bin')
+    write_shapes(path)
+    with ShapeFile(path) as shapes:
+        assert len(shapes) == 0
+        assert len(shapes.column('triangles', 'cx')) == 0
+        assert len(shapes.point_array()) == 0
+        with pytest.raises(IndexError):
+            shapes.label(0)
+
+
+def test_empty_and_truncated_files_are_rejected(tmp_path):
+    empty = tmp_path / 'nothing.bin'
+    empty.write_bytes(b'')
+    with pytest.raises(ValueError, match="empty"):
+        ShapeFile(str(empty))
+
+    path = str(tmp_path / 'shapes.bin')
+    write_shapes(path, [Point('λ', 1, 2), Point('B', 3, 4)])
+    size = os.path.getsize(path)
+    for cut in (size - 1, 10):
+        with open(path, 'r+b') as stream:
+            stream.truncate(cut)
+        with pytest.raises(ValueError):
+            ShapeFile(path)
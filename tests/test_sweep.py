@@ -0,0 +1,51 @@
+import random
+
+import pytest
+
+from geometry.basics import Point
+from geometry.segment import Segment
+from geometry.sweep import find_intersections
+
+
+def grid_segments(count: int, seed: int, size: int, step: float) -> list[Segment]:
+    """Builds segments between random points of a size x size grid with the given spacing."""
+    generator = random.Random(seed)
+    segments = []
+    while len(segments) < count:
+        A = Point('A', generator.randint(0, size) * step, generator.randint(0, size) * step)
+        B = Point('B', generator.randint(0, size) * step, generator.randint(0, size) * step)
+        if (A.x, A.y) != (B.x, B.y):
+            segments.append(Segment(A, B))
+    return segments
+
+
+def pairs(segments: list[Segment], method: str) -> list[tuple[int, int]]:
+    return [(i, j) for i, j, _ in find_intersections(segments, method)]
+
+
+def test_sweep_matches_brute_force_on_an_integer_grid():
+    for seed in range(100):
+        segments = grid_segments(30, seed, 10, 1)
+        assert pairs(segments, 'sweep') == pairs(segments, 'brute')
+
+
+def test_sweep_matches_brute_force_on_a_decimal_grid():
+    # Multiples of 0.1 aren't exact, so endpoints on other segments miss them by rounding
+    for seed in range(100):
+        for size in (5, 10):
+            segments = grid_segments(30, seed, size, 0.1)
+            assert pairs(segments, 'sweep') == pairs(segments, 'brute')
+
+
+def test_disjoint_segments_on_one_rounded_line_do_not_meet():
+    first = Segment(Point('A', 0.4, 0.30000000000000004), Point('B', 0.5, 0.4))
+    second = Segment(Point('C', 0.1, 0.0), Point('D', 0.30000000000000004, 0.2))
+    assert find_intersections([first, second], 'brute') == []
+    assert first.intersection(second) is None
+
+
+def test_tolerance_must_be_positive():
+    segments = grid_segments(5, 0, 10, 1)
+    for method in ('sweep', 'brute'):
+        with pytest.raises(ValueError):
+            find_intersections(segments, method, tol=0)
@@ -0,0 +1,26 @@
+import pytest
+
+from geometry.basics import Point, FrozenPoint
+from geometry.transform import Affine
+from geometry.triangle import Triangle
+
+
+def test_frozen_points_are_rejected_before_anything_moves():
+    movable = Point('A', 1, 2)
+    triangle = Triangle(Point('B', 0, 0), FrozenPoint('C', 4, 0), Point('D', 0, 3))
+    with pytest.raises(TypeError):
+        Affine.translate(1, 1).apply([movable, triangle])
+    assert (movable.x, movable.y) == (1, 2)
+    assert (triangle.A.x, triangle.A.y) == (0, 0)
+
+    with pytest.raises(TypeError):
+        Affine.translate(1, 1).apply([movable, FrozenPoint('E', 0, 0)])
+    assert (movable.x, movable.y) == (1, 2)
+
+
+def test_shared_points_move_once():
+    shared = Point('A', 1, 1)
+    first = Triangle(shared, Point('B', 2, 1), Point('C', 1, 2))
+    second = Triangle(shared, Point('D', 0, 1), Point('E', 1, 0))
+    Affine.translate(3, -1).apply([first, second, shared])
+    assert (shared.x, shared.y) == (4, 0)
@@ -0,0 +1,30 @@
+import random
+
+from geometry.basics import Point
+from geometry.triangle import Triangle
+from geometry.triangle_batch import TriangleBatch
+
+
+def random_triangles(count: int, seed: int) -> list[Triangle]:
+    generator = random.Random(seed)
+    return [Triangle(*(Point(label, generator.uniform(-10, 10), generator.uniform(-10, 10)) for label in 'ABC'))
+            for _ in range(count)]
+
+
+def test_batch_matches_the_triangle_objects():
+    triangles = random_triangles(1_000, 0)
+    batch = TriangleBatch.from_triangles(triangles)
+    assert len(batch) == len(triangles)
+    areas, perimeters = batch.areas_and_perimeters()
+    for triangle, area, perimeter in zip(triangles, areas, perimeters):
+        assert abs(area - triangle.area) <= 1e-9 * max(1.0, triangle.area)
+        assert abs(perimeter - triangle.perimeter) <= 1e-9 * triangle.perimeter
+    assert list(batch.areas()) == list(map(abs, batch.signed_areas()))
+
+
+def test_heron_is_stable_on_needles():
+    # Side lengths where the naive Heron formula cancels badly
+    areas = TriangleBatch.areas_from_lengths([(3, 4, 5), (1e8, 1e8, 1e-8), (2, 1, 1)])
+    assert areas[0] == 6
+    assert abs(areas[1] - 0.5e0) <= 1e-12
+    assert areas[2] == 0
@@ -0,0 +1,69 @@
+import random
+
+from geometry.basics import Point
+from geometry.index import TriangleIndex
+from geometry.square import Square
+from geometry.triangle import Triangle
+
+
+def grid_mesh(size: int, step: float = 0.1) -> list[Triangle]:
+    """Builds a watertight mesh of two triangles per grid square."""
+    corners = [[Point('P', i * step, j * step) for j in range(size + 1)] for i in range(size + 1)]
+    triangles = []
+    for i in range(size):
+        for j in range(size):
+            a, b, c, d = corners[i][j], corners[i + 1][j], corners[i + 1][j + 1], corners[i][j + 1]
+            triangles.append(Triangle(a, b, c))
+            triangles.append(Triangle(a, c, d))
+    return triangles
+
+
+def test_points_on_shared_diagonals_are_found():
+    size, step = 30, 0.1
+    index = TriangleIndex.build(grid_mesh(size, step))
+    generator = random.Random(0)
+    points = []
+    for _ in range(20_000):
+        i, j, t = generator.randrange(size), generator.randrange(size), generator.random()
+        points.append(Point('Q', (i + t) * step, (j + t) * step))
+    assert -1 not in index.query_points(points)
+
+
+def test_every_point_inside_the_mesh_is_found():
+    size, step = 30, 0.1
+    triangles = grid_mesh(size, step)
+    index = TriangleIndex.build(triangles)
+    generator = random.Random(1)
+    points = [Point('Q', generator.uniform(0, size * step), generator.uniform(0, size * step))
+              for _ in range(20_000)]
+    found = index.query_points(points)
+    assert -1 not in found
+    assert all(triangles[slot].contains(P) for slot, P in zip(found, points))
+
+
+def test_square_halves_share_their_diagonal():
+    A, B, C, D = Point('A', 0.1, 0.3), Point('B', 0.7, 0.2), Point('C', 0.8, 0.8), Point('D', 0.2, 0.9)
+    first, second = Triangle(A, B, C), Triangle(A, C, D)
+    generator = random.Random(2)
+    for _ in range(5_000):
+        t = generator.random()
+        P = Point('P', A.x + t * (C.x - A.x), A.y + t * (C.y - A.y))
+        assert first.contains(P) or second.contains(P)
+
+
+def test_square_contains_points_on_its_sides():
+    square = Square(Point('A', 0, 0), Point('B', 0.3, 0.1), Point('C', 0.2, 0.4), Point('D', -0.1, 0.3))
+    assert square.contains(Point('P', 0.15, 0.05))
+    assert not square.contains(Point('P', 0.15, 0.05), include_points_on_boundary=False)
+    assert square.contains(Point('P', 0.1, 0.2), include_points_on_boundary=False)
+    assert not square.contains(Point('P', 0.4, 0.4))
+
+
+def test_huge_triangle_is_found_outside_the_mesh():
+    triangles = grid_mesh(30)
+    huge = Triangle(Point('A', 10, 0), Point('B', 1000, 0), Point('C', 10, 1000))
+    index = TriangleIndex.build(triangles + [huge])
+    assert len(index._cells) < 2_000
+    assert index.query_point(Point('Q', 500, 100)) == len(triangles)
+    assert index.query_point(Point('Q', 5, 5)) == -1
+    assert index.query_point(Point('Q', 0.15, 0.25)) != -1
@@ -0,0 +1,29 @@
+from math import acos, cos, pi, sin, sqrt
+
+import pytest
+
+from geometry.basics import Point
+from geometry.circle import Circle
+from geometry.union import union_area
+
+
+def lens_area(r: float, d: float) -> float:
+    """Calculates the overlap of two circles of radius r whose centers are d apart."""
+    return 2 * r * r * acos(d / (2 * r)) - d / 2 * sqrt(4 * r * r - d * d)
+
+
+def test_union_of_simple_layouts():
+    assert union_area([]) == 0
+    apart = [Circle(Point('O', 0, 0), 1), Circle(Point('O', 5, 0), 2)]
+    assert union_area(apart) == pytest.approx(5 * pi, rel=1e-12)
+    nested = [Circle(Point('O', 0, 0), 1), Circle(Point('O', 0.5, 0), 3), Circle(Point('O', 0.5, 0), 3)]
+    assert union_area(nested) == pytest.approx(9 * pi, rel=1e-12)
+    overlapping = [Circle(Point('O', 0, 0), 1), Circle(Point('O', 1, 0), 1)]
+    assert union_area(overlapping) == pytest.approx(2 * pi - lens_area(1, 1), rel=1e-12)
+
+
+def test_ring_of_circles_matches_inclusion_exclusion():
+    # Neighbours on a hexagon of side 1 overlap, others are sqrt(3) apart and don't
+    r = 0.6
+    ring = [Circle(Point('O', cos(k * pi / 3), sin(k * pi / 3)), r) for k in range(6)]
+    assert union_area(ring) == pytest.approx(6 * pi * r * r - 6 * lens_area(r, 1), rel=1e-12)